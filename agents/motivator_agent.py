@@ -4,16 +4,19 @@ from __future__ import annotations
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Protocol
+from typing import Callable, Iterator, Protocol, TypeVar
 
 try:  # pragma: no cover - optional dependency during tests
     from openai import OpenAI
 except ImportError:  # pragma: no cover
     OpenAI = None  # type: ignore[assignment]
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+
+from core.http import get_openai_client
 
 from .quote_store import Quote
 from .user_profile import UserProfile, UserProfileStore
@@ -23,6 +26,25 @@ try:
 except ImportError:
     WebSearchQuoteScraper = None  # type: ignore[assignment, misc]
 
+# Upper bound on personas scraped or written at the same time
+MAX_PERSONA_WORKERS = 4
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _fan_out(fn: Callable[[_T], _R], items: list[_T]) -> list[_R]:
+    """
+    Run ``fn`` on every item concurrently, keeping input order.
+
+    Each call is one blocking request over the shared HTTP/2 pool, so running
+    them side by side costs the slowest round-trip instead of the sum.
+    """
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(len(items), MAX_PERSONA_WORKERS)) as pool:
+        return list(pool.map(fn, items))
+
 
 class MotivationLLM(Protocol):
     """LLM used to compose personalized motivational messages."""
@@ -79,6 +101,72 @@ class MotivatorAgent:
         Returns:
             MotivationMessage with personalized content
         """
+        profile, persona, quote = self._primary_quote(user_id, scraper)
+
+        # Generate personalized message using LLM
+        if not self.llm:
+            raise RuntimeError("LLM is required for personalized message generation")
+
+        print("[motivator] Generating personalized message...")
+        text = self.llm.generate(
+            persona=persona,
+            quote=quote,
+            profile=profile,
+        )
+
+        # Create the message
+        message = MotivationMessage(
+            text=text,
+            source=str(quote.source_url) if quote.source_url else "web_search",
+            persona_style=persona,
+            user_name=profile.name,
+        )
+
+        # Update profile
+        if self.profile_store:
+            profile.last_motivation_at = message.timestamp
+            self.profile_store.save(profile)
+
+        return message
+
+    def craft_message_stream(
+        self,
+        user_id: str,
+        scraper: WebSearchQuoteScraper | None = None,
+    ) -> Iterator[str]:
+        """
+        Same as ``craft_personalized_message`` but yields the text as it's generated.
+
+        LLMs without a ``stream`` method yield their whole message at once. The
+        profile's ``last_motivation_at`` is updated once the message is complete.
+
+        Args:
+            user_id: User identifier
+            scraper: Optional quote scraper (creates default if None)
+
+        Yields:
+            Fragments of the motivational message
+        """
+        profile, persona, quote = self._primary_quote(user_id, scraper)
+        if not self.llm:
+            raise RuntimeError("LLM is required for personalized message generation")
+
+        stream = getattr(self.llm, "stream", None)
+        if stream is not None:
+            yield from stream(persona=persona, quote=quote, profile=profile)
+        else:
+            yield self.llm.generate(persona=persona, quote=quote, profile=profile)
+
+        if self.profile_store:
+            profile.last_motivation_at = datetime.utcnow()
+            self.profile_store.save(profile)
+
+    def _primary_quote(
+        self,
+        user_id: str,
+        scraper: WebSearchQuoteScraper | None,
+    ) -> tuple[UserProfile, str, Quote]:
+        """Load the user's profile and scrape a quote from their primary persona."""
         # Load user profile
         profile = self._load_profile(user_id) if self.profile_store else None
 
@@ -105,32 +193,90 @@ class MotivatorAgent:
         # Select first quote
         quote = quotes[0]
         print(f"[motivator] Selected quote: {quote.text[:50]}...")
+        return profile, persona, quote
 
-        # Generate personalized message using LLM
+    def craft_messages_from_user_personas(
+        self,
+        user_id: str,
+        scraper: WebSearchQuoteScraper | None = None,
+    ) -> list[MotivationMessage]:
+        """
+        Create one personalized message per persona in the user's profile.
+
+        Args:
+            user_id: User identifier
+            scraper: Optional quote scraper (creates default if None)
+
+        Returns:
+            MotivationMessage per persona that has quotes, in ``get_personas()`` order
+        """
+        return self.craft_messages_batch(user_id, scraper=scraper)
+
+    def craft_messages_batch(
+        self,
+        user_id: str,
+        personas: list[str] | None = None,
+        scraper: WebSearchQuoteScraper | None = None,
+    ) -> list[MotivationMessage]:
+        """
+        Create one personalized message for each of the given personas.
+
+        Quotes are scraped concurrently. When the LLM supports ``generate_many``
+        all messages are written in a single request; otherwise the per-persona
+        ``generate`` calls run concurrently.
+
+        Args:
+            user_id: User identifier
+            personas: Personas to write as (defaults to the profile's ``get_personas()``)
+            scraper: Optional quote scraper (creates default if None)
+
+        Returns:
+            MotivationMessage per persona that has quotes, in ``personas`` order
+        """
+        profile = self._load_profile(user_id) if self.profile_store else None
+        if not profile:
+            raise ValueError(f"No profile found for user_id: {user_id}")
         if not self.llm:
             raise RuntimeError("LLM is required for personalized message generation")
 
-        print("[motivator] Generating personalized message...")
-        text = self.llm.generate(
-            persona=persona,
-            quote=quote,
-            profile=profile,
-        )
+        if scraper is None:
+            if WebSearchQuoteScraper is None:
+                raise ImportError(
+                    "WebSearchQuoteScraper is not available. Ensure quote_scraper.py is imported correctly."
+                )
+            scraper = WebSearchQuoteScraper()
 
-        # Create the message
-        message = MotivationMessage(
-            text=text,
-            source=str(quote.source_url) if quote.source_url else "web_search",
-            persona_style=persona,
-            user_name=profile.name,
-        )
+        if personas is None:
+            personas = profile.get_personas()
+        results = _fan_out(lambda persona: scraper.scrape_quotes(persona, limit=3), personas)
+        quotes: dict[str, Quote] = {persona: scraped[0] for persona, scraped in zip(personas, results) if scraped}
+        if not quotes:
+            raise RuntimeError(f"No quotes found for personas: {', '.join(personas)}")
+
+        generate_many = getattr(self.llm, "generate_many", None)
+        if generate_many is not None:
+            texts = generate_many(quotes=quotes, profile=profile)
+        else:
+            texts = _fan_out(
+                lambda item: self.llm.generate(persona=item[0], quote=item[1], profile=profile),
+                list(quotes.items()),
+            )
+
+        messages = [
+            MotivationMessage(
+                text=text,
+                source=str(quote.source_url) if quote.source_url else "web_search",
+                persona_style=persona,
+                user_name=profile.name,
+            )
+            for (persona, quote), text in zip(quotes.items(), texts)
+        ]
 
-        # Update profile
         if self.profile_store:
-            profile.last_motivation_at = message.timestamp
+            profile.last_motivation_at = messages[-1].timestamp
             self.profile_store.save(profile)
 
-        return message
+        return messages
 
     def _load_profile(self, user_id: str) -> UserProfile:
         """Load or create user profile."""
@@ -143,6 +289,12 @@ class MotivatorAgent:
             return profile
 
 
+class MotivationBatch(BaseModel):
+    """Structured reply holding one motivational message per persona."""
+
+    messages: list[str]
+
+
 class OpenAIMotivationModel:
     """LLM wrapper that composes motivational messages via OpenAI."""
 
@@ -163,6 +315,13 @@ class OpenAIMotivationModel:
         "You only have one life and you must grasp it and find that job. The key to success is taking action today.\n\n"
         "Never add extra commentary. Avoid emojis. Stay authentic to the persona's tone and speaking style."
     )
+    BULK_INSTRUCTIONS = (
+        "You will receive several personas, each with a quote. Write one message per persona, "
+        "following the structure above in that persona's voice. Reply with a JSON object of the form "
+        '{"messages": [...]} holding the messages in the order the personas were given.'
+    )
+    # Prompts estimated above this many tokens are split into one request per persona
+    BULK_PROMPT_TOKEN_BUDGET = 6000
 
     def __init__(
         self,
@@ -178,7 +337,7 @@ class OpenAIMotivationModel:
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
 
-        self._client = OpenAI(api_key=api_key)
+        self._client = get_openai_client(api_key)
         self.model = model
         self.temperature = temperature
 
@@ -190,6 +349,37 @@ class OpenAIMotivationModel:
         profile: UserProfile,
     ) -> str:
         """Generate personalized motivational message using the quote and user profile."""
+        response = self._client.chat.completions.create(
+            model=self.model,
+            messages=self._messages(persona=persona, quote=quote, profile=profile),
+            temperature=self.temperature,
+        )
+
+        message = response.choices[0].message.content
+        if not message:
+            raise RuntimeError("OpenAI returned an empty message.")
+        return message
+
+    def stream(
+        self,
+        *,
+        persona: str,
+        quote: Quote,
+        profile: UserProfile,
+    ) -> Iterator[str]:
+        """Like ``generate``, but yield the message in fragments as OpenAI sends them."""
+        response = self._client.chat.completions.create(
+            model=self.model,
+            messages=self._messages(persona=persona, quote=quote, profile=profile),
+            temperature=self.temperature,
+            stream=True,
+        )
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _messages(self, *, persona: str, quote: Quote, profile: UserProfile) -> list[dict[str, str]]:
+        """Build the chat messages for one persona."""
         payload = {
             "persona": persona,
             "quote": quote.model_dump(mode="json", exclude_none=True),
@@ -206,14 +396,57 @@ class OpenAIMotivationModel:
                 ),
             },
         ]
+        return messages
 
-        response = self._client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=self.temperature,
-        )
+    def generate_many(self, *, quotes: dict[str, Quote], profile: UserProfile) -> list[str]:
+        """
+        Generate a message for every persona with a single JSON-mode request.
 
-        message = response.choices[0].message.content
-        if not message:
-            raise RuntimeError("OpenAI returned an empty message.")
-        return message
+        Falls back to one ``generate`` call per persona when the prompt is over
+        ``BULK_PROMPT_TOKEN_BUDGET`` or the reply doesn't hold one message per persona.
+
+        Args:
+            quotes: Quote to build on, keyed by persona
+            profile: User profile to personalize for
+
+        Returns:
+            One message per persona, in ``quotes`` order
+        """
+        payload = {
+            "personas": [
+                {"persona": persona, "quote": quote.model_dump(mode="json", exclude_none=True)}
+                for persona, quote in quotes.items()
+            ],
+            "user_profile": profile.model_dump(mode="json", exclude_none=True),
+        }
+        messages = [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "system", "content": self.BULK_INSTRUCTIONS},
+            {
+                "role": "user",
+                "content": (
+                    "Compose the motivation for each persona in the following context:\n"
+                    f"{json.dumps(payload, indent=2, ensure_ascii=False)}"
+                ),
+            },
+        ]
+
+        prompt_tokens = sum(len(m["content"]) for m in messages) // 4
+        if len(quotes) > 1 and prompt_tokens <= self.BULK_PROMPT_TOKEN_BUDGET:
+            response = self._client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                response_format={"type": "json_object"},
+            )
+            try:
+                batch = MotivationBatch.model_validate_json(response.choices[0].message.content or "")
+            except ValidationError:
+                batch = None
+            if batch is not None and len(batch.messages) == len(quotes):
+                return batch.messages
+
+        return _fan_out(
+            lambda item: self.generate(persona=item[0], quote=item[1], profile=profile),
+            list(quotes.items()),
+        )
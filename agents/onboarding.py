@@ -203,21 +203,19 @@ class OnboardingAgent:
                 print("Please enter at least one persona name.\n")
                 continue
 
-            # Parse comma-separated personas
-            personas = [p.strip() for p in custom_input.split(",") if p.strip()]
-
-            if not personas:
+            # Parse comma-separated personas, dropping blanks and case-insensitive
+            # duplicates in one pass while keeping first-seen order
+            by_key: dict[str, str] = {}
+            for part in custom_input.split(","):
+                persona = part.strip()
+                if persona:
+                    by_key.setdefault(persona.lower(), persona)
+            unique_personas = list(by_key.values())
+
+            if not unique_personas:
                 print("Please enter at least one valid persona name.\n")
                 continue
 
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_personas = []
-            for persona in personas:
-                if persona.lower() not in seen:
-                    seen.add(persona.lower())
-                    unique_personas.append(persona)
-
             primary = unique_personas[0]
 
             print(f"\nCustom persona(s) created: {', '.join(unique_personas)}")
@@ -339,7 +337,8 @@ class OnboardingAgent:
         selected_traits = []
         try:
             indices = [int(x.strip()) - 1 for x in selection.split(",")]
-            for idx in indices:
+            # "1,1,3" selects each challenge once
+            for idx in dict.fromkeys(indices):
                 if 0 <= idx < len(self.PAIN_POINTS):
                     selected_traits.append(self.PAIN_POINTS[idx])
 
@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import re
+import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Protocol
 
+import httpx
+from pydantic import ValidationError
+
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 except ImportError:
-    OpenAI = None  # type: ignore[assignment]
+    AsyncOpenAI = OpenAI = None  # type: ignore[assignment, misc]
+
+from core.http import HTTP2_ENABLED, get_openai_client
+from core.response_cache import prompt_key
+
+from .quote_store import QUOTES_ADAPTER, Quote
 
-from .quote_store import Quote
+# Markdown code fences the LLM sometimes wraps around its JSON
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*")
+_FENCE_CLOSE_RE = re.compile(r"\s*```$")
+
+QUOTE_CACHE_DIR = Path("data/quote_cache")
+QUOTE_CACHE_TTL = 24 * 3600.0
 
 
 class QuoteScraper(Protocol):
@@ -37,6 +53,8 @@ class WebSearchQuoteScraper:
         self,
         model: str = "gpt-4o-mini",
         temperature: float = 0.3,
+        cache_dir: Path | None = QUOTE_CACHE_DIR,
+        cache_ttl: float = QUOTE_CACHE_TTL,
     ) -> None:
         if OpenAI is None:
             raise ImportError(
@@ -47,13 +65,38 @@ class WebSearchQuoteScraper:
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
 
-        self._client = OpenAI(api_key=api_key)
+        self._api_key = api_key
+        self._client = get_openai_client(api_key)
         self.model = model
         self.temperature = temperature
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+
+    def _cache_path(self, persona: str, limit: int) -> Path | None:
+        """Return the on-disk cache file for a request, or None when caching is off."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{prompt_key(self.model, persona.strip().lower(), str(limit))}.json"
+
+    def _read_cache(self, path: Path | None) -> list[Quote] | None:
+        """Return the cached quotes at ``path`` if they're fresh, else None."""
+        if path is not None and path.exists() and time.time() - path.stat().st_mtime < self.cache_ttl:
+            try:
+                return QUOTES_ADAPTER.validate_json(path.read_bytes())
+            except ValidationError:
+                pass  # Corrupt cache file; scrape again and overwrite it
+        return None
+
+    def _write_cache(self, path: Path | None, quotes: list[Quote]) -> None:
+        """Store scraped quotes at ``path``."""
+        # Failed scrapes return [], which shouldn't pin the persona to no quotes for a day
+        if path is not None and quotes:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(QUOTES_ADAPTER.dump_json(quotes))
 
     def scrape_quotes(self, persona: str, limit: int = 5) -> list[Quote]:
         """
-        Use LLM to generate a list of well-known inspirational quotes from the persona.
+        Return quotes for the persona, reusing results scraped within ``cache_ttl``.
 
         Args:
             persona: Name of the person to fetch quotes from
@@ -62,6 +105,15 @@ class WebSearchQuoteScraper:
         Returns:
             List of Quote objects
         """
+        path = self._cache_path(persona, limit)
+        quotes = self._read_cache(path)
+        if quotes is None:
+            quotes = self._request_quotes(persona, limit)
+            self._write_cache(path, quotes)
+        return quotes
+
+    def _build_messages(self, persona: str, limit: int) -> list[dict[str, str]]:
+        """Build the chat messages asking for ``limit`` quotes from the persona."""
         system_prompt = (
             "You are a quote researcher. Your task is to provide accurate, "
             "well-known inspirational quotes from famous figures (without changing them). "
@@ -93,49 +145,134 @@ IMPORTANT:
 - Tags should be from: focus, perseverance, self-belief, rest, discipline, learning
 - Each quote should have 1-3 tags"""
 
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    @staticmethod
+    def _parse_quotes(content: str | None, limit: int) -> list[Quote]:
+        """
+        Turn the LLM's reply into Quote objects.
+
+        Args:
+            content: Raw reply text
+            limit: Maximum number of quotes to return
+
+        Returns:
+            List of Quote objects (empty if the reply couldn't be parsed)
+        """
+        if not content:
+            print("[quote_scraper] Error scraping quotes: OpenAI returned empty content")
+            return []
+
+        # Clean up the response - remove markdown code blocks if present
+        content = content.strip()
+        content = _FENCE_OPEN_RE.sub("", content)
+        content = _FENCE_CLOSE_RE.sub("", content)
+
+        try:
+            # Parse and validate the whole array in one pass, straight to Quote objects
+            return QUOTES_ADAPTER.validate_json(content)[:limit]
+        except ValidationError as e:
+            print(f"[quote_scraper] Failed to parse JSON response: {e}")
+            print(f"[quote_scraper] Raw content: {content}")
+            return []
+
+    def _request_quotes(self, persona: str, limit: int) -> list[Quote]:
+        """
+        Use LLM to generate a list of well-known inspirational quotes from the persona.
+
+        Args:
+            persona: Name of the person to fetch quotes from
+            limit: Maximum number of quotes to return
+
+        Returns:
+            List of Quote objects
+        """
         try:
             response = self._client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
+                messages=self._build_messages(persona, limit),
                 temperature=self.temperature,
             )
-
-            content = response.choices[0].message.content
-            if not content:
-                raise RuntimeError("OpenAI returned empty content")
-
-            # Clean up the response - remove markdown code blocks if present
-            content = content.strip()
-            content = re.sub(r"^```json\s*", "", content)
-            content = re.sub(r"^```\s*", "", content)
-            content = re.sub(r"\s*```$", "", content)
-
-            # Parse JSON
-            quotes_data = json.loads(content)
-
-            # Convert to Quote objects
-            quotes = []
-            for q_data in quotes_data:
-                quote = Quote(
-                    text=q_data["text"],
-                    persona=q_data["persona"],
-                    tags=q_data.get("tags", []),
-                    source_url=q_data.get("source_url"),
-                )
-                quotes.append(quote)
-
-            return quotes[:limit]
-
-        except json.JSONDecodeError as e:
-            print(f"[quote_scraper] Failed to parse JSON response: {e}")
-            print(f"[quote_scraper] Raw content: {content}")
+        except Exception as e:
+            print(f"[quote_scraper] Error scraping quotes: {e}")
             return []
+        return self._parse_quotes(response.choices[0].message.content, limit)
+
+    def _async_client(self) -> AsyncOpenAI:
+        """Open an async OpenAI client; use it with ``async with`` so its connections are closed."""
+        http_client = httpx.AsyncClient(
+            http2=HTTP2_ENABLED,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=16),
+        )
+        return AsyncOpenAI(api_key=self._api_key, http_client=http_client)
+
+    async def ascrape_quotes(self, persona: str, limit: int = 5, client: AsyncOpenAI | None = None) -> list[Quote]:
+        """
+        Async version of ``scrape_quotes``, sharing the same disk cache.
+
+        Args:
+            persona: Name of the person to fetch quotes from
+            limit: Maximum number of quotes to return
+            client: Async OpenAI client to reuse (a temporary one is opened if None)
+
+        Returns:
+            List of Quote objects
+        """
+        path = self._cache_path(persona, limit)
+        quotes = self._read_cache(path)
+        if quotes is not None:
+            return quotes
+
+        if client is None:
+            async with self._async_client() as client:
+                return await self.ascrape_quotes(persona, limit, client)
+
+        try:
+            response = await client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(persona, limit),
+                temperature=self.temperature,
+            )
         except Exception as e:
             print(f"[quote_scraper] Error scraping quotes: {e}")
             return []
+        quotes = self._parse_quotes(response.choices[0].message.content, limit)
+        self._write_cache(path, quotes)
+        return quotes
+
+    async def ascrape_personas(
+        self,
+        personas: list[str],
+        limit: int = 5,
+        max_concurrency: int = 4,
+    ) -> dict[str, list[Quote]]:
+        """
+        Scrape several personas concurrently over one async connection pool.
+
+        Each persona is an independent request, so the wall-clock time is
+        roughly that of the slowest one instead of the sum of all of them.
+
+        Args:
+            personas: Names of the people to fetch quotes from
+            limit: Maximum number of quotes per persona
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Quotes per persona, in the order the personas were given
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with self._async_client() as client:
+
+            async def scrape(persona: str) -> list[Quote]:
+                async with semaphore:
+                    return await self.ascrape_quotes(persona, limit, client)
+
+            results = await asyncio.gather(*(scrape(persona) for persona in personas))
+        return dict(zip(personas, results))
 
 
 class PersonalizedQuoteGenerator:
@@ -173,7 +310,7 @@ class PersonalizedQuoteGenerator:
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
 
-        self._client = OpenAI(api_key=api_key)
+        self._client = get_openai_client(api_key)
         self.model = model
         self.temperature = temperature
 
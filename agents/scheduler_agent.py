@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
 import logging
 import os
 import re
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
@@ -18,9 +20,19 @@ try:  # pragma: no cover - import guard for environments without OpenAI installe
 except ImportError:  # pragma: no cover
     OpenAI = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 class ConversationModel(Protocol):
-    """Minimal LLM interface used by the scheduler agent."""
+    """
+    Minimal LLM interface used by the scheduler agent.
+
+    A model may also expose ``generate_dict(prompt) -> dict``; the agent then
+    uses the already-decoded reply instead of parsing ``generate``'s JSON.
+    """
 
     def generate(self, prompt: str) -> str: ...
 
@@ -29,9 +41,73 @@ DEFAULT_POMODORO_MINUTES = 25
 DEFAULT_BREAK_MINUTES = 5
 DEFAULT_START_TIME = "09:00"
 
+# Heuristic parser patterns, compiled once at import
+_TIME_RANGE_RE = re.compile(
+    r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*(?:-|to)\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?",
+    re.IGNORECASE,
+)
+_SINGLE_TIME_RE = re.compile(r"\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\b", re.IGNORECASE)
+_SUBJECT_MARKER_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"focus on\s+([^.]+)",
+        r"study\s+([^.]+)",
+        r"studying\s+([^.]+)",
+        r"work on\s+([^.]+)",
+        r"review\s+([^.]+)",
+        r"subjects?\s*:\s*([^.]+)",
+        r"topics?\s*:\s*([^.]+)",
+    )
+)
+_SUBJECT_SPLIT_RE = re.compile(r",|/|\band\b|\bthen\b|&", re.IGNORECASE)
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _subjects_from_text(text: str) -> tuple[str, ...]:
+    """Run the subject marker patterns over a note, memoized for repeated notes."""
+    chunks: list[str] = []
+    for pattern in _SUBJECT_MARKER_RES:
+        match = pattern.search(text)
+        if match:
+            chunks.append(match.group(1))
+
+    subjects: list[str] = []
+    seen: set[str] = set()
+    for chunk in chunks:
+        parts = _SUBJECT_SPLIT_RE.split(chunk)
+        for part in parts:
+            subject = part.strip(" .")
+            if not subject:
+                continue
+            key = subject.lower()
+            if key not in seen:
+                seen.add(key)
+                subjects.append(subject)
+    return tuple(subjects)
+
+
+@functools.lru_cache(maxsize=4)
+def _preferences_prompt_header(today: date) -> str:
+    """Build the date-dependent part of the preferences prompt, once per day."""
+    return (
+        "You are Study Pal's scheduling assistant.\n"
+        "Extract the user's study availability and subjects from the note below and respond ONLY with JSON.\n"
+        "Required keys: start_time (HH:MM 24-hour), end_time (HH:MM 24-hour), subjects (array of strings).\n"
+        "Required keys (ALWAYS include):\n"
+        "  - date (YYYY-MM-DD format): The specific date for the session. You MUST calculate and include this.\n"
+        "    * If user says 'today' → use today's date\n"
+        "    * If user says 'tomorrow' → use tomorrow's date\n"
+        f"    * If user says a day of week (e.g. 'Tuesday') → calculate the NEXT occurrence from today ({today.strftime('%A, %Y-%m-%d')})\n"
+        "    * If no day specified → default to today's date\n"
+        "Optional keys:\n"
+        "  - notes (string): Any assumptions or clarifications.\n"
+        f"IMPORTANT: Today is {today.strftime('%A, %B %d, %Y')} ({today.strftime('%Y-%m-%d')}). "
+        f"Current day of week: {today.strftime('%A')}.\n"
+    )
+
+
 @dataclass
 class SchedulerAgent:
     """Collects user study preferences and produces a Pomodoro schedule."""
@@ -227,29 +303,17 @@ class SchedulerAgent:
         llm: ConversationModel | None,
         context: dict | None,
     ) -> dict:
-        current_date = datetime.now()
-        prompt = (
-            "You are Study Pal's scheduling assistant.\n"
-            "Extract the user's study availability and subjects from the note below and respond ONLY with JSON.\n"
-            "Required keys: start_time (HH:MM 24-hour), end_time (HH:MM 24-hour), subjects (array of strings).\n"
-            "Required keys (ALWAYS include):\n"
-            "  - date (YYYY-MM-DD format): The specific date for the session. You MUST calculate and include this.\n"
-            "    * If user says 'today' → use today's date\n"
-            "    * If user says 'tomorrow' → use tomorrow's date\n"
-            f"    * If user says a day of week (e.g. 'Tuesday') → calculate the NEXT occurrence from today ({current_date.strftime('%A, %Y-%m-%d')})\n"
-            "    * If no day specified → default to today's date\n"
-            "Optional keys:\n"
-            "  - notes (string): Any assumptions or clarifications.\n"
-            f"IMPORTANT: Today is {current_date.strftime('%A, %B %d, %Y')} ({current_date.strftime('%Y-%m-%d')}). "
-            f"Current day of week: {current_date.strftime('%A')}.\n"
-            f"USER_NOTE: {user_input}\n"
-        )
         if llm is None:
             preferences = self._heuristic_preferences(user_input, context)
         else:
+            prompt = _preferences_prompt_header(date.today()) + f"USER_NOTE: {user_input}\n"
             try:
-                raw_response = llm.generate(prompt)
-                preferences = self._parse_preferences(raw_response)
+                generate_dict = getattr(llm, "generate_dict", None)
+                if generate_dict is not None:
+                    # Copy, since notes are filled in below and the reply may be shared
+                    preferences = self._validate_preferences(dict(generate_dict(prompt)))
+                else:
+                    preferences = self._parse_preferences(llm.generate(prompt))
             except Exception as exc:  # pragma: no cover - runtime fallback
                 logger.warning(
                     "Scheduler LLM response failed (%s). Using heuristic fallback.",
@@ -261,10 +325,13 @@ class SchedulerAgent:
 
     def _parse_preferences(self, raw: str) -> dict:
         try:
-            parsed = json.loads(raw)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            parsed = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except json.JSONDecodeError as exc:
             raise ValueError("Scheduler LLM must return valid JSON.") from exc
+        return self._validate_preferences(parsed)
 
+    def _validate_preferences(self, parsed: dict) -> dict:
         required = {"start_time", "end_time", "subjects"}
         missing = [key for key in required if key not in parsed]
         if missing:
@@ -511,18 +578,14 @@ class SchedulerAgent:
         return None
 
     def _extract_time_range(self, text: str) -> tuple[str | None, str | None]:
-        range_pattern = re.compile(
-            r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*(?:-|to)\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?",
-            re.IGNORECASE,
-        )
-        match = range_pattern.search(text)
+        match = _TIME_RANGE_RE.search(text)
         if match:
             start = self._format_time(match.group(1), match.group(2), match.group(3), match.group(6))
             end = self._format_time(match.group(4), match.group(5), match.group(6), match.group(3))
             return start, end
 
-        single_pattern = re.compile(r"\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\b", re.IGNORECASE)
-        times = single_pattern.findall(text)
+        # Only the first two times matter, so stop scanning once they are found
+        times = [m.groups() for m in itertools.islice(_SINGLE_TIME_RE.finditer(text), 2)]
         if len(times) >= 2:
             start = self._format_time(*times[0])
             end = self._format_time(*times[1])
@@ -560,34 +623,8 @@ class SchedulerAgent:
         return hour * 60 + minute
 
     def _extract_subjects(self, text: str) -> list[str]:
-        chunks: list[str] = []
-        markers = [
-            r"focus on\s+([^.]+)",
-            r"study\s+([^.]+)",
-            r"studying\s+([^.]+)",
-            r"work on\s+([^.]+)",
-            r"review\s+([^.]+)",
-            r"subjects?\s*:\s*([^.]+)",
-            r"topics?\s*:\s*([^.]+)",
-        ]
-        for pattern in markers:
-            match = re.search(pattern, text, flags=re.IGNORECASE)
-            if match:
-                chunks.append(match.group(1))
-
-        subjects: list[str] = []
-        seen: set[str] = set()
-        for chunk in chunks:
-            parts = re.split(r",|/|\band\b|\bthen\b|&", chunk, flags=re.IGNORECASE)
-            for part in parts:
-                subject = part.strip(" .")
-                if not subject:
-                    continue
-                key = subject.lower()
-                if key not in seen:
-                    seen.add(key)
-                    subjects.append(subject)
-        return subjects
+        # Fresh list per call: callers append to it, the cached tuple stays intact
+        return list(_subjects_from_text(text))
 
     def _parse_clock(self, value: str, base_date: str | None = None) -> datetime:
         try:
@@ -624,7 +661,10 @@ class OpenAIConversationModel:
                 "OPENAI_API_KEY environment variable is not set. Provide an API key to enable the scheduler agent."
             )
 
-        self._client = OpenAI(api_key=api_key)
+        # Imported here so the scheduler module stays free of core's heavier imports
+        from core.http import get_openai_client
+
+        self._client = get_openai_client(api_key)
         self.model = model
         self.temperature = temperature
         self.system_prompt = (
@@ -55,11 +55,7 @@ class TutorAgent:
             num_chunks = tutor.ingest_material(Path("calculus_notes.pdf"))
             print(f"Ingested {num_chunks} chunks")
         """
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-
-        if path.suffix.lower() != ".pdf":
-            raise ValueError(f"Only PDF files are supported, got: {path.suffix}")
+        self._validate_material(path)
 
         print(f"[tutor] Ingesting material from {path.name}...")
 
@@ -69,6 +65,29 @@ class TutorAgent:
         print(f"[tutor] Successfully ingested {path.name} ({num_chunks} chunks)")
         return num_chunks
 
+    def ingest_materials(self, paths: Iterable[Path]) -> int:
+        """
+        Index several study resources in a single pipeline pass.
+
+        All PDFs are chunked first and then embedded and written together, so a
+        multi-file upload costs one embedding batch instead of one per file.
+
+        Args:
+            paths: Paths to PDF files to ingest
+
+        Returns:
+            Total number of chunks processed
+        """
+        paths_list = list(paths)
+        for path in paths_list:
+            self._validate_material(path)
+
+        print(f"[tutor] Ingesting {len(paths_list)} materials...")
+        num_chunks = self.rag_pipeline.ingest(paths_list)
+
+        print(f"[tutor] Successfully ingested {len(paths_list)} materials ({num_chunks} chunks)")
+        return num_chunks
+
     def generate_quiz(self, topic: str, num_questions: int = 5) -> list[QuizItem]:
         """
         Produce quiz items using retrieved context.
@@ -128,6 +147,19 @@ class TutorAgent:
         """
         return self.rag_pipeline.run_query(query, k=k)
 
+    def get_contexts(self, queries: list[str], k: int = 3) -> list[list[str]]:
+        """
+        Retrieve relevant context for several queries at once.
+
+        Args:
+            queries: Query texts
+            k: Number of results to return per query
+
+        Returns:
+            One list of text snippets per query, in input order
+        """
+        return self.rag_pipeline.run_queries(queries, k=k)
+
     def count_materials(self) -> int:
         """
         Get the number of document chunks in the knowledge base.
@@ -137,6 +169,12 @@ class TutorAgent:
         """
         return self.rag_pipeline.count_documents()
 
+    @staticmethod
+    def _validate_material(path: Path) -> None:
+        """Raise if ``path`` is not a PDF; a missing file surfaces when it's loaded."""
+        if path.suffix.lower() != ".pdf":
+            raise ValueError(f"Only PDF files are supported, got: {path.suffix}")
+
     def clear_materials(self) -> None:
         """Clear all ingested materials from the knowledge base."""
         print("[tutor] Clearing all materials...")
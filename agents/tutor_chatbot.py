@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -12,6 +13,45 @@ from langchain_openai import ChatOpenAI
 
 from agents.tutor_agent import TutorAgent
 
+QUIT_COMMANDS = frozenset({"/quit", "/exit"})
+
+# Printed with a single write each, rather than one print() per line
+WELCOME_TEXT = "\n".join(
+    [
+        "\n" + "=" * 60,
+        "🎓 Welcome to Study Pal Tutor Chatbot!",
+        "=" * 60,
+        "\nI'm your AI study assistant. I can help you understand",
+        "your study materials and answer questions.",
+        "\n💡 Tips:",
+        "  - Use /ingest <pdf_path> to load study materials",
+        "  - Ask me questions about your materials",
+        "  - Type /help to see all commands",
+        "  - Type /quit to exit",
+        "\n" + "=" * 60,
+    ]
+)
+
+HELP_TEXT = "\n".join(
+    [
+        "\n📖 Available Commands:",
+        "  /help                  - Show this help message",
+        "  /ingest <path>        - Load a PDF file into knowledge base",
+        "  /count                - Show number of chunks in knowledge base",
+        "  /status               - Show system status",
+        "  /clear                - Clear conversation history",
+        "  /clear-materials      - Clear all study materials",
+        "  /quit or /exit        - Exit the chatbot",
+        "\n💬 Natural Language (LangGraph Multi-Agent System):",
+        "  Just chat naturally! The system automatically routes to the right agent:",
+        "  • 'What is [topic]?'              → Tutor agent (Q&A)",
+        "  • 'Analyze my weak points'        → Analyzer agent",
+        "  • 'Create a study schedule...'    → Scheduler agent",
+        "  • 'I need motivation'             → Motivator agent",
+        "\n✨ No slash commands needed - just describe what you need!",
+    ]
+)
+
 
 @dataclass
 class TutorChatbot:
@@ -75,24 +115,7 @@ class TutorChatbot:
         Returns:
             Assistant's response
         """
-        # Retrieve relevant context from study materials
-        context_chunks = self.tutor_agent.get_context(user_message, k=k)
-
-        # Build system prompt with context
-        system_prompt = self._build_system_prompt(context_chunks)
-
-        # Build messages for LLM
-        messages = [SystemMessage(content=system_prompt)]
-
-        # Add chat history (keep only last N messages for sliding window)
-        history_messages = self.memory.messages
-        if len(history_messages) > self.memory_k:
-            history_messages = history_messages[-self.memory_k :]
-
-        messages.extend(history_messages)
-
-        # Add current user message
-        messages.append(HumanMessage(content=user_message))
+        messages = self._build_messages(user_message, k)
 
         # Generate response
         try:
@@ -112,6 +135,37 @@ class TutorChatbot:
             self.memory.add_ai_message(error_msg)
             return error_msg
 
+    def stream_chat(self, user_message: str, k: int = 3) -> Iterator[str]:
+        """
+        Process user message and yield the response as it is generated.
+
+        Same behaviour as ``chat`` but streams tokens from the LLM so callers can
+        render the first words without waiting for the whole completion.
+
+        Args:
+            user_message: User's input message
+            k: Number of context chunks to retrieve
+
+        Yields:
+            Response text fragments in order
+        """
+        messages = self._build_messages(user_message, k)
+
+        parts: list[str] = []
+        try:
+            for chunk in self.llm.stream(messages):
+                if chunk.content:
+                    parts.append(chunk.content)
+                    yield chunk.content
+            assistant_message = "".join(parts)
+        except Exception as e:
+            assistant_message = f"Sorry, I encountered an error: {str(e)}"
+            yield assistant_message
+
+        # Save interaction to memory
+        self.memory.add_user_message(user_message)
+        self.memory.add_ai_message(assistant_message)
+
     def ingest_material(self, path: Path) -> str:
         """
         Ingest study material and return status message.
@@ -154,6 +208,34 @@ class TutorChatbot:
             return f"Conversation: {num_messages} messages ({num_exchanges} exchanges)"
         return "Conversation: No messages yet"
 
+    def _build_messages(self, user_message: str, k: int) -> list:
+        """
+        Build the LLM message list: system prompt with RAG context, history, user turn.
+
+        Args:
+            user_message: User's input message
+            k: Number of context chunks to retrieve
+
+        Returns:
+            Messages ready to send to the LLM
+        """
+        # Retrieve relevant context from study materials
+        context_chunks = self.tutor_agent.get_context(user_message, k=k)
+
+        # Build system prompt with context
+        messages = [SystemMessage(content=self._build_system_prompt(context_chunks))]
+
+        # Add chat history (keep only last N messages for sliding window)
+        history_messages = self.memory.messages
+        if len(history_messages) > self.memory_k:
+            history_messages = history_messages[-self.memory_k :]
+
+        messages.extend(history_messages)
+
+        # Add current user message
+        messages.append(HumanMessage(content=user_message))
+        return messages
+
     def _build_system_prompt(self, context_chunks: list[str]) -> str:
         """
         Build system prompt with RAG context.
@@ -236,8 +318,14 @@ class ChatInterface:
 
                 # Regular chat message
                 print("\n🎓 Tutor: ", end="", flush=True)
-                response = self.chatbot.chat(user_input)
-                print(response)
+                if hasattr(self.chatbot, "stream_chat"):
+                    # Print tokens as they arrive instead of after the full reply
+                    for fragment in self.chatbot.stream_chat(user_input):
+                        print(fragment, end="", flush=True)
+                    print()
+                else:
+                    response = self.chatbot.chat(user_input)
+                    print(response)
 
             except KeyboardInterrupt:
                 print("\n\nGoodbye! Happy studying! 📚")
@@ -248,6 +336,17 @@ class ChatInterface:
             except Exception as e:
                 print(f"\n❌ Error: {e}")
 
+    def __post_init__(self) -> None:
+        # Built once; each handler takes the command's argument string
+        self._commands: dict[str, Callable[[str], None]] = {
+            "/help": lambda args: self._print_help(),
+            "/ingest": self._ingest_command,
+            "/count": lambda args: print(f"📊 Knowledge base: {self.chatbot.get_materials_count()} document chunks"),
+            "/clear": lambda args: print(f"🧹 {self.chatbot.clear_conversation()}"),
+            "/clear-materials": self._clear_materials_command,
+            "/status": lambda args: self._print_status(),
+        }
+
     def _handle_command(self, command: str) -> bool:
         """
         Handle slash commands.
@@ -258,82 +357,52 @@ class ChatInterface:
         Returns:
             True to continue, False to exit
         """
-        parts = command.split(maxsplit=1)
-        cmd = parts[0].lower()
-        args = parts[1] if len(parts) > 1 else ""
+        cmd, *rest = command.split(maxsplit=1)
+        cmd = cmd.lower()
 
-        if cmd in ["/quit", "/exit"]:
+        if cmd in QUIT_COMMANDS:
             print("\n👋 Goodbye! Happy studying! 📚")
             return False
 
-        elif cmd == "/help":
-            self._print_help()
-
-        elif cmd == "/ingest":
-            if not args:
-                print("❌ Usage: /ingest <path_to_pdf>")
-            else:
-                path = Path(args.strip())
-                print(f"📚 Ingesting {path.name}...")
-                result = self.chatbot.ingest_material(path)
-                print(f"✓ {result}")
-
-        elif cmd == "/count":
-            count = self.chatbot.get_materials_count()
-            print(f"📊 Knowledge base: {count} document chunks")
-
-        elif cmd == "/clear":
-            result = self.chatbot.clear_conversation()
-            print(f"🧹 {result}")
-
-        elif cmd == "/clear-materials":
-            confirm = input("⚠️  Clear all materials? (yes/no): ").strip().lower()
-            if confirm == "yes":
-                result = self.chatbot.clear_materials()
-                print(f"🧹 {result}")
-            else:
-                print("Cancelled.")
-
-        elif cmd == "/status":
-            self._print_status()
-
-        else:
+        handler = self._commands.get(cmd)
+        if handler is None:
             print(f"❌ Unknown command: {cmd}")
             print("💡 Type /help for available commands")
-
+        else:
+            handler(rest[0].strip() if rest else "")
         return True
 
+    def _ingest_command(self, args: str) -> None:
+        """Load the PDF named in ``args`` into the knowledge base."""
+        if not args:
+            print("❌ Usage: /ingest <path_to_pdf>")
+            return
+        path = Path(args)
+        print(f"📚 Ingesting {path.name}...")
+        try:
+            result = self.chatbot.ingest_material(path)
+        except FileNotFoundError:
+            print(f"❌ File not found: {path}")
+        except Exception as e:
+            print(f"❌ Error ingesting {path.name}: {e}")
+        else:
+            print(f"✓ {result}")
+
+    def _clear_materials_command(self, args: str) -> None:
+        """Clear all study materials after the user confirms."""
+        confirm = input("⚠️  Clear all materials? (yes/no): ").strip().lower()
+        if confirm == "yes":
+            print(f"🧹 {self.chatbot.clear_materials()}")
+        else:
+            print("Cancelled.")
+
     def _print_welcome(self) -> None:
         """Print welcome message."""
-        print("\n" + "=" * 60)
-        print("🎓 Welcome to Study Pal Tutor Chatbot!")
-        print("=" * 60)
-        print("\nI'm your AI study assistant. I can help you understand")
-        print("your study materials and answer questions.")
-        print("\n💡 Tips:")
-        print("  - Use /ingest <pdf_path> to load study materials")
-        print("  - Ask me questions about your materials")
-        print("  - Type /help to see all commands")
-        print("  - Type /quit to exit")
-        print("\n" + "=" * 60)
+        print(WELCOME_TEXT)
 
     def _print_help(self) -> None:
         """Print help information."""
-        print("\n📖 Available Commands:")
-        print("  /help                  - Show this help message")
-        print("  /ingest <path>        - Load a PDF file into knowledge base")
-        print("  /count                - Show number of chunks in knowledge base")
-        print("  /status               - Show system status")
-        print("  /clear                - Clear conversation history")
-        print("  /clear-materials      - Clear all study materials")
-        print("  /quit or /exit        - Exit the chatbot")
-        print("\n💬 Natural Language (LangGraph Multi-Agent System):")
-        print("  Just chat naturally! The system automatically routes to the right agent:")
-        print("  • 'What is [topic]?'              → Tutor agent (Q&A)")
-        print("  • 'Analyze my weak points'        → Analyzer agent")
-        print("  • 'Create a study schedule...'    → Scheduler agent")
-        print("  • 'I need motivation'             → Motivator agent")
-        print("\n✨ No slash commands needed - just describe what you need!")
+        print(HELP_TEXT)
 
     def _print_status(self) -> None:
         """Print system status."""
@@ -343,13 +412,14 @@ class ChatInterface:
         from core.langgraph_chatbot import LangGraphChatbot
 
         if isinstance(self.chatbot, LangGraphChatbot):
+            status = self.chatbot.snapshot()
             print("  Mode: LangGraph Multi-Agent System")
             print(f"  User ID: {self.chatbot.user_id}")
-            print(f"  Knowledge base: {self.chatbot.get_materials_count()} chunks")
-            print(f"  {self.chatbot.get_conversation_summary()}")
+            print(f"  Knowledge base: {status['materials']} chunks")
+            print(f"  {status['summary']}")
 
             # Show last detected intent
-            last_intent = self.chatbot.get_last_intent()
+            last_intent = status["intent"]
             if last_intent != "unknown":
                 print(f"  Last detected intent: {last_intent}")
         else:
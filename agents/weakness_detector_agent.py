@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 
 from langchain_core.messages import BaseMessage, HumanMessage
 
+from core.http import get_openai_client
+from core.response_cache import ResponseCache, prompt_key
 from core.weakness_analyzer import SessionRecommendations, WeakPoint
 
 try:
@@ -14,6 +17,10 @@ try:
 except ImportError:
     OpenAI = None
 
+# Analysis runs at low temperature with JSON output, so re-analyzing the same
+# transcript returns the stored result instead of another API round-trip
+ANALYSIS_CACHE = ResponseCache(max_entries=128, ttl=3600.0)
+
 
 class WeaknessDetectorAgent:
     """
@@ -27,13 +34,19 @@ class WeaknessDetectorAgent:
     - Severity levels based on conversation context
     """
 
-    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.1):
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.1,
+        cache: ResponseCache | None = ANALYSIS_CACHE,
+    ):
         """
         Initialize LLM weakness detector.
 
         Args:
             model: OpenAI model to use (default: gpt-4o-mini for cost-effectiveness)
             temperature: Low temperature for consistent analysis
+            cache: Response cache for repeated transcripts (None disables caching)
         """
         if OpenAI is None:
             raise ImportError("The 'openai' package is required. Install it via `pip install openai`.")
@@ -42,9 +55,27 @@ class WeaknessDetectorAgent:
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.model = model
         self.temperature = temperature
+        self.cache = cache
+
+    @classmethod
+    @functools.lru_cache(maxsize=4)
+    def get(cls, model: str = "gpt-4o-mini") -> WeaknessDetectorAgent:
+        """
+        Return a shared detector for ``model``, creating it on first use.
+
+        The agent holds no per-conversation state, so callers that don't need
+        custom settings can reuse one instance instead of constructing their own.
+
+        Args:
+            model: OpenAI model to use
+
+        Returns:
+            Process-wide WeaknessDetectorAgent for the model
+        """
+        return cls(model=model)
 
     def analyze_conversation(
         self, messages: list[BaseMessage], session_topic: str | None = None
@@ -70,24 +101,32 @@ class WeaknessDetectorAgent:
         # Create analysis prompt
         prompt = self._build_analysis_prompt(transcript, session_topic)
 
-        try:
-            # Call LLM
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self._get_system_prompt()},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=self.temperature,
-                response_format={"type": "json_object"},
-            )
+        system_prompt = self._get_system_prompt()
+        cache_key = prompt_key(self.model, str(self.temperature), system_prompt, prompt)
 
-            # Parse response
-            result_text = response.choices[0].message.content
-            if not result_text:
-                raise ValueError("Empty response from LLM")
+        try:
+            result_text = self.cache.get(cache_key) if self.cache is not None else None
+            if result_text is None:
+                # Call LLM
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=self.temperature,
+                    response_format={"type": "json_object"},
+                )
+
+                # Parse response
+                result_text = response.choices[0].message.content
+                if not result_text:
+                    raise ValueError("Empty response from LLM")
 
             result = json.loads(result_text)
+            # Only cache responses that parsed, so a bad reply is retried next time
+            if self.cache is not None:
+                self.cache.set(cache_key, result_text)
 
             # Convert to SessionRecommendations object
             return self._convert_to_recommendations(result)
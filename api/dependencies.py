@@ -40,15 +40,30 @@ chatbot_instances: dict = {}
 _chatbot_lock = threading.Lock()
 
 
-def get_or_create_chatbot(user_id: str):
-    """Get or create a chatbot instance for a user."""
+def _import_chatbot_class() -> None:
+    """Import LangGraphChatbot on first use. Caller must hold ``_chatbot_lock``."""
     global LangGraphChatbot
+    if LangGraphChatbot is None:
+        logger.info("Lazy loading LangGraphChatbot...")
+        from core.langgraph_chatbot import LangGraphChatbot as _LangGraphChatbot
+
+        LangGraphChatbot = _LangGraphChatbot
+
+
+def preload_chatbot_class() -> None:
+    """Import the LangGraph/RAG stack and open the OpenAI connection ahead of the first request."""
     with _chatbot_lock:
-        if LangGraphChatbot is None:
-            logger.info("Lazy loading LangGraphChatbot...")
-            from core.langgraph_chatbot import LangGraphChatbot as _LangGraphChatbot
+        _import_chatbot_class()
+
+    from core.http import warm_openai_connection
 
-            LangGraphChatbot = _LangGraphChatbot
+    warm_openai_connection()
+
+
+def get_or_create_chatbot(user_id: str):
+    """Get or create a chatbot instance for a user."""
+    with _chatbot_lock:
+        _import_chatbot_class()
 
         if user_id not in chatbot_instances:
             logger.info(f"Creating chatbot instance for user: {user_id}")
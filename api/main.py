@@ -3,9 +3,11 @@ FastAPI backend for Study Pal frontend.
 Wraps existing Python code to provide REST API endpoints.
 """
 
+import asyncio
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -18,6 +20,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 # Import routers after sys.path setup
+from api.dependencies import preload_chatbot_class
 from api.routers import chat, documents, users
 
 # Load environment variables
@@ -31,8 +34,18 @@ logger = logging.getLogger(__name__)
 if not os.getenv("OPENAI_API_KEY"):
     logger.warning("OPENAI_API_KEY is not set. Chat and RAG features will fail.")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Import the chatbot stack in the background so the first chat doesn't pay for it."""
+    warmup = asyncio.create_task(asyncio.to_thread(preload_chatbot_class))
+    yield
+    if not warmup.done():
+        logger.info("Shutting down before chatbot warmup finished")
+
+
 # Initialize FastAPI app
-app = FastAPI(title="Study Pal API", version="1.0.0")
+app = FastAPI(title="Study Pal API", version="1.0.0", lifespan=lifespan)
 
 # CORS: local dev + optional deployed frontend
 _cors_origins = ["http://localhost:3000", "http://127.0.0.1:3000"]
@@ -1,10 +1,14 @@
 """API router for chat operations."""
 
+import asyncio
+import json
 import logging
+from collections.abc import Iterator
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi.responses import StreamingResponse
 
-from api.dependencies import get_or_create_chatbot, profile_store
+from api.dependencies import chatbot_instances, get_or_create_chatbot, profile_store
 from api.models import ChatRequest, ChatResponse
 
 logger = logging.getLogger(__name__)
@@ -21,6 +25,10 @@ async def warmup(user_id: str, background_tasks: BackgroundTasks):
         except FileNotFoundError:
             raise HTTPException(status_code=404, detail="User profile not found. Register first.")
 
+        # Repeated warmup clicks shouldn't queue more background work once the bot exists
+        if user_id in chatbot_instances:
+            return {"status": "ready", "user_id": user_id}
+
         background_tasks.add_task(get_or_create_chatbot, user_id)
         return {"status": "warming_up", "user_id": user_id}
     except Exception as e:
@@ -40,11 +48,12 @@ async def chat(request: ChatRequest):
         except FileNotFoundError:
             raise HTTPException(status_code=404, detail="User profile not found. Register first.")
 
-        # Get chatbot instance
-        chatbot = get_or_create_chatbot(user_id)
+        # Get chatbot instance (first call builds the graph and RAG pipeline)
+        chatbot = await asyncio.to_thread(get_or_create_chatbot, user_id)
 
-        # Chat
-        response = chatbot.chat(message)
+        # achat runs the turn in a worker thread: the agents make blocking
+        # OpenAI/quote lookups, which would otherwise stall every other request
+        response = await chatbot.achat(message)
 
         # chat() returns a plain string; get avatar from chatbot state
         avatar = chatbot.get_current_avatar()
@@ -59,3 +68,45 @@ async def chat(request: ChatRequest):
     except Exception as e:
         logger.error(f"Chat error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Chat with the AI, streaming the reply as newline-delimited JSON.
+
+    Each line is ``{"delta": "..."}`` with the next piece of the reply; the
+    last line is ``{"done": true, "agent_avatar": ..., "agent_name": ...}``
+    (or ``{"error": ...}`` if the turn failed part-way).
+    """
+    user_id = request.user_id
+    try:
+        profile_store.load(user_id)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="User profile not found. Register first.")
+
+    chatbot = await asyncio.to_thread(get_or_create_chatbot, user_id)
+
+    def events() -> Iterator[str]:
+        # Starlette iterates sync generators in its threadpool, so the
+        # blocking graph run doesn't stall the event loop
+        try:
+            for fragment in chatbot.stream_chat(request.message):
+                yield json.dumps({"delta": fragment}) + "\n"
+        except Exception as e:
+            logger.error(f"Chat stream error: {e}", exc_info=True)
+            yield json.dumps({"error": str(e)}) + "\n"
+            return
+        intent = chatbot.get_last_intent() or "general"
+        yield (
+            json.dumps(
+                {
+                    "done": True,
+                    "agent_avatar": chatbot.get_current_avatar(),
+                    "agent_name": intent.replace("_", " ").title(),
+                }
+            )
+            + "\n"
+        )
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
@@ -3,6 +3,8 @@
 import asyncio
 import logging
 import shutil
+import tempfile
+from pathlib import Path
 from typing import Annotated
 
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
@@ -14,6 +16,31 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _temp_upload_path(upload_dir: Path, filename: str) -> Path:
+    """
+    Return a fresh server-side path for one uploaded file.
+
+    Each upload gets its own directory, so files with the same name (in one
+    batch or in concurrent requests) never collide. Only the base name of the
+    client's filename is kept, so it can't point outside that directory but
+    still shows up as the material's source.
+    """
+    return Path(tempfile.mkdtemp(dir=upload_dir)) / Path(filename).name
+
+
+def _remove_uploads(paths: list[Path]) -> None:
+    """Delete the per-upload directories created by ``_temp_upload_path``."""
+    for path in paths:
+        shutil.rmtree(path.parent, ignore_errors=True)
+
+
+def _save_uploads(files: list[UploadFile], paths: list[Path]) -> None:
+    """Copy uploaded files to disk. Blocking; run it off the event loop."""
+    for file, path in zip(files, paths):
+        with open(path, "wb") as f:
+            shutil.copyfileobj(file.file, f)
+
+
 @router.post("/upload")
 async def upload_file(
     user_id: Annotated[str, Form()],
@@ -25,33 +52,68 @@ async def upload_file(
         if not file.filename.endswith(".pdf"):
             raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
-        # Get chatbot (load lazy dependencies)
-        chatbot = get_or_create_chatbot(user_id)
+        # Get chatbot (first call builds the graph and RAG pipeline)
+        chatbot = await asyncio.to_thread(get_or_create_chatbot, user_id)
 
         # Save uploaded file temporarily
         upload_dir = PROJECT_ROOT / "data" / "uploads"
         upload_dir.mkdir(parents=True, exist_ok=True)
-        temp_path = upload_dir / f"{user_id}_{file.filename}"
+        temp_path = _temp_upload_path(upload_dir, file.filename)
 
         try:
-            with open(temp_path, "wb") as f:
-                shutil.copyfileobj(file.file, f)
+            # Disk writes, PDF parsing and embedding all block, so they run in
+            # worker threads and other users' requests keep being served
+            await asyncio.to_thread(_save_uploads, [file], [temp_path])
 
-            # Ingest the file (run in thread to avoid blocking loop)
             # ingest_material on LangGraphChatbot handles the RAG pipeline ingestion
             result = await asyncio.to_thread(chatbot.ingest_material, temp_path)
             # get_materials_count returns int
             chunks = await asyncio.to_thread(chatbot.get_materials_count)
 
-            return {"message": result, "chunks": chunks, "filename": file.filename}
+            return {"message": result, "chunks": chunks, "filename": temp_path.name}
 
         finally:
             # Clean up temp file
-            if temp_path.exists():
-                temp_path.unlink()
+            _remove_uploads([temp_path])
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error uploading file: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/upload/batch")
+async def upload_files(
+    user_id: Annotated[str, Form()],
+    files: Annotated[list[UploadFile], File()],
+):
+    """Upload several PDF files and ingest them in a single embedding batch."""
+    try:
+        if not files:
+            raise HTTPException(status_code=400, detail="No files provided")
+        if any(not file.filename.endswith(".pdf") for file in files):
+            raise HTTPException(status_code=400, detail="Only PDF files are supported")
+
+        chatbot = await asyncio.to_thread(get_or_create_chatbot, user_id)
+
+        upload_dir = PROJECT_ROOT / "data" / "uploads"
+        upload_dir.mkdir(parents=True, exist_ok=True)
+        temp_paths = [_temp_upload_path(upload_dir, file.filename) for file in files]
+
+        try:
+            await asyncio.to_thread(_save_uploads, files, temp_paths)
+
+            result = await asyncio.to_thread(chatbot.ingest_materials, temp_paths)
+            chunks = await asyncio.to_thread(chatbot.get_materials_count)
+
+            return {"message": result, "chunks": chunks, "filenames": [path.name for path in temp_paths]}
+
+        finally:
+            _remove_uploads(temp_paths)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error uploading files: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
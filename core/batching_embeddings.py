@@ -0,0 +1,65 @@
+"""Coalesce concurrent single-query embedding calls into batched requests."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+
+from langchain_core.embeddings import Embeddings
+
+
+class BatchingEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that merges ``embed_query`` calls made at the same time.
+
+    Every query that arrives while a batch is forming joins it. The first
+    caller waits up to ``max_wait`` seconds (less once ``max_batch_size``
+    queries are queued), sends all of them in one ``embed_documents``
+    request, and hands each caller its own vector. Under concurrent load, e.g.
+    several users asking the tutor at once, N round-trips become one; a lone
+    caller only pays the short wait.
+
+    Args:
+        inner: Embeddings that do the actual work
+        max_batch_size: Queue length that sends the batch without waiting out ``max_wait``
+        max_wait: Seconds the first caller waits for others to join
+    """
+
+    def __init__(self, inner: Embeddings, max_batch_size: int = 32, max_wait: float = 0.005) -> None:
+        self.inner = inner
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: list[tuple[str, Future]] = []
+        self._forming = False
+        self._cond = threading.Condition()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed a list of texts; already one request, so passed straight through."""
+        return self.inner.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed one query, sharing a request with any queries that arrive at the same time."""
+        future: Future = Future()
+        with self._cond:
+            self._pending.append((text, future))
+            leader = not self._forming
+            if leader:
+                self._forming = True
+            elif len(self._pending) >= self.max_batch_size:
+                self._cond.notify_all()
+
+        if leader:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self._pending) >= self.max_batch_size, timeout=self.max_wait)
+                batch, self._pending = self._pending, []
+                self._forming = False
+            try:
+                vectors = self.inner.embed_documents([queued for queued, _ in batch])
+            except Exception as e:
+                for _, waiter in batch:
+                    waiter.set_exception(e)
+            else:
+                for (_, waiter), vector in zip(batch, vectors):
+                    waiter.set_result(vector)
+
+        return future.result()
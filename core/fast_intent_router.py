@@ -0,0 +1,193 @@
+"""
+Embedding-based intent routing for clear-cut messages.
+
+Most messages name their intent plainly ("I need motivation", "schedule a
+study session"). ``FastIntentRouter`` embeds a batch of messages in one
+request, compares each against per-intent centroids built from seed phrases,
+and only sends the ambiguous ones to the LLM classifier.
+
+The router ignores conversation history, so it suits standalone utterances
+(evaluation sets, first messages); follow-ups like "yes" still need
+``classify_intent_with_llm``.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from core.http import openai_key_for
+from core.rag_pipeline import get_embeddings
+from core.response_cache import prompt_key
+from core.workflow_nodes import INTENTS, classify_intents_with_llm
+
+logger = logging.getLogger(__name__)
+
+FAST_INTENT_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Labeled examples per intent; each centroid is the mean of its phrases' embeddings
+INTENT_SEED_PHRASES: dict[str, tuple[str, ...]] = {
+    "tutor": (
+        "Explain how derivatives work",
+        "What is photosynthesis?",
+        "Can you help me understand this concept?",
+        "Create a quiz on chapter 3",
+        "Quiz me on the material",
+        "I don't get how recursion works",
+        "Teach me about the French Revolution",
+        "What does this formula mean?",
+        "Give me an example of a linked list",
+        "Summarize my lecture notes",
+    ),
+    "scheduler": (
+        "Schedule a study session",
+        "Plan my study time for next week",
+        "Add a study block to my calendar",
+        "Set up pomodoro sessions for tomorrow",
+        "When should I study for my exam?",
+        "Create a study plan for the weekend",
+        "Book two hours on Friday for revision",
+        "Put a review session in my calendar",
+        "Make me a study timetable",
+        "I'm free tomorrow afternoon, plan my sessions",
+    ),
+    "analyzer": (
+        "I'm done for today",
+        "That's all, I'm finished",
+        "Analyze my study session",
+        "What are my weak points?",
+        "Review my progress",
+        "How did I do in this session?",
+        "Which topics should I focus on?",
+        "Show me what I struggled with",
+        "Wrap up the session",
+        "Give me feedback on today's session",
+    ),
+    "motivator": (
+        "I need motivation",
+        "Give me a pep talk",
+        "I feel like giving up",
+        "Encourage me to keep studying",
+        "I'm so tired of studying",
+        "Cheer me up",
+        "I can't focus, help me get going",
+        "Motivate me",
+        "I'm stressed about my exams",
+        "Say something inspiring",
+    ),
+}
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length so dot products are cosine similarities."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+@dataclass
+class FastIntentRouter:
+    """
+    Nearest-centroid intent router backed by one batched embedding call.
+
+    A message is labeled locally when its best intent beats the runner-up by
+    more than ``margin`` cosine similarity; otherwise it's left to the LLM.
+    Centroids are cached on disk, keyed by the model and seed phrases, so
+    only the first run pays for embedding the seeds.
+    """
+
+    embeddings: Embeddings
+    embedding_model: str = FAST_INTENT_EMBEDDING_MODEL
+    margin: float = 0.05
+    cache_path: Path | None = field(default_factory=lambda: Path("data/intent_centroids.npz"))
+
+    _centroids: np.ndarray | None = field(default=None, init=False, repr=False)
+
+    def _seed_key(self) -> str:
+        """Identify the model and seed phrases the centroids were built from."""
+        return prompt_key(
+            self.embedding_model,
+            *(f"{intent}:{phrase}" for intent in INTENTS for phrase in INTENT_SEED_PHRASES[intent]),
+        )
+
+    @property
+    def centroids(self) -> np.ndarray:
+        """Unit-length centroid per intent, rows in ``INTENTS`` order."""
+        if self._centroids is None:
+            key = self._seed_key()
+            if self.cache_path is not None and self.cache_path.exists():
+                cached = np.load(self.cache_path)
+                if str(cached["key"]) == key:
+                    self._centroids = cached["centroids"]
+                    return self._centroids
+
+            phrases = [phrase for intent in INTENTS for phrase in INTENT_SEED_PHRASES[intent]]
+            vectors = _normalize(np.asarray(self.embeddings.embed_documents(phrases), dtype=np.float32))
+            sizes = [len(INTENT_SEED_PHRASES[intent]) for intent in INTENTS]
+            groups = np.split(vectors, np.cumsum(sizes)[:-1])
+            self._centroids = _normalize(np.stack([group.mean(axis=0) for group in groups]))
+
+            if self.cache_path is not None:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                np.savez(self.cache_path, key=key, centroids=self._centroids)
+        return self._centroids
+
+    def route(self, user_messages: list[str]) -> list[str | None]:
+        """
+        Label the clear-cut messages without calling the LLM.
+
+        Args:
+            user_messages: Messages to route
+
+        Returns:
+            Intent per message, or None where the top two intents are too close to call
+        """
+        if not user_messages:
+            return []
+
+        vectors = _normalize(np.asarray(self.embeddings.embed_documents(user_messages), dtype=np.float32))
+        scores = vectors @ self.centroids.T
+        top_two = np.sort(scores, axis=1)[:, -2:]
+        confident = top_two[:, 1] - top_two[:, 0] > self.margin
+        best = scores.argmax(axis=1)
+        return [INTENTS[i] if sure else None for i, sure in zip(best, confident)]
+
+    def classify(self, user_messages: list[str], user_id: str = "default_user") -> list[str]:
+        """
+        Classify messages, sending only the ambiguous ones to the LLM.
+
+        Args:
+            user_messages: Messages to classify
+            user_id: User identifier, used to pick the API key for the LLM fallback
+
+        Returns:
+            One intent per message, in input order
+        """
+        intents = self.route(user_messages)
+        ambiguous = [i for i, intent in enumerate(intents) if intent is None]
+        logger.debug("Fast intent router: %d local, %d to LLM", len(intents) - len(ambiguous), len(ambiguous))
+        if ambiguous:
+            answers = classify_intents_with_llm([user_messages[i] for i in ambiguous], user_id=user_id)
+            for i, intent in zip(ambiguous, answers):
+                intents[i] = intent
+        return intents
+
+
+@functools.lru_cache(maxsize=None)
+def get_fast_intent_router(user_id: str = "default_user") -> FastIntentRouter:
+    """
+    Return the shared router for the API key assigned to ``user_id``.
+
+    Args:
+        user_id: User identifier
+
+    Returns:
+        FastIntentRouter using ``FAST_INTENT_EMBEDDING_MODEL``
+    """
+    api_key = openai_key_for(user_id) or os.getenv("OPENAI_API_KEY")
+    return FastIntentRouter(embeddings=get_embeddings(FAST_INTENT_EMBEDDING_MODEL, api_key))
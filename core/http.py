@@ -0,0 +1,122 @@
+"""Shared HTTP connection pool for OpenAI-backed agents."""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+import logging
+import os
+import zlib
+
+import httpx
+
+from core.rate_limiter import throttle_openai_call
+
+try:  # pragma: no cover - optional dependency during tests
+    from openai import OpenAI
+except ImportError:  # pragma: no cover
+    OpenAI = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Model looked up by warm_openai_connection(); any cheap, non-billable endpoint works
+WARMUP_MODEL = "gpt-4o-mini"
+
+# HTTP/2 multiplexes concurrent requests over one connection, but httpx only
+# supports it when the optional `h2` package is installed.
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Endpoints that spend the account's request and token budgets
+_METERED_PATHS = ("/chat/completions", "/responses", "/embeddings")
+# Completion tokens reserved per chat request on top of the prompt estimate
+COMPLETION_TOKEN_ALLOWANCE = 300
+
+
+def _throttle_openai_request(request: httpx.Request) -> None:
+    """Reserve rate-limit budget for a model request before httpx sends it."""
+    if request.method != "POST" or not request.url.path.endswith(_METERED_PATHS):
+        return
+    try:
+        body_chars = len(request.content)
+    except httpx.RequestNotRead:
+        body_chars = 0
+    completion = 0 if request.url.path.endswith("/embeddings") else COMPLETION_TOKEN_ALLOWANCE
+    # Roughly 4 characters per token
+    throttle_openai_call(body_chars // 4 + completion)
+
+
+# One keep-alive pool for every agent talking to api.openai.com, so the
+# motivator, scraper, analyzer and embeddings reuse warm TCP/TLS connections.
+# Every model request through it first waits on the shared rate limiter.
+SHARED_HTTPX = httpx.Client(
+    http2=HTTP2_ENABLED,
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+    event_hooks={"request": [_throttle_openai_request]},
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_openai_client(api_key: str) -> OpenAI:
+    """
+    Return a process-wide OpenAI client for the given key.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        OpenAI client backed by ``SHARED_HTTPX``
+    """
+    if OpenAI is None:  # pragma: no cover - external dependency guard
+        raise ImportError("The 'openai' package is required. Install it via `pip install openai`.")
+    return OpenAI(api_key=api_key, http_client=SHARED_HTTPX)
+
+
+def openai_api_keys() -> tuple[str, ...]:
+    """
+    Return the configured OpenAI keys, in order.
+
+    ``OPENAI_API_KEYS`` (comma-separated) lists several keys or deployments to
+    spread load across; otherwise the single ``OPENAI_API_KEY`` is used.
+
+    Returns:
+        Tuple of API keys (empty if none are configured)
+    """
+    raw = os.getenv("OPENAI_API_KEYS") or os.getenv("OPENAI_API_KEY") or ""
+    return tuple(key.strip() for key in raw.split(",") if key.strip())
+
+
+def openai_key_for(user_id: str) -> str | None:
+    """
+    Pick the API key that serves ``user_id``.
+
+    The choice is a stable hash of the user id, so one conversation always hits
+    the same backend (keeping its provider-side prompt cache warm) while
+    different users spread evenly across all configured keys.
+
+    Args:
+        user_id: User identifier
+
+    Returns:
+        The assigned key, or None when no key is configured
+    """
+    keys = openai_api_keys()
+    if not keys:
+        return None
+    return keys[zlib.crc32(user_id.encode("utf-8")) % len(keys)]
+
+
+def warm_openai_connection() -> None:
+    """
+    Open a keep-alive connection to the OpenAI API before the first real call.
+
+    Makes one non-billable model lookup through ``SHARED_HTTPX`` so the TCP/TLS
+    handshake is already done when the first user's message arrives. Errors
+    are logged and ignored; the real call will simply connect itself.
+    """
+    keys = openai_api_keys()
+    if not keys or OpenAI is None:
+        return
+    try:
+        get_openai_client(keys[0]).models.retrieve(WARMUP_MODEL)
+    except Exception as exc:
+        logger.debug("OpenAI connection warmup failed: %s", exc)
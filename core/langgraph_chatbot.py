@@ -5,17 +5,36 @@ This replaces the simple TutorChatbot with a multi-agent LangGraph workflow.
 Now all agents (Tutor, Scheduler, Analyzer, Motivator) work together automatically!
 """
 
+import asyncio
 import logging
+import os
+import threading
+import uuid
 from pathlib import Path
+from typing import Iterator
 
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
 
 from agents.tutor_agent import TutorAgent
+from core.agent_avatars import get_agent_avatar
+from core.http import get_openai_client, openai_key_for
+from core.openai_batch import run_chat_batch, to_openai_messages
 from core.rag_pipeline import get_rag_pipeline
-from core.workflow_graph import create_study_pal_graph
+from core.workflow_graph import get_study_pal_graph
+from core.workflow_nodes import (
+    NO_MATERIALS_ANSWER,
+    TUTOR_CONTEXT_K,
+    TUTOR_MODEL,
+    TUTOR_TEMPERATURE,
+    build_tutor_messages,
+)
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import (the API preloads this module at startup), so
+# creating a chatbot for a new user doesn't pay for building the graph
+_COMPILED_GRAPH = get_study_pal_graph()
+
 
 class LangGraphChatbot:
     """
@@ -36,20 +55,26 @@ class LangGraphChatbot:
         # Automatically goes to Scheduler Agent!
     """
 
-    def __init__(self, user_id: str = "default_user", session_id: str = "default"):
+    def __init__(self, user_id: str = "default_user", session_id: str | None = None, graph=None):
         """
         Initialize the LangGraph chatbot.
 
         Args:
             user_id: User identifier
-            session_id: Conversation session ID (for memory across turns)
+            session_id: Conversation session ID (for memory across turns);
+                defaults to a fresh ID so chatbots never share a checkpoint thread
+            graph: Compiled workflow to run (defaults to the shared process-wide graph)
         """
         self.user_id = user_id
-        self.session_id = session_id
+        self.session_id = session_id if session_id is not None else f"{user_id}:{uuid.uuid4().hex}"
 
-        # Create the LangGraph workflow
+        # Reuse the compiled LangGraph workflow; per-session memory lives in its
+        # checkpointer under this chatbot's thread_id
         logger.info(f"[LangGraph Chatbot] Initializing for user: {user_id}")
-        self.graph = create_study_pal_graph()
+        self.graph = graph if graph is not None else _COMPILED_GRAPH
+        # The checkpointer outlives this chatbot, so start from an empty thread
+        # rather than resuming whatever an earlier chatbot left under this ID
+        self._reset_thread()
 
         # Initialize RAG pipeline and tutor agent for direct material management
         # Each user gets their own isolated ChromaDB collection
@@ -92,9 +117,13 @@ class LangGraphChatbot:
 
         self.memory = ChatMessageHistory()
 
+        # Turns of one conversation must not interleave: each reads and then
+        # replaces conversation_state. Different users' chatbots run in parallel.
+        self._turn_lock = threading.Lock()
+
         logger.info("[LangGraph Chatbot] Ready! All agents standing by.")
 
-    def chat(self, user_message: str) -> str:
+    def chat(self, user_message: str, max_chars: int | None = None) -> str:
         """
         Send a message and get a response from the appropriate agent.
 
@@ -105,6 +134,8 @@ class LangGraphChatbot:
 
         Args:
             user_message: What the user said
+            max_chars: If set, return at most this many characters of the reply
+                (plus "..."); the conversation history keeps the full text
 
         Returns:
             Response from the appropriate agent
@@ -116,7 +147,135 @@ class LangGraphChatbot:
             >>> chatbot.chat("Schedule my study time 2-5pm")
             "I've created your study schedule..."  # From Scheduler
         """
-        logger.info(f"[User → LangGraph] {user_message[:50]}...")
+        with self._turn_lock:
+            response = self._run_turn(user_message)
+        if max_chars is not None and len(response) > max_chars:
+            return response[:max_chars] + "..."
+        return response
+
+    async def achat(self, user_message: str, max_chars: int | None = None) -> str:
+        """
+        Async variant of :meth:`chat` for event-loop callers.
+
+        The workflow's agents make blocking OpenAI calls, so the turn runs in a
+        worker thread; concurrent sessions overlap while each session's own turns
+        stay in order.
+
+        Args:
+            user_message: What the user said
+            max_chars: Optional display limit, as in :meth:`chat`
+
+        Returns:
+            Response from the appropriate agent
+        """
+        return await asyncio.to_thread(self.chat, user_message, max_chars)
+
+    def chat_batch(self, user_messages: list[str]) -> list[str]:
+        """
+        Answer several standalone study questions.
+
+        With ``USE_BATCH_API`` set, the tutor answers all of them in one OpenAI
+        Batch API job (half the price, but it can take minutes) and the
+        exchanges are then added to the conversation as if asked one by one.
+        Only use it for questions that don't depend on each other's answers.
+        Otherwise each message simply goes through :meth:`chat`.
+
+        Args:
+            user_messages: Questions for the tutor
+
+        Returns:
+            One response per message, in order
+        """
+        if not os.getenv("USE_BATCH_API"):
+            return [self.chat(message) for message in user_messages]
+
+        # The prompts use no conversation history, so retrieval and the batch
+        # job (which can take minutes) run without blocking this session's turns
+        contexts = self.tutor_agent.get_contexts(user_messages, k=TUTOR_CONTEXT_K)
+        answerable = [i for i, context in enumerate(contexts) if context]
+        user_name = self.conversation_state.get("user_name", "there")
+        bodies = [
+            {
+                "model": TUTOR_MODEL,
+                "temperature": TUTOR_TEMPERATURE,
+                "messages": to_openai_messages(build_tutor_messages(user_messages[i], contexts[i], [], user_name)),
+            }
+            for i in answerable
+        ]
+
+        answers = [NO_MATERIALS_ANSWER] * len(user_messages)
+        if bodies:
+            api_key = openai_key_for(self.user_id)
+            if not api_key:
+                raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
+            for i, answer in zip(answerable, run_chat_batch(get_openai_client(api_key), bodies)):
+                answers[i] = answer
+
+        with self._turn_lock:
+            # Replay the exchanges so later turns see them as ordinary tutor history
+            for message, answer in zip(user_messages, answers):
+                self.conversation_state["messages"].extend([HumanMessage(content=message), AIMessage(content=answer)])
+                self.memory.add_user_message(message)
+                self.memory.add_ai_message(answer)
+            self.conversation_state.update(
+                current_intent="tutor",
+                tutor_session_active=True,
+                session_mode="active_tutoring",
+                current_agent_avatar=get_agent_avatar("tutor"),
+            )
+        return answers
+
+    def stream_chat(self, user_message: str) -> Iterator[str]:
+        """
+        Send a message and yield the response as it is generated.
+
+        Same behaviour as :meth:`chat`, but the tutor's answer is yielded token
+        by token so callers can show the first words right away. Replies from
+        agents that don't stream (scheduler, analyzer, motivator) arrive as a
+        single fragment once the turn finishes. The session's turn lock is held
+        until the generator is exhausted or closed.
+
+        Unlike :meth:`chat`, a failing turn raises instead of yielding an
+        apology, so callers can tell an error from the reply (fragments already
+        yielded may be a partial answer).
+
+        Args:
+            user_message: What the user said
+
+        Yields:
+            Response text fragments in order
+        """
+        with self._turn_lock:
+            config = self._start_turn(user_message)
+            streamed = False
+            try:
+                result_state = None
+                for mode, payload in self.graph.stream(
+                    self.conversation_state, config, stream_mode=["messages", "values"]
+                ):
+                    if mode == "values":
+                        result_state = payload
+                        continue
+                    chunk, metadata = payload
+                    # The router's intent classifier is an LLM call too; only relay the tutor's answer
+                    if (
+                        isinstance(chunk, AIMessageChunk)
+                        and chunk.content
+                        and metadata.get("langgraph_node") == "tutor"
+                    ):
+                        streamed = True
+                        yield chunk.content
+                response = self._finish_turn(result_state)
+            except Exception as e:
+                logger.error(f"[LangGraph Error] {e}")
+                raise
+
+            if not streamed:
+                yield response
+
+    def _start_turn(self, user_message: str) -> dict:
+        """Record the user's message and return the run config. Caller must hold ``_turn_lock``."""
+        logger.info("[User → LangGraph] %.50s...", user_message)
 
         # Add user message to state
         self.conversation_state["messages"].append(HumanMessage(content=user_message))
@@ -125,31 +284,38 @@ class LangGraphChatbot:
         self.memory.add_user_message(user_message)
 
         # Configuration for memory (so it remembers across turns)
-        config = {"configurable": {"thread_id": self.session_id}}
+        return {"configurable": {"thread_id": self.session_id}}
+
+    def _finish_turn(self, result_state: dict) -> str:
+        """Adopt the workflow's final state and return the reply. Caller must hold ``_turn_lock``."""
+        # Update our internal state
+        self.conversation_state = result_state
+
+        # Sync all messages to memory
+        self.memory.clear()
+        for msg in result_state["messages"]:
+            if isinstance(msg, HumanMessage):
+                self.memory.add_user_message(msg.content)
+            elif isinstance(msg, AIMessage):
+                self.memory.add_ai_message(msg.content)
+
+        # Get the last AI message (the response)
+        for msg in reversed(result_state["messages"]):
+            if isinstance(msg, AIMessage):
+                response = msg.content
+                logger.info("[LangGraph → User] %.50s...", response)
+                return response
+
+        return "I'm not sure how to respond to that."
+
+    def _run_turn(self, user_message: str) -> str:
+        """Run one message through the workflow. Caller must hold ``_turn_lock``."""
+        config = self._start_turn(user_message)
 
         try:
             # Run the workflow!
             result_state = self.graph.invoke(self.conversation_state, config)
-
-            # Update our internal state
-            self.conversation_state = result_state
-
-            # Sync all messages to memory
-            self.memory.clear()
-            for msg in result_state["messages"]:
-                if isinstance(msg, HumanMessage):
-                    self.memory.add_user_message(msg.content)
-                elif isinstance(msg, AIMessage):
-                    self.memory.add_ai_message(msg.content)
-
-            # Get the last AI message (the response)
-            for msg in reversed(result_state["messages"]):
-                if isinstance(msg, AIMessage):
-                    response = msg.content
-                    logger.info(f"[LangGraph → User] {response[:50]}...")
-                    return response
-
-            return "I'm not sure how to respond to that."
+            return self._finish_turn(result_state)
 
         except Exception as e:
             error_msg = f"Sorry, I encountered an error: {str(e)}"
@@ -168,15 +334,32 @@ class LangGraphChatbot:
         Returns:
             Status message
 
+        Raises:
+            FileNotFoundError: If the PDF doesn't exist
+            ValueError: If the file isn't a PDF or can't be parsed
+
         Example:
             >>> chatbot.ingest_material(Path("calculus.pdf"))
             "Successfully ingested calculus.pdf (42 chunks)"
         """
+        num_chunks = self.tutor_agent.ingest_material(pdf_path)
+        return f"Successfully ingested {pdf_path.name} ({num_chunks} chunks)"
+
+    def ingest_materials(self, pdf_paths: list[Path]) -> str:
+        """
+        Load several PDFs into the knowledge base in one batch.
+
+        Args:
+            pdf_paths: Paths to PDF files
+
+        Returns:
+            Status message
+        """
         try:
-            num_chunks = self.tutor_agent.ingest_material(pdf_path)
-            return f"Successfully ingested {pdf_path.name} ({num_chunks} chunks)"
+            num_chunks = self.tutor_agent.ingest_materials(pdf_paths)
+            return f"Successfully ingested {len(pdf_paths)} files ({num_chunks} chunks)"
         except Exception as e:
-            return f"Error ingesting {pdf_path.name}: {e}"
+            return f"Error ingesting files: {e}"
 
     def get_materials_count(self) -> int:
         """Get number of document chunks in knowledge base."""
@@ -187,8 +370,15 @@ class LangGraphChatbot:
         self.tutor_agent.clear_materials()
         return "All study materials cleared."
 
+    def _reset_thread(self) -> None:
+        """Drop this session's checkpoints from the shared graph's checkpointer."""
+        checkpointer = getattr(self.graph, "checkpointer", None)
+        if checkpointer is not None:
+            checkpointer.delete_thread(self.session_id)
+
     def clear_conversation(self) -> str:
         """Clear conversation history."""
+        self._reset_thread()
         self.conversation_state = {
             "messages": [],
             "user_id": self.user_id,
@@ -219,12 +409,37 @@ class LangGraphChatbot:
 
     def get_conversation_summary(self) -> str:
         """Get summary of current conversation."""
-        num_messages = len(self.conversation_state["messages"])
+        return self._summarize(self.conversation_state)
+
+    @staticmethod
+    def _summarize(state: dict) -> str:
+        """Describe the conversation held in ``state``."""
+        num_messages = len(state["messages"])
         if num_messages > 0:
             num_exchanges = num_messages // 2
             return f"Conversation: {num_messages} messages ({num_exchanges} exchanges)"
         return "Conversation: No messages yet"
 
+    def snapshot(self) -> dict:
+        """
+        Collect the chatbot's status in one call.
+
+        All conversation fields come from the same state object, so a turn
+        finishing concurrently can't mix values from two different turns.
+
+        Returns:
+            Dict with ``materials`` (chunk count), ``summary``, ``intent``,
+            ``mode`` and ``tutor_active``
+        """
+        state = self.conversation_state
+        return {
+            "materials": self.get_materials_count(),
+            "summary": self._summarize(state),
+            "intent": state.get("current_intent", "unknown"),
+            "mode": state.get("session_mode"),
+            "tutor_active": state.get("tutor_session_active", False),
+        }
+
     def get_last_intent(self) -> str:
         """Get the intent detected in the last message."""
         return self.conversation_state.get("current_intent", "unknown")
@@ -239,7 +454,5 @@ class LangGraphChatbot:
 
     def get_current_avatar(self) -> str:
         """Get the emoji avatar for the current agent."""
-        from core.agent_avatars import get_agent_avatar
-
         avatar = self.conversation_state.get("current_agent_avatar")
         return avatar if avatar else get_agent_avatar("system")
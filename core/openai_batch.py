@@ -0,0 +1,103 @@
+"""Submit independent chat completions through the OpenAI Batch API."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+
+from langchain_core.messages import AIMessage, BaseMessage, SystemMessage
+
+logger = logging.getLogger(__name__)
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+TERMINAL_BATCH_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def to_openai_messages(messages: list[BaseMessage]) -> list[dict[str, str]]:
+    """
+    Convert LangChain messages to the Chat Completions wire format.
+
+    Args:
+        messages: System, human and AI messages
+
+    Returns:
+        List of ``{"role": ..., "content": ...}`` dicts
+    """
+    converted = []
+    for message in messages:
+        if isinstance(message, SystemMessage):
+            role = "system"
+        elif isinstance(message, AIMessage):
+            role = "assistant"
+        else:
+            role = "user"
+        converted.append({"role": role, "content": message.content})
+    return converted
+
+
+def run_chat_batch(
+    client,
+    bodies: list[dict],
+    poll_interval: float = 10.0,
+    timeout: float = 24 * 3600.0,
+) -> list[str]:
+    """
+    Run chat completion requests as one Batch API job and wait for the answers.
+
+    Batch jobs are billed at half the synchronous rate but may take minutes to
+    finish, so only use this for non-interactive runs whose prompts don't
+    depend on each other's answers.
+
+    Args:
+        client: OpenAI client
+        bodies: Chat completion request bodies (model, messages, ...)
+        poll_interval: Seconds between status checks
+        timeout: Seconds to wait before giving up
+
+    Returns:
+        Answer text for each body, in input order
+
+    Raises:
+        RuntimeError: If the batch ends unsuccessfully or a request errored
+        TimeoutError: If the batch is still running after ``timeout`` seconds
+    """
+    if not bodies:
+        return []
+
+    lines = [
+        json.dumps({"custom_id": str(i), "method": "POST", "url": CHAT_COMPLETIONS_ENDPOINT, "body": body})
+        for i, body in enumerate(bodies)
+    ]
+    input_file = client.files.create(file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=CHAT_COMPLETIONS_ENDPOINT,
+        completion_window="24h",
+    )
+    logger.info("Submitted batch %s with %d requests", batch.id, len(bodies))
+
+    deadline = time.monotonic() + timeout
+    while batch.status not in TERMINAL_BATCH_STATUSES:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Batch {batch.id} still {batch.status} after {timeout:.0f}s")
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    answers: dict[int, str] = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            raise RuntimeError(f"Batch request {record.get('custom_id')} failed: {record.get('error') or response}")
+        answers[int(record["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+
+    missing = [i for i in range(len(bodies)) if i not in answers]
+    if missing:
+        raise RuntimeError(f"Batch {batch.id} returned no answer for requests {missing}")
+    return [answers[i] for i in range(len(bodies))]
@@ -2,22 +2,55 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_core.retrievers import BaseRetriever
 from langchain_openai import OpenAIEmbeddings
 
+from .batching_embeddings import BatchingEmbeddings
 from .document_processor import DocumentProcessor
+from .http import SHARED_HTTPX
 from .vector_stores import ChromaVectorStore
 
 # Global singleton instances (one per user) with thread safety
 _rag_pipeline_instances: dict[str, RAGPipeline] = {}
 _rag_pipeline_lock = threading.Lock()
 
+# Recent run_query results kept per pipeline; repeated questions skip the
+# embedding call and the vector search entirely
+QUERY_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=None)
+def get_embeddings(model: str, api_key: str) -> Embeddings:
+    """
+    Return the process-wide embeddings client for a model and API key.
+
+    Concurrent single queries (one per user asking at the same time) are
+    merged into one request by ``BatchingEmbeddings``.
+
+    Args:
+        model: OpenAI embedding model name
+        api_key: OpenAI API key
+
+    Returns:
+        Embeddings shared by every pipeline using that model
+    """
+    return BatchingEmbeddings(OpenAIEmbeddings(model=model, openai_api_key=api_key, http_client=SHARED_HTTPX))
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse whitespace and case so trivially different phrasings share a cache entry."""
+    return " ".join(query.split()).lower()
+
 
 @dataclass
 class RAGPipeline:
@@ -37,23 +70,26 @@ class RAGPipeline:
     persist_directory: Path = field(default_factory=lambda: Path("data/chroma_db"))
     chunk_size: int = 1000
     chunk_overlap: int = 200
+    # Embeddings to use instead of the shared OpenAI client (e.g. a local fake in tests)
+    embeddings: Embeddings | None = None
 
     # These will be initialized in __post_init__
     document_processor: DocumentProcessor = field(init=False)
     vector_store: ChromaVectorStore = field(init=False)
-    embeddings: OpenAIEmbeddings = field(init=False)
+
+    # (normalized query, k) -> snippets; invalidated whenever the store changes
+    _query_cache: OrderedDict[tuple[str, int], list[str]] = field(default_factory=OrderedDict, init=False, repr=False)
+    _query_cache_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize the pipeline components."""
-        # Initialize OpenAI embeddings
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
-
-        self.embeddings = OpenAIEmbeddings(
-            model=self.embedding_model,
-            openai_api_key=api_key,
-        )
+        # Shared OpenAI embeddings client, unless embeddings were injected
+        if self.embeddings is None:
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
+
+            self.embeddings = get_embeddings(self.embedding_model, api_key)
 
         # Initialize document processor
         self.document_processor = DocumentProcessor(
@@ -96,28 +132,39 @@ class RAGPipeline:
 
         all_chunks = []
 
-        for path in paths_list:
-            try:
-                # Process PDF into chunks
-                chunks = self.document_processor.process_pdf(path)
-                all_chunks.extend(chunks)
-
-            except (FileNotFoundError, ValueError):
+        # Process PDFs into chunks (in worker processes for large batches)
+        for path, result in zip(paths_list, self.document_processor.process_pdfs(paths_list)):
+            if isinstance(result, (FileNotFoundError, ValueError)):
                 # Re-raise critical errors
-                raise
-            except Exception as e:
-                print(f"[rag_pipeline] Error processing {path}: {e}")
+                raise result
+            if isinstance(result, Exception):
+                print(f"[rag_pipeline] Error processing {path}: {result}")
                 continue
+            all_chunks.extend(result)
+
+        num_chunks = self.ingest_documents(all_chunks)
+        if num_chunks:
+            print(f"[rag_pipeline] Successfully ingested {num_chunks} chunks from {len(paths_list)} files")
+        return num_chunks
 
-        if not all_chunks:
+    def ingest_documents(self, chunks: list[Document]) -> int:
+        """
+        Store already-chunked documents, skipping PDF parsing.
+
+        Args:
+            chunks: Documents as produced by ``DocumentProcessor.process_pdf``
+
+        Returns:
+            Number of chunks stored
+        """
+        if not chunks:
             print("[rag_pipeline] No chunks to ingest")
             return 0
 
         # Add chunks to vector store
-        self.vector_store.add_documents(all_chunks)
-
-        print(f"[rag_pipeline] Successfully ingested {len(all_chunks)} chunks from {len(paths_list)} files")
-        return len(all_chunks)
+        self.vector_store.add_documents(chunks)
+        self._invalidate_query_cache()
+        return len(chunks)
 
     def run_query(self, query: str, k: int = 5) -> list[str]:
         """
@@ -136,6 +183,11 @@ class RAGPipeline:
             for result in results:
                 print(result)
         """
+        key = (_normalize_query(query), k)
+        cached = self._cached_contents(key)
+        if cached is not None:
+            return cached
+
         results = self.vector_store.similarity_search(query, k=k)
 
         # Log search results
@@ -144,7 +196,54 @@ class RAGPipeline:
         else:
             print("[rag_pipeline] ✗ No context found for query")
 
-        return [result["content"] for result in results]
+        contents = [result["content"] for result in results]
+        self._cache_contents(key, contents)
+        return list(contents)
+
+    def run_queries(self, queries: list[str], k: int = 5) -> list[list[str]]:
+        """
+        Retrieve snippets for several queries in one batched round-trip.
+
+        Args:
+            queries: Query texts to search for
+            k: Number of results to return per query
+
+        Returns:
+            One list of content strings per query, in input order
+
+        Shares ``run_query``'s cache: only queries not already cached are
+        sent to the vector store, each distinct one once.
+        """
+        keys = [(_normalize_query(query), k) for query in queries]
+        found = {key: cached for key in set(keys) if (cached := self._cached_contents(key)) is not None}
+
+        # First spelling of each uncached query, in input order
+        misses: dict[tuple[str, int], str] = {}
+        for key, query in zip(keys, queries):
+            if key not in found:
+                misses.setdefault(key, query)
+        if misses:
+            results = self.vector_store.similarity_search_batch(list(misses.values()), k=k)
+            for key, hits in zip(misses, results):
+                found[key] = [result["content"] for result in hits]
+                self._cache_contents(key, found[key])
+        return [list(found[key]) for key in keys]
+
+    def _cached_contents(self, key: tuple[str, int]) -> list[str] | None:
+        """Return a copy of the cached snippets for ``key``, or None on a miss."""
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is None:
+                return None
+            self._query_cache.move_to_end(key)
+            return list(cached)
+
+    def _cache_contents(self, key: tuple[str, int], contents: list[str]) -> None:
+        """Store snippets for ``key``, evicting the least recently used entry when full."""
+        with self._query_cache_lock:
+            self._query_cache[key] = contents
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
 
     def run_query_with_scores(
         self,
@@ -195,6 +294,12 @@ class RAGPipeline:
     def clear(self) -> None:
         """Clear all documents from the vector store."""
         self.vector_store.clear()
+        self._invalidate_query_cache()
+
+    def _invalidate_query_cache(self) -> None:
+        """Drop cached query results after the underlying collection changes."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
 
     def count_documents(self) -> int:
         """Get the number of documents in the vector store."""
@@ -0,0 +1,69 @@
+"""Client-side rate limiting for OpenAI calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TokenBucket:
+    """
+    Thread-safe token bucket that refills continuously over a fixed period.
+
+    Callers block in ``acquire`` until enough capacity is available, so bursts
+    queue locally instead of being rejected by the API with a 429 and retried.
+
+    Example:
+        rpm = TokenBucket(capacity=450, period=60.0)
+        rpm.acquire()  # Blocks if 450 requests were already sent this minute
+    """
+
+    capacity: float
+    period: float = 60.0
+
+    _tokens: float = field(init=False)
+    _updated_at: float = field(init=False)
+    _lock: threading.Lock = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.capacity <= 0 or self.period <= 0:
+            raise ValueError("capacity and period must be positive")
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """
+        Take ``amount`` tokens, sleeping until the bucket has refilled enough.
+
+        Args:
+            amount: Tokens to consume (capped at the bucket capacity)
+        """
+        amount = min(amount, self.capacity)
+        rate = self.capacity / self.period
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * rate)
+                self._updated_at = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / rate
+            time.sleep(wait)
+
+
+# Process-wide budgets, drawn on by a request hook on core.http.SHARED_HTTPX,
+# so every synchronous OpenAI call (tutor, router, analyzer, motivator,
+# embeddings) counts against them. Clients with their own connection pool,
+# like the quote scraper's async client, are not covered.
+OPENAI_RPM_LIMITER = TokenBucket(capacity=450, period=60.0)
+OPENAI_TPM_LIMITER = TokenBucket(capacity=180_000, period=60.0)
+
+
+def throttle_openai_call(estimated_tokens: int) -> None:
+    """Block until both the request and token budgets allow another call."""
+    OPENAI_RPM_LIMITER.acquire()
+    OPENAI_TPM_LIMITER.acquire(estimated_tokens)
@@ -0,0 +1,84 @@
+"""Exact-match cache for deterministic LLM responses."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+
+def prompt_key(*parts: str) -> str:
+    """
+    Hash the pieces of a request into a stable cache key.
+
+    Args:
+        parts: Model name, system prompt, user prompt, etc.
+
+    Returns:
+        Hex digest identifying the exact request
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@dataclass
+class ResponseCache:
+    """
+    Thread-safe LRU of raw LLM responses with a time-to-live.
+
+    Only suitable for calls whose answer is a function of the prompt (low
+    temperature, structured output); identical requests then skip the API.
+
+    Example:
+        cache = ResponseCache(max_entries=128, ttl=3600)
+        key = prompt_key(model, system_prompt, user_prompt)
+        text = cache.get(key)
+        if text is None:
+            text = call_llm(...)
+            cache.set(key, text)
+    """
+
+    max_entries: int = 128
+    ttl: float = 3600.0
+
+    _entries: OrderedDict[str, tuple[float, str]] = field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_entries <= 0 or self.ttl <= 0:
+            raise ValueError("max_entries and ttl must be positive")
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key``, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Iterable
 
@@ -13,6 +14,31 @@ from langchain_core.embeddings import Embeddings
 from langchain_core.retrievers import BaseRetriever
 
 
+@functools.lru_cache(maxsize=None)
+def get_chroma_client(persist_directory: str) -> chromadb.ClientAPI:
+    """
+    Return the process-wide ChromaDB client for a persist directory.
+
+    One client serves every collection stored under the directory, so each
+    user's vector store reuses it instead of opening the database again.
+
+    Args:
+        persist_directory: Directory holding the database
+
+    Returns:
+        Persistent ChromaDB client
+    """
+    return chromadb.PersistentClient(
+        path=persist_directory,
+        settings=Settings(
+            anonymized_telemetry=False,
+            allow_reset=True,
+            is_persistent=True,
+            persist_directory=persist_directory,
+        ),
+    )
+
+
 class ChromaVectorStore:
     """
     ChromaDB-based vector store implementation.
@@ -41,16 +67,8 @@ class ChromaVectorStore:
         # Create persist directory if it doesn't exist
         persist_directory.mkdir(parents=True, exist_ok=True)
 
-        # Initialize ChromaDB client with persistence
-        self.client = chromadb.PersistentClient(
-            path=str(persist_directory),
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True,
-                is_persistent=True,
-                persist_directory=str(persist_directory),
-            ),
-        )
+        # Shared ChromaDB client with persistence
+        self.client = get_chroma_client(str(persist_directory))
 
         # Initialize LangChain Chroma wrapper
         self.vector_store = Chroma(
@@ -130,6 +148,52 @@ class ChromaVectorStore:
             for doc in documents
         ]
 
+    def similarity_search_batch(
+        self,
+        queries: list[str],
+        k: int = 5,
+    ) -> list[list[dict]]:
+        """
+        Search for several queries with one embedding call and one index query.
+
+        Args:
+            queries: Query texts
+            k: Number of results to return per query
+
+        Returns:
+            One list of dicts with 'content' and 'metadata' keys per query, in input order
+
+        Example:
+            results = store.similarity_search_batch(["limits", "integrals"], k=2)
+            for hits in results:
+                print([hit['content'] for hit in hits])
+        """
+        if not queries:
+            return []
+
+        count = self.count_documents()
+        if count == 0:
+            return [[] for _ in queries]
+
+        query_embeddings = self.embedding_function.embed_documents(list(queries))
+        collection = self.client.get_collection(name=self.collection_name)
+        results = collection.query(
+            query_embeddings=query_embeddings,
+            n_results=min(k, count),
+            include=["documents", "metadatas"],
+        )
+
+        return [
+            [
+                {
+                    "content": content,
+                    "metadata": metadata or {},
+                }
+                for content, metadata in zip(documents, metadatas)
+            ]
+            for documents, metadatas in zip(results["documents"], results["metadatas"])
+        ]
+
     def similarity_search_with_score(
         self,
         query: str,
@@ -20,6 +20,7 @@ Visual representation:
                     END
 """
 
+import functools
 import logging
 
 from langgraph.checkpoint.memory import MemorySaver
@@ -153,37 +154,31 @@ def create_study_pal_graph():
     return app
 
 
-# =============================================================================
-# Helper function to run the graph
-# =============================================================================
+@functools.lru_cache(maxsize=1)
+def get_study_pal_graph():
+    """
+    Return the process-wide compiled workflow, building it on first use.
 
+    Nodes are stateless and the checkpointer keys conversations by
+    ``thread_id``, so every chatbot can share one compiled graph as long as
+    each uses its own thread ID.
 
-def run_workflow(user_message: str, user_id: str = "default_user", session_id: str = "default") -> dict:
+    Returns:
+        Compiled LangGraph application shared by all sessions
     """
-    Run a single message through the workflow.
+    return create_study_pal_graph()
 
-    This is a simple helper function to make it easy to use the graph.
 
-    Args:
-        user_message: What the user said
-        user_id: User identifier
-        session_id: Conversation session ID (for memory)
+# =============================================================================
+# Helper function to run the graph
+# =============================================================================
 
-    Returns:
-        The final state after all agents have run
 
-    Example:
-        >>> result = run_workflow("What is a derivative?")
-        >>> print(result["messages"][-1].content)
-        "A derivative measures the rate of change..."
-    """
+def _initial_state(user_message: str, user_id: str) -> dict:
+    """Build the starting workflow state for a single message."""
     from langchain_core.messages import HumanMessage
 
-    # Create the graph
-    app = create_study_pal_graph()
-
-    # Build initial state
-    initial_state = {
+    return {
         "messages": [HumanMessage(content=user_message)],
         "user_id": user_id,
         "current_topic": None,
@@ -209,6 +204,32 @@ def run_workflow(user_message: str, user_id: str = "default_user", session_id: s
         "pending_schedule_request": None,
     }
 
+
+def run_workflow(user_message: str, user_id: str = "default_user", session_id: str = "default") -> dict:
+    """
+    Run a single message through the workflow.
+
+    This is a simple helper function to make it easy to use the graph.
+
+    Args:
+        user_message: What the user said
+        user_id: User identifier
+        session_id: Conversation session ID (for memory)
+
+    Returns:
+        The final state after all agents have run
+
+    Example:
+        >>> result = run_workflow("What is a derivative?")
+        >>> print(result["messages"][-1].content)
+        "A derivative measures the rate of change..."
+    """
+    # Create the graph
+    app = create_study_pal_graph()
+
+    # Build initial state
+    initial_state = _initial_state(user_message, user_id)
+
     # Configuration for memory (so it remembers this conversation)
     config = {"configurable": {"thread_id": session_id}}
 
@@ -220,6 +241,38 @@ def run_workflow(user_message: str, user_id: str = "default_user", session_id: s
     return final_state
 
 
+async def arun_workflow(user_message: str, user_id: str = "default_user", session_id: str = "default") -> dict:
+    """
+    Async variant of :func:`run_workflow`.
+
+    The nodes are synchronous, so LangGraph runs each one in a worker thread.
+    Independent workflows (different sessions) awaited together overlap their
+    OpenAI round-trips instead of running back to back.
+
+    Args:
+        user_message: What the user said
+        user_id: User identifier
+        session_id: Conversation session ID (for memory)
+
+    Returns:
+        The final state after all agents have run
+
+    Example:
+        >>> tutor, schedule = await asyncio.gather(
+        ...     arun_workflow("What is a derivative?", session_id="a"),
+        ...     arun_workflow("Schedule study time 2-5pm", session_id="b"),
+        ... )
+    """
+    app = create_study_pal_graph()
+    config = {"configurable": {"thread_id": session_id}}
+
+    logger.info(f"🚀 Running workflow for message: {user_message[:50]}...")
+    final_state = await app.ainvoke(_initial_state(user_message, user_id), config)
+
+    logger.info("✅ Workflow completed!")
+    return final_state
+
+
 def stream_workflow(user_message: str, user_id: str = "default_user", session_id: str = "default"):
     """
     Stream the workflow execution step by step.
@@ -239,35 +292,9 @@ def stream_workflow(user_message: str, user_id: str = "default_user", session_id
         >>> for update in stream_workflow("Explain calculus"):
         >>>     print(f"Update: {update}")
     """
-    from langchain_core.messages import HumanMessage
-
     app = create_study_pal_graph()
 
-    initial_state = {
-        "messages": [HumanMessage(content=user_message)],
-        "user_id": user_id,
-        "current_topic": None,
-        "current_intent": None,
-        "weak_points": None,
-        "generated_schedule": None,
-        "next_agent": None,
-        "workflow_complete": False,
-        "schedule_plan": None,
-        "session_mode": None,
-        "tutor_session_active": False,
-        "analysis_results": None,
-        "session_analysis": None,
-        "user_wants_scheduling": False,
-        "needs_motivation": False,
-        "start_tutor_after_schedule": False,
-        "ready_for_tutoring": False,
-        "tutor_exit_requested": False,
-        "rag_pipeline": None,
-        "user_profile": None,
-        "awaiting_schedule_confirmation": False,
-        "awaiting_schedule_details": False,
-        "pending_schedule_request": None,
-    }
+    initial_state = _initial_state(user_message, user_id)
 
     config = {"configurable": {"thread_id": session_id}}
 
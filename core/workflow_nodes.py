@@ -10,17 +10,70 @@ Think of nodes like workers in a factory assembly line.
 Each worker (node) does their job and passes the work to the next worker.
 """
 
+import functools
+import itertools
+import json
 import logging
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
+from pydantic import BaseModel, ValidationError
 
 from core.agent_avatars import get_agent_avatar
+from core.http import SHARED_HTTPX, openai_key_for
+from core.response_cache import ResponseCache, prompt_key
 from core.workflow_state import StudyPalState
 
 logger = logging.getLogger(__name__)
 
+PROFILES_DIR = Path("data/profiles")
+
+# Number of study-material chunks the tutor pulls in per question
+TUTOR_CONTEXT_K = 5
+
+# Work that shouldn't hold up a node's reply: the tutor's retrieval while the
+# intent classifier waits on OpenAI, and calendar syncs after the user confirms
+_BACKGROUND_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="studypal-background")
+
+# Scheduler node patterns, compiled once at import
+_TIME_REFERENCE_RE = re.compile(r"\b\d{1,2}(:\d{2})?\s*(am|pm)?\b|\b\d{1,2}\s*[-:to]{1,3}\s*\d{1,2}", re.IGNORECASE)
+_TIME_RANGE_RE = re.compile(
+    r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*(?:-|to)\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?",
+    re.IGNORECASE,
+)
+
+
+def _any_substring_re(words: list[str]) -> re.Pattern[str]:
+    """Compile a single alternation that matches if any of ``words`` occurs as a substring."""
+    return re.compile("|".join(map(re.escape, words)))
+
+
+# Keyword checks fused into one alternation each, so the message is scanned
+# once per check instead of once per keyword
+_AFFIRMATIVE_WORDS = frozenset({"yes", "yeah", "yep", "sure", "affirmative", "please", "ok", "okay", "definitely"})
+_NEGATIVE_RE = _any_substring_re(["no", "nope", "nah", "cancel", "not now", "later", "stop"])
+_DAY_REFERENCE_RE = _any_substring_re(
+    [
+        "monday",
+        "tuesday",
+        "wednesday",
+        "thursday",
+        "friday",
+        "saturday",
+        "sunday",
+        "today",
+        "tomorrow",
+        "tonight",
+        "weekend",
+    ]
+)
+_SYNC_CONFIRM_RE = _any_substring_re(["yes", "yeah", "sure", "ok", "okay", "y", "yep", "please", "sync"])
+_SUBJECT_KEYWORD_RE = _any_substring_re(["study", "focus", "subject", "topic"])
+
 
 def _get_last_human_message(messages: list[BaseMessage]) -> Optional[HumanMessage]:
     """Return the most recent human message from the conversation."""
@@ -58,18 +111,67 @@ def _format_history(messages: list[BaseMessage], last_n: int = 3) -> str:
 # =============================================================================
 
 
-def classify_intent_with_llm(user_message: str, conversation_history: list[BaseMessage]) -> str:
+def _chat_model_kwargs(api_key: str | None) -> dict:
     """
-    Use LLM to classify user intent with full conversation context.
+    Shared ChatOpenAI settings: the process-wide connection pool, plus an
+    explicit key only when one was assigned (otherwise ChatOpenAI reads the environment).
+    """
+    kwargs = {"http_client": SHARED_HTTPX}
+    if api_key:
+        kwargs["api_key"] = api_key
+    return kwargs
 
-    Returns: tutor, scheduler, analyzer, or motivator
+
+INTENT_MODEL = "gpt-4o-mini"
+INTENT_SEED = 0
+
+# The classifier runs at temperature 0 with a fixed seed and its prompt embeds
+# the recent history, so an identical prompt (same message in the same
+# context) reuses the earlier intent instead of another round-trip
+INTENT_CACHE = ResponseCache(max_entries=512, ttl=3600.0)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_intent_classifier(api_key: str | None = None) -> ChatOpenAI:
+    """Build the deterministic classifier model once per API key and reuse it for every turn."""
+    return ChatOpenAI(model=INTENT_MODEL, temperature=0, seed=INTENT_SEED, **_chat_model_kwargs(api_key))
+
+
+INTENTS = ("tutor", "scheduler", "analyzer", "motivator")
+
+# Phrasings that name a single intent outright, one named group per intent,
+# scanned in one pass. Kept narrow on purpose: anything that could be a study
+# question ("what is motivation?") is left to the classifier. Intents always
+# come from the history-aware LLM; this only decides whether tutor context is
+# worth prefetching before the classifier answers.
+_INTENT_KEYWORD_RE = re.compile(
+    r"\b(?:"
+    r"(?P<motivator>(?:need|want|give me)(?: some)? motivation|motivate me|pep talk|cheer me up|encourage me)"
+    r"|(?P<scheduler>schedul\w* (?:\w+ ){0,2}(?:sessions?|study|studying|time|revision)"
+    r"|pomodoros?|study (?:plan|schedule)|plan my (?:study|studying|week|sessions?))"
+    r"|(?P<analyzer>weak (?:points?|spots?|areas?)|analy[sz]e my (?:session|progress|study|studying)|how am i doing)"
+    r")\b",
+    re.IGNORECASE,
+)
+
+
+def fast_route(user_message: str) -> str | None:
     """
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    Guess a message's intent by keyword when it can only mean one intent.
 
-    # Format conversation history for context
-    history_text = _format_history(conversation_history, last_n=4)
+    Args:
+        user_message: Message to route
 
-    prompt = f"""You are an intelligent intent classifier for a study assistant.
+    Returns:
+        The intent, or None if no keyword matched or keywords of several intents did
+    """
+    intents = {match.lastgroup for match in _INTENT_KEYWORD_RE.finditer(user_message)}
+    return intents.pop() if len(intents) == 1 else None
+
+
+# Identical for every call and sent first, so OpenAI's automatic prompt
+# caching can reuse the prefix; everything per-turn goes in the user message.
+INTENT_SYSTEM_PROMPT = """You are an intelligent intent classifier for a study assistant.
 
 Analyze the user's message AND the conversation history to determine their intent.
 
@@ -86,29 +188,178 @@ IMPORTANT DISTINCTIONS:
 - "bye" at end of tutoring → analyzer (wrap up session)
 - "yes" after scheduling question → scheduler (confirming scheduling)
 
-CONVERSATION HISTORY:
-{history_text}
-
-CURRENT MESSAGE: "{user_message}"
-
 Based on the full context, what is the user's intent?
 Reply with ONE WORD only: tutor, scheduler, analyzer, or motivator"""
 
-    response = llm.invoke([SystemMessage(content=prompt)])
-    intent = response.content.strip().lower()
 
-    # Validate and default to tutor if invalid
-    if intent not in ["tutor", "scheduler", "analyzer", "motivator"]:
-        return "tutor"
+def _intent_input(user_message: str, history_text: str) -> str:
+    """Build the per-turn part of the classifier prompt: the history and the current message."""
+    return f'CONVERSATION HISTORY:\n{history_text}\n\nCURRENT MESSAGE: "{user_message}"'
+
+
+def _intent_messages(intent_input: str) -> list[BaseMessage]:
+    """Place the static system prompt first and the per-turn input last."""
+    return [SystemMessage(content=INTENT_SYSTEM_PROMPT), HumanMessage(content=intent_input)]
+
+
+def _parse_intent(reply: str) -> str:
+    """Normalize the classifier's reply, defaulting to tutor if it's not a known intent."""
+    intent = reply.strip().lower()
+    return intent if intent in INTENTS else "tutor"
+
 
+def classify_intent_with_llm(
+    user_message: str,
+    conversation_history: list[BaseMessage],
+    user_id: str = "default_user",
+) -> str:
+    """
+    Use LLM to classify user intent with full conversation context.
+
+    Returns: tutor, scheduler, analyzer, or motivator
+    """
+    # Format conversation history for context
+    history_text = _format_history(conversation_history, last_n=4)
+    intent_input = _intent_input(user_message, history_text)
+
+    key = prompt_key(INTENT_MODEL, intent_input)
+    intent = INTENT_CACHE.get(key)
+    if intent is None:
+        llm = _get_intent_classifier(openai_key_for(user_id))
+        intent = _parse_intent(llm.invoke(_intent_messages(intent_input)).content)
+        INTENT_CACHE.set(key, intent)
     return intent
 
 
+def classify_intents_with_llm(
+    user_messages: list[str],
+    conversation_history: list[BaseMessage] | None = None,
+    user_id: str = "default_user",
+    max_concurrency: int = 20,
+) -> list[str]:
+    """
+    Classify several messages against the same conversation history at once.
+
+    The requests run concurrently (up to ``max_concurrency`` in flight), so a
+    batch of independent messages, e.g. an evaluation set, costs roughly one
+    round-trip instead of one per message.
+
+    Args:
+        user_messages: Messages to classify
+        conversation_history: History shared by every message (defaults to none)
+        user_id: User identifier, used to pick the API key
+        max_concurrency: Maximum number of simultaneous OpenAI requests
+
+    Returns:
+        One intent per message, in input order
+    """
+    history_text = _format_history(conversation_history or [], last_n=4)
+    inputs = [_intent_input(message, history_text) for message in user_messages]
+    keys = [prompt_key(INTENT_MODEL, intent_input) for intent_input in inputs]
+    intents = [INTENT_CACHE.get(key) for key in keys]
+
+    misses = [i for i, intent in enumerate(intents) if intent is None]
+    if misses:
+        llm = _get_intent_classifier(openai_key_for(user_id))
+        responses = llm.batch(
+            [_intent_messages(inputs[i]) for i in misses], config={"max_concurrency": max_concurrency}
+        )
+        for i, response in zip(misses, responses):
+            intents[i] = _parse_intent(response.content)
+            INTENT_CACHE.set(keys[i], intents[i])
+    return intents
+
+
+INTENT_BULK_INSTRUCTIONS = """The user message is a JSON array of utterances, each classified independently
+against the conversation history above it. Reply with a JSON object of the form
+{"intents": [...]} holding exactly one intent per utterance, in the same order."""
+
+
+class IntentBatch(BaseModel):
+    """Structured reply of the bulk intent classifier."""
+
+    intents: list[str]
+
+
+def classify_intents_bulk(
+    user_messages: list[str],
+    conversation_history: list[BaseMessage] | None = None,
+    user_id: str = "default_user",
+) -> list[str]:
+    """
+    Classify several messages with a single JSON-mode request.
+
+    Sends the static classifier prompt once for all messages instead of once
+    per message. If the reply doesn't parse or has the wrong number of
+    labels, falls back to ``classify_intents_with_llm``.
+
+    Args:
+        user_messages: Messages to classify
+        conversation_history: History shared by every message (defaults to none)
+        user_id: User identifier, used to pick the API key
+
+    Returns:
+        One intent per message, in input order
+    """
+    if not user_messages:
+        return []
+
+    history_text = _format_history(conversation_history or [], last_n=4)
+    messages = [
+        SystemMessage(content=INTENT_SYSTEM_PROMPT),
+        SystemMessage(content=INTENT_BULK_INSTRUCTIONS),
+        HumanMessage(
+            content=f"CONVERSATION HISTORY:\n{history_text}\n\nUTTERANCES: {json.dumps(user_messages, ensure_ascii=False)}"
+        ),
+    ]
+
+    llm = _get_intent_classifier(openai_key_for(user_id)).bind(response_format={"type": "json_object"})
+    try:
+        batch = IntentBatch.model_validate_json(llm.invoke(messages).content)
+    except ValidationError as e:
+        logger.warning("Bulk intent reply didn't parse, classifying one by one: %s", e)
+        return classify_intents_with_llm(user_messages, conversation_history, user_id)
+
+    if len(batch.intents) != len(user_messages):
+        logger.warning("Bulk intent reply had %d labels for %d messages", len(batch.intents), len(user_messages))
+        return classify_intents_with_llm(user_messages, conversation_history, user_id)
+    return [_parse_intent(intent) for intent in batch.intents]
+
+
 # =============================================================================
 # NODE 1: Intent Router - Figures out what the user wants
 # =============================================================================
 
 
+# Static state updates per classified intent; the router copies an entry and
+# adds per-turn values (the scheduler's pending request) on top.
+_INTENT_STATE_UPDATES: dict[str, dict] = {
+    "tutor": {
+        "current_intent": "tutor",
+        "next_agent": "tutor",
+        "session_mode": "active_tutoring",
+        "tutor_session_active": True,
+    },
+    "scheduler": {
+        "current_intent": "schedule",
+        "next_agent": "scheduler",
+        "session_mode": "scheduling_requested",
+    },
+    "analyzer": {
+        "current_intent": "analyze",
+        "next_agent": "analyzer",
+        "session_mode": "analysis_requested",
+        "tutor_session_active": False,
+    },
+    "motivator": {
+        "current_intent": "motivate",
+        "next_agent": "motivator",
+        "needs_motivation": True,
+        "session_mode": "motivation_requested",
+    },
+}
+
+
 def intent_router_node(state: StudyPalState) -> dict:
     """
     Figure out what the user wants using ONLY LLM reasoning.
@@ -149,41 +400,47 @@ def intent_router_node(state: StudyPalState) -> dict:
         }
 
     user_text = last_user_message.content.strip()
+    user_id = state.get("user_id", "default_user")
+
+    # Retrieval only needs the question, not the intent: on likely tutor turns
+    # start it now so the embedding call overlaps classification and the tutor
+    # node hits the cache
+    prefetch = None
+    if _likely_tutor_turn(state, user_text):
+        prefetch = _BACKGROUND_POOL.submit(_prefetch_tutor_context, user_id, user_text)
 
     # Use LLM to classify intent (with full conversation context)
     logger.info("   Using LLM for classification...")
-    intent = classify_intent_with_llm(user_text, state["messages"])
+    intent = classify_intent_with_llm(user_text, state["messages"], user_id)
     logger.info(f"   Detected: {intent}")
 
-    # Map intent to next_agent and state updates
-    intent_map = {
-        "tutor": {
-            "current_intent": "tutor",
-            "next_agent": "tutor",
-            "session_mode": "active_tutoring",
-            "tutor_session_active": True,
-        },
-        "scheduler": {
-            "current_intent": "schedule",
-            "next_agent": "scheduler",
-            "session_mode": "scheduling_requested",
-            "pending_schedule_request": user_text,
-        },
-        "analyzer": {
-            "current_intent": "analyze",
-            "next_agent": "analyzer",
-            "session_mode": "analysis_requested",
-            "tutor_session_active": False,
-        },
-        "motivator": {
-            "current_intent": "motivate",
-            "next_agent": "motivator",
-            "needs_motivation": True,
-            "session_mode": "motivation_requested",
-        },
-    }
+    if prefetch is not None:
+        if intent != "tutor":
+            prefetch.cancel()
+        else:
+            try:
+                prefetch.result()
+            except Exception as exc:
+                logger.debug("Context prefetch failed (tutor will retry): %s", exc)
+
+    updates = dict(_INTENT_STATE_UPDATES.get(intent, _INTENT_STATE_UPDATES["tutor"]))
+    if intent == "scheduler":
+        updates["pending_schedule_request"] = user_text
+    return updates
+
 
-    return intent_map.get(intent, intent_map["tutor"])
+def _likely_tutor_turn(state: StudyPalState, user_text: str) -> bool:
+    """Guess, before classification, whether this turn will reach the tutor."""
+    if state.get("awaiting_schedule_confirmation") or state.get("awaiting_schedule_details"):
+        return False
+    return bool(state.get("tutor_session_active")) or fast_route(user_text) is None
+
+
+def _prefetch_tutor_context(user_id: str, question: str) -> None:
+    """Warm the user's RAG query cache with the context the tutor node will ask for."""
+    from core.rag_pipeline import get_rag_pipeline
+
+    get_rag_pipeline(user_id=user_id).run_query(question, k=TUTOR_CONTEXT_K)
 
 
 # =============================================================================
@@ -191,6 +448,90 @@ def intent_router_node(state: StudyPalState) -> dict:
 # =============================================================================
 
 
+# Kept free of per-request values so the prefix is byte-identical across calls
+# and eligible for OpenAI's automatic prompt caching; student-specific details
+# go in the user message instead.
+TUTOR_SYSTEM_PROMPT = """You are a friendly AI tutor assistant that teaches from the student's uploaded study materials.
+
+CRITICAL RULES - YOU MUST FOLLOW THESE:
+1. ONLY answer questions based on the provided context from study materials
+2. EXCEPTIONS - You CAN respond naturally to these types of messages:
+   - Greetings (e.g., "hello", "hi", "how are you?") → Reply warmly and ask if they're ready to study
+   - Expressions of confusion (e.g., "I don't understand", "I'm lost") → Reassure them and offer simpler explanations
+   - Motivation requests (e.g., "motivate me") → Encourage them briefly, then refocus on studying
+3. For ALL other questions: If the context does NOT contain information to answer, you MUST say:
+   "I cannot answer this question based on your study materials. Please ask about topics covered in your uploaded PDFs."
+4. NEVER use your general knowledge for factual questions
+5. NEVER hallucinate or invent facts not in the context
+6. If you're unsure, say you don't have enough information in the materials
+
+WHAT YOU CAN DO WHEN CONTEXT IS AVAILABLE:
+- Answer questions based STRICTLY on the provided context
+- Quote relevant parts from the context when possible
+- Create quizzes based on the context
+- Grade quiz answers based on the study materials
+- Be encouraging and supportive about the material they're learning
+- Use the recent conversation history to maintain context and continuity
+- If context has formatting issues, interpret it as best you can
+
+Remember: Your job is to help students learn ONLY from their uploaded materials. Be friendly for greetings and encouragement, but strict about staying on topic for actual learning content."""
+
+
+TUTOR_MODEL = "gpt-4o-mini"
+TUTOR_TEMPERATURE = 0.7
+
+NO_MATERIALS_ANSWER = "I don't have any study materials loaded yet. Please upload a PDF using /ingest command first."
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tutor_llm(api_key: str | None = None) -> ChatOpenAI:
+    """Build the tutor's answering model once per API key and reuse it for every turn."""
+    return ChatOpenAI(model=TUTOR_MODEL, temperature=TUTOR_TEMPERATURE, **_chat_model_kwargs(api_key))
+
+
+def build_tutor_messages(
+    question: str,
+    context: list[str],
+    recent_messages: list[BaseMessage],
+    user_name: str = "there",
+) -> list[BaseMessage]:
+    """
+    Assemble the tutor's prompt for one question.
+
+    Args:
+        question: The student's message
+        context: Retrieved study-material chunks
+        recent_messages: Earlier turns to include as conversation history
+        user_name: Student's name
+
+    Returns:
+        Messages ready to send to the tutor model
+    """
+    context_text = "\n\n".join([f"[Chunk {i + 1}]\n{chunk}" for i, chunk in enumerate(context)])
+
+    # Order from most to least stable so consecutive turns share a long
+    # prompt prefix (static rules, student, earlier turns) that OpenAI can
+    # serve from its prompt cache; per-question RAG context goes last.
+    history = [
+        HumanMessage(content=msg.content) if isinstance(msg, HumanMessage) else AIMessage(content=msg.content)
+        for msg in recent_messages
+    ]
+
+    user_message = f"""Context from study materials:
+{context_text}
+
+Student's current message: {question}
+
+Please respond based on the context and conversation history above."""
+
+    return [
+        SystemMessage(content=TUTOR_SYSTEM_PROMPT),
+        SystemMessage(content=f"Student's name: {user_name}"),
+        *history,
+        HumanMessage(content=user_message),
+    ]
+
+
 def tutor_agent_node(state: StudyPalState) -> dict:
     """
     Answer user's questions using the RAG-powered tutor.
@@ -238,7 +579,7 @@ def tutor_agent_node(state: StudyPalState) -> dict:
 
     # Get context and generate response
     try:
-        context = tutor.get_context(question, k=5)
+        context = tutor.get_context(question, k=TUTOR_CONTEXT_K)
         logger.info(f"   📚 Retrieved {len(context)} context chunks")
         if context:
             logger.info(f"   First chunk: {context[0][:100]}...")
@@ -247,62 +588,19 @@ def tutor_agent_node(state: StudyPalState) -> dict:
         context = []
 
     if context:
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
-        context_text = "\n\n".join([f"[Chunk {i + 1}]\n{chunk}" for i, chunk in enumerate(context)])
-
-        conversation_history = ""
+        llm = _get_tutor_llm(openai_key_for(user_id))
         recent_messages = state["messages"][-7:-1] if len(state["messages"]) > 1 else []
-        if recent_messages:
-            conversation_history = "\n\nRecent conversation:\n"
-            for msg in recent_messages:
-                role = "Student" if isinstance(msg, HumanMessage) else "Tutor"
-                conversation_history += f"{role}: {msg.content}\n"
-
-        system_message = f"""You are a friendly AI tutor assistant that teaches from the student's uploaded study materials.
-
-CRITICAL RULES - YOU MUST FOLLOW THESE:
-1. ONLY answer questions based on the provided context from study materials
-2. EXCEPTIONS - You CAN respond naturally to these types of messages:
-   - Greetings (e.g., "hello", "hi", "how are you?") → Reply warmly and ask if they're ready to study
-   - Expressions of confusion (e.g., "I don't understand", "I'm lost") → Reassure them and offer simpler explanations
-   - Motivation requests (e.g., "motivate me") → Encourage them briefly, then refocus on studying
-3. For ALL other questions: If the context does NOT contain information to answer, you MUST say:
-   "I cannot answer this question based on your study materials. Please ask about topics covered in your uploaded PDFs."
-4. NEVER use your general knowledge for factual questions
-5. NEVER hallucinate or invent facts not in the context
-6. If you're unsure, say you don't have enough information in the materials
-
-WHAT YOU CAN DO WHEN CONTEXT IS AVAILABLE:
-- Answer questions based STRICTLY on the provided context
-- Quote relevant parts from the context when possible
-- Create quizzes based on the context
-- Grade quiz answers based on the study materials
-- Be encouraging and supportive about the material they're learning
-- Use the recent conversation history to maintain context and continuity
-- If context has formatting issues, interpret it as best you can
-
-Student's name: {state.get("user_name", "there")}
-
-Remember: Your job is to help students learn ONLY from their uploaded materials. Be friendly for greetings and encouragement, but strict about staying on topic for actual learning content."""
-
-        user_message = f"""Context from study materials:
-{context_text}
-{conversation_history}
-
-Student's current message: {question}
-
-Please respond based on the context and conversation history above."""
-
-        messages = [
-            SystemMessage(content=system_message),
-            HumanMessage(content=user_message),
-        ]
+        messages = build_tutor_messages(question, context, recent_messages, state.get("user_name", "there"))
 
         response = llm.invoke(messages)
         answer = response.content
         logger.info(f"   ✓ Generated answer: {answer[:50]}...")
+        usage = response.response_metadata.get("token_usage") or {}
+        cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+        if cached_tokens is not None:
+            logger.debug("   Prompt cache: %s of %s prompt tokens cached", cached_tokens, usage.get("prompt_tokens"))
     else:
-        answer = "I don't have any study materials loaded yet. Please upload a PDF using /ingest command first."
+        answer = NO_MATERIALS_ANSWER
         logger.info("   ⚠️  No study materials available")
 
     # Update the current topic if we can extract it
@@ -338,8 +636,6 @@ def scheduler_agent_node(state: StudyPalState) -> dict:
     """
     logger.info("📅 Scheduler Agent: Creating study plan...")
 
-    import re
-
     from agents.scheduler_agent import SchedulerAgent
     from core.google_calendar import GoogleCalendarClient
 
@@ -352,14 +648,11 @@ def scheduler_agent_node(state: StudyPalState) -> dict:
     awaiting_confirmation = state.get("awaiting_schedule_confirmation", False)
     awaiting_details = state.get("awaiting_schedule_details", False)
 
-    affirmative_words = {"yes", "yeah", "yep", "sure", "affirmative", "please", "ok", "okay", "definitely"}
-    negative_words = {"no", "nope", "nah", "cancel", "not now", "later", "stop"}
-
     normalized = user_input.lower().strip()
 
     if awaiting_confirmation:
         logger.info("   Handling schedule confirmation response")
-        if any(word in normalized.split() for word in affirmative_words) or normalized in affirmative_words:
+        if not _AFFIRMATIVE_WORDS.isdisjoint(normalized.split()) or normalized in _AFFIRMATIVE_WORDS:
             message = (
                 "Great! When would you like your next study session? "
                 'Please share a specific day and time window (e.g., "Tuesday 14:00-16:00").'
@@ -375,7 +668,7 @@ def scheduler_agent_node(state: StudyPalState) -> dict:
                 "current_agent_avatar": get_agent_avatar("scheduler"),
             }
 
-        if any(word in normalized for word in negative_words):
+        if _NEGATIVE_RE.search(normalized):
             message = "No problem! If you change your mind, just let me know and we can plan the next session together."
             return {
                 "messages": [AIMessage(content=message)],
@@ -402,7 +695,7 @@ def scheduler_agent_node(state: StudyPalState) -> dict:
     if awaiting_details:
         logger.info("   Collecting schedule details from user")
 
-        if any(word in normalized for word in negative_words):
+        if _NEGATIVE_RE.search(normalized):
             message = "All right! We can plan another time whenever you're ready."
             return {
                 "messages": [AIMessage(content=message)],
@@ -415,22 +708,8 @@ def scheduler_agent_node(state: StudyPalState) -> dict:
                 "current_agent_avatar": get_agent_avatar("scheduler"),
             }
 
-        day_keywords = [
-            "monday",
-            "tuesday",
-            "wednesday",
-            "thursday",
-            "friday",
-            "saturday",
-            "sunday",
-            "today",
-            "tomorrow",
-            "tonight",
-            "weekend",
-        ]
-        has_day_reference = any(day in normalized for day in day_keywords)
-        time_pattern = re.compile(r"\b\d{1,2}(:\d{2})?\s*(am|pm)?\b|\b\d{1,2}\s*[-:to]{1,3}\s*\d{1,2}", re.IGNORECASE)
-        has_time_reference = bool(time_pattern.search(normalized))
+        has_day_reference = bool(_DAY_REFERENCE_RE.search(normalized))
+        has_time_reference = bool(_TIME_REFERENCE_RE.search(normalized))
 
         if not (has_day_reference and has_time_reference):
             message = (
@@ -451,8 +730,7 @@ def scheduler_agent_node(state: StudyPalState) -> dict:
     # Check if user is responding "yes" to sync an existing schedule
     if state.get("generated_schedule") is not None:
         # Check if user wants to sync
-        affirmative_words = ["yes", "yeah", "sure", "ok", "okay", "y", "yep", "please", "sync"]
-        if any(word in user_input.lower() for word in affirmative_words):
+        if _SYNC_CONFIRM_RE.search(user_input.lower()):
             logger.info("   User confirmed calendar sync")
 
             # Sync to calendar
@@ -460,9 +738,12 @@ def scheduler_agent_node(state: StudyPalState) -> dict:
             scheduler = SchedulerAgent(calendar_connector=calendar_connector)
 
             try:
-                scheduler.sync_schedule(state["generated_schedule"])
-                response = "✅ Great! I've synced your study schedule to your calendar. You should see the events appear shortly!"
-                logger.info("   ✓ Successfully synced schedule to calendar")
+                # One calendar API call per study block; create them in the
+                # background instead of making the user wait for every event
+                sync = _BACKGROUND_POOL.submit(scheduler.sync_schedule, state["generated_schedule"])
+                sync.add_done_callback(_log_calendar_sync_result)
+                response = "✅ Great! I'm syncing your study schedule to your calendar. You should see the events appear shortly!"
+                logger.info("   ✓ Calendar sync started")
 
                 return {
                     "messages": [AIMessage(content=response)],
@@ -510,22 +791,23 @@ def scheduler_agent_node(state: StudyPalState) -> dict:
 
     # === INJECT WEAK POINT TOPICS INTO USER INPUT IF NO SUBJECTS SPECIFIED ===
     # Check if user mentioned specific subjects
-    has_subject_keywords = any(word in user_input.lower() for word in ["study", "focus", "subject", "topic"])
+    has_subject_keywords = _SUBJECT_KEYWORD_RE.search(user_input.lower()) is not None
 
     # If no subjects mentioned AND we have weak points, inject them
     if not has_subject_keywords and prioritized_recommendations:
         weak_topics = []
         if hasattr(prioritized_recommendations, "__iter__"):
-            # It's a list of WeakPoint objects or dicts
-            for wp in prioritized_recommendations:
-                if hasattr(wp, "topic"):
-                    weak_topics.append(wp.topic)
-                elif isinstance(wp, dict) and "topic" in wp:
-                    weak_topics.append(wp["topic"])
+            # It's a list of WeakPoint objects or dicts; stop after the top 3 weak points
+            topics = (
+                wp.topic if hasattr(wp, "topic") else wp["topic"]
+                for wp in prioritized_recommendations
+                if hasattr(wp, "topic") or (isinstance(wp, dict) and "topic" in wp)
+            )
+            weak_topics = list(itertools.islice(topics, 3))
 
         if weak_topics:
             # Add weak point topics to user input for scheduler parsing
-            topics_str = ", ".join(weak_topics[:3])  # Use top 3 weak points
+            topics_str = ", ".join(weak_topics)
             user_input += f" studying {topics_str}"
             logger.info(f"   Injected weak point topics into schedule: {topics_str}")
         else:
@@ -545,13 +827,7 @@ def scheduler_agent_node(state: StudyPalState) -> dict:
     # === CHECK CALENDAR AVAILABILITY (if configured) ===
     conflict_warning = ""
     try:
-        import re as _re
-
-        time_pattern = _re.compile(
-            r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*(?:-|to)\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?",
-            _re.IGNORECASE,
-        )
-        time_match = time_pattern.search(user_input)
+        time_match = _TIME_RANGE_RE.search(user_input)
         date_str = context.get("date")
 
         if time_match and date_str and hasattr(calendar_connector, "list_events"):
@@ -655,6 +931,15 @@ def scheduler_agent_node(state: StudyPalState) -> dict:
         }
 
 
+def _log_calendar_sync_result(future: Future) -> None:
+    """Report the outcome of a background calendar sync."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error("   ❌ Calendar sync error: %s", exc)
+    else:
+        logger.info("   ✓ Successfully synced schedule to calendar")
+
+
 # =============================================================================
 # NODE 4: Analyzer Agent - Finds weak points
 # =============================================================================
@@ -692,7 +977,7 @@ def analyzer_agent_node(state: StudyPalState) -> dict:
         }
 
     # Analyze with weakness detector
-    detector = WeaknessDetectorAgent(model="gpt-4o-mini")
+    detector = WeaknessDetectorAgent.get("gpt-4o-mini")
 
     try:
         result = detector.analyze_conversation(state["messages"], session_topic=state.get("current_topic"))
@@ -763,34 +1048,35 @@ def motivator_agent_node(state: StudyPalState) -> dict:
     """
     logger.info("💪 Motivator Agent: Crafting motivation...")
 
-    from pathlib import Path
-
     from agents.motivator_agent import MotivatorAgent, OpenAIMotivationModel
     from agents.user_profile import UserProfile, UserProfileStore
 
     try:
         # Load user profile store
-        profile_store = UserProfileStore(Path("data/profiles"))
+        profile_store = UserProfileStore(PROFILES_DIR)
 
         # Hydrate profile preferences from workflow state if provided
         user_profile_data = state.get("user_profile") or {}
-        profile = None
-        if profile_store:
-            try:
-                profile = profile_store.load(state["user_id"])
-            except FileNotFoundError:
-                profile = UserProfile(user_id=state["user_id"], name=state["user_id"])
-
-            if profile:
-                preferred_persona = user_profile_data.get("favorite_persona")
-                preferred_name = user_profile_data.get("name")
-
-                if preferred_persona:
-                    profile.primary_persona = preferred_persona
-                if preferred_name:
-                    profile.name = preferred_name
-
-                profile_store.save(profile)
+        try:
+            profile = profile_store.load(state["user_id"])
+            profile_changed = False
+        except FileNotFoundError:
+            profile = UserProfile(user_id=state["user_id"], name=state["user_id"])
+            profile_changed = True
+
+        preferred_persona = user_profile_data.get("favorite_persona")
+        preferred_name = user_profile_data.get("name")
+
+        if preferred_persona and preferred_persona != profile.primary_persona:
+            profile.primary_persona = preferred_persona
+            profile_changed = True
+        if preferred_name and preferred_name != profile.name:
+            profile.name = preferred_name
+            profile_changed = True
+
+        # Only hit the disk when the profile is new or the state overrides changed it
+        if profile_changed:
+            profile_store.save(profile)
 
         # Create motivator
         motivator = MotivatorAgent(profile_store=profile_store, llm=OpenAIMotivationModel())
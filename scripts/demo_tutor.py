@@ -2,21 +2,34 @@
 
 from __future__ import annotations
 
+import functools
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to sys.path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from typing import TYPE_CHECKING
+
 from dotenv import load_dotenv
 
-from agents import TutorAgent
-from agents.onboarding import create_onboarding_agent
-from agents.tutor_chatbot import ChatInterface, TutorChatbot
-from agents.user_profile import UserProfileStore
-from core.rag_pipeline import get_rag_pipeline
+# Agent, RAG and LangChain modules are imported inside the commands that need
+# them, so `--help` and typos print usage without paying seconds of imports
+if TYPE_CHECKING:
+    from agents import TutorAgent
+
+PROFILES_DIR = Path("data/profiles")
+HELP_FLAGS = frozenset({"-h", "--help", "help"})
+
 
-load_dotenv(override=True)
+@functools.lru_cache(maxsize=8)
+def _get_tutor(user_id: str = "demo_user") -> TutorAgent:
+    """Return a TutorAgent for the user, built once per process."""
+    from agents import TutorAgent
+    from core.rag_pipeline import get_rag_pipeline
+
+    return TutorAgent(rag_pipeline=get_rag_pipeline(user_id=user_id))
 
 
 def demo_tutor_agent():
@@ -25,9 +38,8 @@ def demo_tutor_agent():
     print("🎓 TUTOR AGENT DEMO - RAG-Powered Study Assistant")
     print("=" * 60 + "\n")
 
-    # Initialize RAG pipeline for tutor (demo user)
-    rag_pipeline = get_rag_pipeline(user_id="demo_user")
-    tutor = TutorAgent(rag_pipeline=rag_pipeline)
+    # Reuse the cached tutor for the demo user
+    tutor = _get_tutor("demo_user")
 
     # Check if we have the test PDF
     test_pdf = Path("tests/fixtures/calculus_sample.pdf")
@@ -46,11 +58,24 @@ def demo_tutor_agent():
     total_chunks = tutor.count_materials()
     print(f"   Total chunks in knowledge base: {total_chunks}\n")
 
+    question = "What is a derivative?"
+    topics = [
+        ("integrals", "Tell me about integrals"),
+        ("limits", "What are limits in calculus?"),
+    ]
+
+    # Steps 3-5 only read the knowledge base and each waits on the embeddings
+    # API, so issue them together and print the results in step order
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        context_future = executor.submit(tutor.get_context, question, k=2)
+        quiz_future = executor.submit(tutor.generate_quiz, "derivatives", num_questions=3)
+        # One embedding request and one index query for all topics
+        contexts_future = executor.submit(tutor.get_contexts, [query for _, query in topics], k=1)
+
     # 3. Retrieve context for a question
     print("🔍 Step 3: Retrieving context for a question...")
-    question = "What is a derivative?"
     print(f"   Question: '{question}'")
-    context = tutor.get_context(question, k=2)
+    context = context_future.result()
     print(f"   Retrieved {len(context)} relevant snippets:")
     for i, snippet in enumerate(context, 1):
         print(f"   [{i}] {snippet[:100]}..." if len(snippet) > 100 else f"   [{i}] {snippet}")
@@ -58,7 +83,7 @@ def demo_tutor_agent():
 
     # 4. Generate a quiz
     print("📝 Step 4: Generating quiz on derivatives...")
-    quiz = tutor.generate_quiz("derivatives", num_questions=3)
+    quiz = quiz_future.result()
     print(f"   Generated {len(quiz)} quiz item(s):")
     for i, item in enumerate(quiz, 1):
         print(f"\n   Question {i}:")
@@ -69,15 +94,11 @@ def demo_tutor_agent():
 
     # 5. Try different topics
     print("🔍 Step 5: Testing context retrieval for different topics...")
-    topics = [
-        ("integrals", "Tell me about integrals"),
-        ("limits", "What are limits in calculus?"),
-    ]
+    contexts = contexts_future.result()
 
-    for topic, query in topics:
+    for (topic, query), context in zip(topics, contexts):
         print(f"\n   Topic: {topic}")
         print(f"   Query: '{query}'")
-        context = tutor.get_context(query, k=1)
         if context:
             preview = context[0][:80] + "..." if len(context[0]) > 80 else context[0]
             print(f"   → {preview}")
@@ -91,10 +112,13 @@ def demo_tutor_agent():
 
 def run_onboarding(user_id: str = "default_user"):
     """Run the onboarding flow for a new user."""
+    from agents.onboarding import create_onboarding_agent
+    from agents.user_profile import UserProfileStore
+
     print(f"\n🎯 Starting onboarding for user: {user_id}")
 
     # Check if profile already exists
-    profile_store = UserProfileStore(Path("data/profiles"))
+    profile_store = UserProfileStore(PROFILES_DIR)
     try:
         existing_profile = profile_store.load(user_id)
         print(f"\n⚠️  Profile already exists for '{user_id}'")
@@ -113,10 +137,10 @@ def run_onboarding(user_id: str = "default_user"):
         pass  # No existing profile, proceed with onboarding
 
     # Create and run onboarding agent
-    onboarding_agent = create_onboarding_agent()
+    onboarding_agent = create_onboarding_agent(PROFILES_DIR)
     try:
         profile = onboarding_agent.run_onboarding(user_id)
-        print(f"✅ Profile saved to: data/profiles/{user_id}.json\n")
+        print(f"✅ Profile saved to: {PROFILES_DIR / user_id}.json\n")
         return profile
     except KeyboardInterrupt:
         print("\n\n👋 Onboarding interrupted. You can try again anytime.\n")
@@ -133,7 +157,9 @@ def check_and_load_profile(user_id: str = "default_user") -> bool:
     Returns:
         True if profile exists, False otherwise
     """
-    profile_store = UserProfileStore(Path("data/profiles"))
+    from agents.user_profile import UserProfileStore
+
+    profile_store = UserProfileStore(PROFILES_DIR)
     try:
         profile = profile_store.load(user_id)
         print(f"✅ Loaded profile for {profile.name}")
@@ -147,6 +173,8 @@ def check_and_load_profile(user_id: str = "default_user") -> bool:
 
 def start_chatbot(user_id: str = "default_user", use_langgraph: bool = True):
     """Start the interactive chatbot."""
+    from agents.tutor_chatbot import ChatInterface, TutorChatbot
+
     # Check for user profile
     if not check_and_load_profile(user_id):
         print(f"\n⚠️  No profile found for user '{user_id}'")
@@ -170,9 +198,8 @@ def start_chatbot(user_id: str = "default_user", use_langgraph: bool = True):
         print("🚀 Starting Study Pal Chatbot (Legacy Mode)...")
         print("   Initializing RAG pipeline and AI tutor...\n")
 
-        # Initialize RAG pipeline and tutor agent (user-specific)
-        rag_pipeline = get_rag_pipeline(user_id=user_id)
-        tutor_agent = TutorAgent(rag_pipeline=rag_pipeline)
+        # Reuse the user's tutor agent (and its RAG pipeline) if already built
+        tutor_agent = _get_tutor(user_id)
 
         # Create chatbot
         chatbot = TutorChatbot(tutor_agent=tutor_agent)
@@ -182,8 +209,31 @@ def start_chatbot(user_id: str = "default_user", use_langgraph: bool = True):
         chat_interface.run()
 
 
+def print_usage() -> None:
+    """Print the available command-line options."""
+    print("\n📖 Study Pal - Available commands:")
+    print("   python main.py --onboard [user_id]   # Create/update user profile")
+    print("   python main.py --chat [user_id]      # Start interactive chatbot")
+    print("   python main.py --tutor-demo          # Demo TutorAgent with RAG")
+    print("   python main.py --help                # Show this message")
+    print("\n   [user_id] is optional and defaults to 'default_user'")
+
+
+COMMANDS = {
+    "--onboard": run_onboarding,
+    "--chat": start_chatbot,
+    "--tutor-demo": lambda _user_id: demo_tutor_agent(),
+}
+
+
 if __name__ == "__main__":
-    import sys
+    # Fast path: help requests never need the environment or any agent modules
+    if len(sys.argv) > 1 and sys.argv[1] in HELP_FLAGS:
+        print_usage()
+        sys.exit(0)
+
+    # Load .env only when run as a script; values already in the environment win
+    load_dotenv()
 
     # Get user_id if provided
     user_id = "default_user"
@@ -194,24 +244,13 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         command = sys.argv[1]
 
-        if command == "--onboard":
-            run_onboarding(user_id)
-        elif command == "--chat":
-            start_chatbot(user_id)
-        elif command == "--tutor-demo":
-            demo_tutor_agent()
+        handler = COMMANDS.get(command)
+        if handler is not None:
+            handler(user_id)
         else:
             print(f"❌ Unknown command: {command}")
-            print("\n📖 Study Pal - Available commands:")
-            print("   python main.py --onboard [user_id]   # Create/update user profile")
-            print("   python main.py --chat [user_id]      # Start interactive chatbot")
-            print("   python main.py --tutor-demo          # Demo TutorAgent with RAG")
-            print("\n   [user_id] is optional and defaults to 'default_user'")
+            print_usage()
     else:
-        print("\n📖 Study Pal - Available commands:")
-        print("   python main.py --onboard [user_id]   # Create/update user profile")
-        print("   python main.py --chat [user_id]      # Start interactive chatbot")
-        print("   python main.py --tutor-demo          # Demo TutorAgent with RAG")
-        print("\n   [user_id] is optional and defaults to 'default_user'")
+        print_usage()
         print("\nDefaulting to chatbot...\n")
         start_chatbot(user_id)
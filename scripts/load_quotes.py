@@ -4,21 +4,20 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
-from agents.quote_store import Quote, QuoteStore
+from agents.quote_store import QUOTES_ADAPTER, QuoteStore
+
+SEED_PATH = Path("data/quotes_seed.json")
+STORE_PATH = Path("data/quotes_store.json")
 
 
 def load_quotes(seed_path: Path, store_path: Path, persist: bool = True) -> int:
-    data = json.loads(seed_path.read_text(encoding="utf-8"))
-    quotes = [Quote.model_validate(item) for item in data]
+    # Validates straight from JSON bytes in pydantic-core, without building an
+    # intermediate list of dicts first
+    quotes = QUOTES_ADAPTER.validate_json(seed_path.read_bytes())
 
-    store = QuoteStore(store_path)
-    before_count = len(store.all())
-    store.add(quotes, persist=persist)
-    after_count = len(store.all())
-    return after_count - before_count
+    return QuoteStore(store_path).add(quotes, persist=persist)
 
 
 def main() -> None:
@@ -26,13 +25,13 @@ def main() -> None:
     parser.add_argument(
         "--seed",
         type=Path,
-        default=Path("data/quotes_seed.json"),
+        default=SEED_PATH,
         help="Path to the seed JSON file.",
     )
     parser.add_argument(
         "--store",
         type=Path,
-        default=Path("data/quotes_store.json"),
+        default=STORE_PATH,
         help="Path to the output quote store file.",
     )
     args = parser.parse_args()
@@ -8,11 +8,15 @@ Usage:
     4. After authorizing, a token is saved to data/google_token.json
 """
 
-import json
 import os
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 # Load .env if python-dotenv is available
 try:
     from dotenv import load_dotenv
@@ -51,8 +55,12 @@ def main() -> None:
     }
 
     Path(credentials_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(credentials_path, "w") as f:
-        json.dump(credentials_data, f, indent=2)
+    if orjson is not None:
+        Path(credentials_path).write_bytes(orjson.dumps(credentials_data, option=orjson.OPT_INDENT_2))
+    else:
+        import json
+
+        Path(credentials_path).write_text(json.dumps(credentials_data, indent=2))
     print(f"Created {credentials_path}")
 
     # Run OAuth flow
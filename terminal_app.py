@@ -4,7 +4,8 @@ Run this if Gradio is causing issues.
 """
 
 import logging
-import os
+import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -28,36 +29,71 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-print("=" * 70)
-print("  🎓 STUDY PAL - Terminal Interface")
-print("=" * 70)
-print(f"\n📝 Logging to: {log_filename}")
-print("\nInitializing chatbot...")
+# Piped runs (`python terminal_app.py < inputs.txt`) read stdin directly
+# instead of paying input()'s prompt/readline handling on every line
+INTERACTIVE = sys.stdin.isatty()
+
+
+def read_line(prompt: str) -> str:
+    """Read one line of user input, prompting only when attached to a terminal."""
+    if INTERACTIVE:
+        return input(prompt)
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+RULE = "=" * 70
+
+print(
+    f"{RULE}\n  🎓 STUDY PAL - Terminal Interface\n{RULE}\n\n📝 Logging to: {log_filename}\n\nInitializing chatbot..."
+)
 logger.info("Starting Study Pal Terminal Interface")
 
-try:
+
+def warm_up() -> None:
+    """Import the chatbot stack and open the OpenAI connection."""
     logger.info("Importing LangGraphChatbot...")
-    from core.langgraph_chatbot import LangGraphChatbot
+    import core.langgraph_chatbot  # noqa: F401
+    from core.http import warm_openai_connection
 
     logger.info("✓ Import successful")
+    warm_openai_connection()
+
+
+try:
+    # Warm up while the user is typing their name instead of before asking
+    warmup = threading.Thread(target=warm_up, daemon=True)
+    warmup.start()
 
     # Create chatbot instance
-    user_id = input("\nEnter your username (or press Enter for 'demo_user'): ").strip() or "demo_user"
-    logger.info(f"Creating chatbot for user: {user_id}")
-    chatbot = LangGraphChatbot(user_id=user_id, session_id=user_id)
-    logger.info(f"✓ Chatbot initialized for user: {user_id}")
+    user_id = read_line("\nEnter your username (or press Enter for 'demo_user'): ").strip() or "demo_user"
+    # Waits only for the warm-up thread's import, not its network call; the
+    # connection keeps warming in the background
+    from core.langgraph_chatbot import LangGraphChatbot
 
-    print(f"\n✅ Chatbot initialized for user: {user_id}")
-    print("\nCommands:")
-    print("  - Type your question or message")
-    print("  - Type 'upload' to upload a PDF")
-    print("  - Type 'clear' to clear conversation")
-    print("  - Type 'quit' or 'exit' to exit")
-    print("\n" + "=" * 70 + "\n")
+    logger.info("Creating chatbot for user: %s", user_id)
+    chatbot = LangGraphChatbot(user_id=user_id, session_id=user_id)
+    logger.info("✓ Chatbot initialized for user: %s", user_id)
+
+    print(
+        "".join(
+            [
+                f"\n✅ Chatbot initialized for user: {user_id}\n",
+                "\nCommands:\n",
+                "  - Type your question or message\n",
+                "  - Type 'upload' to upload a PDF\n",
+                "  - Type 'clear' to clear conversation\n",
+                "  - Type 'quit' or 'exit' to exit\n",
+                f"\n{RULE}\n",
+            ]
+        )
+    )
 
     while True:
         try:
-            user_input = input("You: ").strip()
+            user_input = read_line("You: ").strip()
 
             if not user_input:
                 continue
@@ -70,34 +106,39 @@ try:
             if user_input.lower() == "clear":
                 logger.info("Clearing conversation")
                 result = chatbot.clear_conversation()
-                logger.info(f"Conversation cleared: {result}")
+                logger.info("Conversation cleared: %s", result)
                 print(f"\n✅ {result}\n")
                 continue
 
             if user_input.lower() == "upload":
-                file_path = input("Enter path to PDF file: ").strip()
-                logger.info(f"Upload requested: {file_path}")
-                if os.path.exists(file_path):
-                    try:
-                        result = chatbot.ingest_material(Path(file_path))
-                        count = chatbot.get_materials_count()
-                        logger.info(f"Upload successful: {result}, Total chunks: {count}")
-                        print(f"\n✅ {result}")
-                        print(f"📊 Total chunks: {count}\n")
-                    except Exception as e:
-                        logger.error(f"Upload failed: {e}", exc_info=True)
-                        print(f"\n❌ Error uploading file: {e}\n")
-                else:
-                    logger.warning(f"File not found: {file_path}")
+                file_path = read_line("Enter path to PDF file: ").strip()
+                logger.info("Upload requested: %s", file_path)
+                # Ingestion reports a missing file itself; ask forgiveness instead
+                # of stat-ing the path here first
+                try:
+                    result = chatbot.ingest_material(Path(file_path))
+                except FileNotFoundError:
+                    logger.warning("File not found: %s", file_path)
                     print(f"\n❌ File not found: {file_path}\n")
+                except Exception as e:
+                    logger.error("Upload failed: %s", e, exc_info=True)
+                    print(f"\n❌ Error uploading file: {e}\n")
+                else:
+                    count = chatbot.get_materials_count()
+                    logger.info("Upload successful: %s, Total chunks: %s", result, count)
+                    print(f"\n✅ {result}\n📊 Total chunks: {count}\n")
                 continue
 
             # Regular chat
-            logger.info(f"User message: {user_input}")
+            logger.info("User message: %s", user_input)
             print("\n🤖 ", end="", flush=True)
-            response = chatbot.chat(user_input)
-            logger.info(f"Bot response: {response[:100]}...")
-            print(f"{response}\n")
+            # Print the tutor's tokens as they arrive instead of after the full reply
+            fragments = []
+            for fragment in chatbot.stream_chat(user_input):
+                fragments.append(fragment)
+                print(fragment, end="", flush=True)
+            print("\n", flush=True)
+            logger.info("Bot response: %.100s...", "".join(fragments))
 
         except KeyboardInterrupt:
             logger.info("User interrupted (Ctrl+C)")
@@ -108,14 +149,16 @@ try:
             print("\n👋 Goodbye!")
             break
         except Exception as e:
-            logger.error(f"Error during chat: {e}", exc_info=True)
+            logger.error("Error during chat: %s", e, exc_info=True)
             print(f"\n❌ Error: {e}\n")
 
 except Exception as e:
-    logger.error(f"Failed to initialize chatbot: {e}", exc_info=True)
+    logger.error("Failed to initialize chatbot: %s", e, exc_info=True)
     print(f"\n❌ Failed to initialize chatbot: {e}")
-    print("\nPlease check:")
-    print("  1. Your .env file has OPENAI_API_KEY")
-    print("  2. All dependencies are installed: pip install -r requirements.txt")
-    print(f"\n📝 Check logs for details: {log_filename}")
+    print(
+        "\nPlease check:\n"
+        "  1. Your .env file has OPENAI_API_KEY\n"
+        "  2. All dependencies are installed: pip install -r requirements.txt\n"
+        f"\n📝 Check logs for details: {log_filename}"
+    )
     exit(1)
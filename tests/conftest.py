@@ -1,34 +1,203 @@
 """Shared pytest fixtures for Study Pal tests."""
 
 import os
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import patch
 
+import numpy as np
 import pytest
+from langchain_core.caches import InMemoryCache
+from langchain_core.embeddings import Embeddings
+from langchain_core.globals import set_llm_cache
 
+from agents.quote_store import Quote, QuoteStore
+from agents.scheduler_agent import SchedulerAgent
+from agents.user_profile import UserProfile, UserProfileStore
 
-# Create mock embeddings instance that handles multiple documents
-def _create_mock_embeddings(texts):
-    """Generate mock embeddings for a list of texts."""
-    return [[0.1 * (i + 1)] * 3072 for i in range(len(texts))]
 
+class FakeEmbeddings(Embeddings):
+    """
+    Deterministic stand-in for OpenAIEmbeddings.
 
-_mock_embeddings = MagicMock()
-_mock_embeddings.embed_documents.side_effect = _create_mock_embeddings
-_mock_embeddings.embed_query.return_value = [0.1] * 3072
+    A plain class rather than a MagicMock: no test inspects the embedding calls,
+    so recording each one is pure overhead.
+    """
 
+    def embed_documents(self, texts: list[str]) -> list[np.ndarray]:
+        """Generate mock embeddings for a list of texts."""
+        # Row i is filled with 0.1 * (i + 1). Broadcast rows allocate one value per text
+        # rather than 3072; the outer list keeps callers that test `if embeddings:` working
+        scale = np.arange(1, len(texts) + 1, dtype=np.float64)[:, None] * 0.1
+        return list(np.broadcast_to(scale, (len(texts), 3072)))
 
-# Patch at module level
-_embeddings_patcher = patch("langchain_openai.OpenAIEmbeddings", return_value=_mock_embeddings)
-_embeddings_patcher.start()
+    def embed_query(self, text: str) -> list[float]:
+        """Return the same vector for every query."""
+        return [0.1] * 3072
+
+
+_mock_embeddings = FakeEmbeddings()
+
+
+@dataclass(slots=True, frozen=True)
+class QuoteLite:
+    """
+    Validation-free stand-in for agents.quote_store.Quote in test doubles.
+
+    Carries only the fields MotivatorAgent reads. Code that serializes quotes
+    (OpenAIMotivationModel, QuoteStore) needs the real pydantic model.
+    """
+
+    text: str
+    persona: str
+    tags: tuple[str, ...] = ()
+    source_url: str | None = None
+
+
+class SchedulerJSONLLM:
+    """Scheduler LLM double that returns a canned JSON string and records the prompt."""
+
+    def __init__(self, response: str) -> None:
+        self.response = response
+        self.last_prompt: str | None = None
+
+    def generate(self, prompt: str) -> str:
+        self.last_prompt = prompt
+        return self.response
+
+
+class SchedulerDictLLM:
+    """Scheduler LLM double that returns a prebuilt reply dict, skipping the JSON round trip."""
+
+    def __init__(self, response: dict) -> None:
+        self.response = response
+        self.last_prompt: str | None = None
+
+    def generate_dict(self, prompt: str) -> dict:
+        self.last_prompt = prompt
+        return self.response
+
+
+class FakeProfileStore:
+    """
+    In-memory stand-in for UserProfileStore.
+
+    Same save/load contract, including FileNotFoundError for unknown users and
+    returning copies, without touching disk. Tests about persistence itself
+    should use the real store under tmp_path.
+    """
+
+    def __init__(self) -> None:
+        self._profiles: dict[str, UserProfile] = {}
+
+    def load(self, user_id: str) -> UserProfile:
+        """Return a copy of the stored profile."""
+        try:
+            return self._profiles[user_id].model_copy(deep=True)
+        except KeyError:
+            raise FileNotFoundError(f"Profile not found: {user_id}") from None
+
+    def save(self, profile: UserProfile) -> None:
+        """Store a copy of the profile, so later edits by the caller don't leak in."""
+        self._profiles[profile.user_id] = profile.model_copy(deep=True)
 
 
 @pytest.fixture(autouse=True, scope="session")
 def setup_test_env():
     """Set up test environment."""
     os.environ["OPENAI_API_KEY"] = "sk-test-dummy-key"
-    yield
+    # Identical LangChain LLM prompts within a run are answered from memory.
+    # In-memory rather than on disk, so one run's replies never leak into the next
+    set_llm_cache(InMemoryCache())
+    # Patch the name rag_pipeline actually calls, so it holds however early core was imported
+    with patch("core.rag_pipeline.OpenAIEmbeddings", return_value=_mock_embeddings):
+        yield
     # Cleanup
-    _embeddings_patcher.stop()
+    set_llm_cache(None)
+
+
+@pytest.fixture(scope="session")
+def fake_embeddings() -> FakeEmbeddings:
+    """Local embeddings to inject where a test shouldn't depend on the OpenAIEmbeddings patch."""
+    return _mock_embeddings
+
+
+@pytest.fixture(scope="session")
+def scheduler_agent_factory():
+    """
+    Return a builder for scheduler agents backed by a canned LLM reply.
+
+    Dict replies skip JSON parsing; pass a string only when the test is about parsing.
+    Extra keyword arguments go to SchedulerAgent.
+    """
+
+    def build(reply: str | dict, **kwargs) -> SchedulerAgent:
+        llm = SchedulerDictLLM(reply) if isinstance(reply, dict) else SchedulerJSONLLM(reply)
+        return SchedulerAgent(llm=llm, **kwargs)
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def worker_persist_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Root for session- and module-scoped Chroma directories, one per pytest-xdist worker.
+
+    Reads PYTEST_XDIST_WORKER rather than requesting xdist's worker_id fixture,
+    so the suite still runs where xdist isn't installed.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return tmp_path_factory.mktemp(f"chroma_{worker_id}")
+
+
+@pytest.fixture(scope="session")
+def test_pdf() -> Path:
+    """Path to the calculus sample PDF, resolved once; fails fast if the fixture file is missing."""
+    return (Path(__file__).parent / "fixtures" / "calculus_sample.pdf").resolve(strict=True)
+
+
+@pytest.fixture(scope="session")
+def test_pdf_bytes(test_pdf: Path) -> bytes:
+    """Raw bytes of the sample PDF, read once for tests that copy it rather than parse it."""
+    return test_pdf.read_bytes()
+
+
+# Read-only stores shared by the whole session, so their JSON is written once rather
+# than per test. Tests that add quotes or save profiles should build their own under tmp_path
+@pytest.fixture(scope="session")
+def shared_quote_store(tmp_path_factory: pytest.TempPathFactory) -> QuoteStore:
+    """Quote store seeded with one Steve Jobs and one Kobe Bryant quote."""
+    store = QuoteStore(tmp_path_factory.mktemp("quotes") / "quotes.json")
+    store.add(
+        [
+            Quote(
+                text="Stay hungry, stay foolish.",
+                persona="Steve Jobs",
+                tags=["focus", "innovation"],
+                source_url="https://example.com/jobs",
+            ),
+            Quote(
+                text="Everything negative – pressure, challenges – is an opportunity to rise.",
+                persona="Kobe Bryant",
+                tags=["perseverance"],
+            ),
+        ]
+    )
+    return store
+
+
+@pytest.fixture(scope="session")
+def shared_profile_store(tmp_path_factory: pytest.TempPathFactory) -> UserProfileStore:
+    """Profile store holding user "rom" with DJ Khaled as primary persona."""
+    store = UserProfileStore(tmp_path_factory.mktemp("profiles"))
+    store.save(UserProfile(user_id="rom", name="Rom", primary_persona="DJ Khaled"))
+    return store
+
+
+@pytest.fixture
+def fake_profile_store() -> FakeProfileStore:
+    """Empty in-memory profile store."""
+    return FakeProfileStore()
 
 
 # TODO: add fixtures for vector stores, MCP stubs, configuration, etc.
@@ -27,5 +27,10 @@ Limits are fundamental to calculus and are used to define derivatives and integr
 
 # Save as text file (we'll use it directly for testing)
 output_path = Path(__file__).parent / "calculus_sample.txt"
-output_path.write_text(pdf_content)
-print(f"Created test file: {output_path}")
+data = pdf_content.encode("utf-8")
+# Leave an up-to-date file untouched so its mtime (and anything keyed on it) stays valid
+if output_path.exists() and output_path.read_bytes() == data:
+    print(f"Test file up to date: {output_path}")
+else:
+    output_path.write_bytes(data)
+    print(f"Created test file: {output_path}")
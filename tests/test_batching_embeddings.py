@@ -0,0 +1,60 @@
+"""Tests for the query-coalescing embeddings wrapper."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from core.batching_embeddings import BatchingEmbeddings
+
+
+class RecordingEmbeddings:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        raise AssertionError("queries should go through embed_documents")
+
+
+def test_concurrent_queries_share_one_request() -> None:
+    inner = RecordingEmbeddings()
+    embeddings = BatchingEmbeddings(inner, max_batch_size=4, max_wait=5.0)
+    queries = ["a", "bb", "ccc", "dddd"]
+    results: dict[str, list[float]] = {}
+
+    def ask(query: str) -> None:
+        results[query] = embeddings.embed_query(query)
+
+    threads = [threading.Thread(target=ask, args=(query,)) for query in queries]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    # The batch filled up, so it was sent without waiting out max_wait
+    assert len(inner.batches) == 1
+    assert sorted(inner.batches[0]) == queries
+    assert results == {query: [float(len(query))] for query in queries}
+
+
+def test_single_query_is_sent_after_max_wait() -> None:
+    inner = RecordingEmbeddings()
+    embeddings = BatchingEmbeddings(inner, max_wait=0)
+
+    assert embeddings.embed_query("hello") == [5.0]
+    assert embeddings.embed_query("hi") == [2.0]
+    assert inner.batches == [["hello"], ["hi"]]
+
+
+def test_errors_reach_every_caller() -> None:
+    class FailingEmbeddings:
+        def embed_documents(self, texts):
+            raise RuntimeError("rate limited")
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        BatchingEmbeddings(FailingEmbeddings(), max_wait=0).embed_query("hello")
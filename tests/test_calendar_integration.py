@@ -2,7 +2,19 @@
 
 from __future__ import annotations
 
-from agents.scheduler_agent import SchedulerAgent
+from types import MappingProxyType
+
+# Built once and read-only, so every list_events call returns the same objects and
+# a scheduler that tried to mutate them would fail loudly
+EXISTING_CONFLICTS = (
+    MappingProxyType(
+        {
+            "summary": "Team Standup",
+            "start": {"dateTime": "2026-02-14T14:30:00"},
+            "end": {"dateTime": "2026-02-14T15:00:00"},
+        }
+    ),
+)
 
 
 class MockGoogleCalendarClient:
@@ -29,15 +41,13 @@ class MockGoogleCalendarClient:
         pass
 
 
-class DummyLLM:
-    def generate(self, prompt):
-        return '{"start_time": "14:00", "end_time": "16:00", "subjects": ["Python"], "date": "2026-02-14"}'
+LLM_REPLY = {"start_time": "14:00", "end_time": "16:00", "subjects": ["Python"], "date": "2026-02-14"}
 
 
-def test_full_schedule_and_sync_flow():
+def test_full_schedule_and_sync_flow(scheduler_agent_factory):
     """Generate schedule, check availability, sync to Google Calendar."""
     connector = MockGoogleCalendarClient()
-    agent = SchedulerAgent(llm=DummyLLM(), calendar_connector=connector)
+    agent = scheduler_agent_factory(LLM_REPLY, calendar_connector=connector)
 
     # Generate schedule
     schedule = agent.generate_schedule({"user_input": "tomorrow 14:00-16:00 study Python"})
@@ -60,17 +70,11 @@ def test_full_schedule_and_sync_flow():
     assert first_event["start"]["timeZone"] == "Asia/Jerusalem"
 
 
-def test_schedule_with_existing_conflicts():
+def test_schedule_with_existing_conflicts(scheduler_agent_factory):
     """When calendar has conflicts, check_availability reports them."""
     connector = MockGoogleCalendarClient()
-    connector.list_events = lambda **kw: [
-        {
-            "summary": "Team Standup",
-            "start": {"dateTime": "2026-02-14T14:30:00"},
-            "end": {"dateTime": "2026-02-14T15:00:00"},
-        }
-    ]
-    agent = SchedulerAgent(llm=DummyLLM(), calendar_connector=connector)
+    connector.list_events = lambda **kw: EXISTING_CONFLICTS
+    agent = scheduler_agent_factory(LLM_REPLY, calendar_connector=connector)
 
     conflicts = agent.check_availability("2026-02-14", "14:00", "16:00")
     assert len(conflicts) == 1
@@ -0,0 +1,73 @@
+"""Tests for the chat API routes."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers import chat
+
+
+class StreamingChatbot:
+    def stream_chat(self, message: str):
+        yield "A derivative "
+        yield "measures change."
+
+    def get_last_intent(self) -> str:
+        return "tutor"
+
+    def get_current_avatar(self) -> str:
+        return "🎓"
+
+
+class Profiles:
+    def load(self, user_id: str):
+        if user_id != "alice":
+            raise FileNotFoundError(user_id)
+
+
+@pytest.fixture
+def client(monkeypatch) -> TestClient:
+    monkeypatch.setattr(chat, "profile_store", Profiles())
+    monkeypatch.setattr(chat, "get_or_create_chatbot", lambda user_id: StreamingChatbot())
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api")
+    return TestClient(app)
+
+
+def test_chat_stream_sends_deltas_then_agent(client) -> None:
+    response = client.post("/api/chat/stream", json={"user_id": "alice", "message": "What is a derivative?"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"delta": "A derivative "},
+        {"delta": "measures change."},
+        {"done": True, "agent_avatar": "🎓", "agent_name": "Tutor"},
+    ]
+
+
+def test_chat_stream_requires_profile(client) -> None:
+    response = client.post("/api/chat/stream", json={"user_id": "bob", "message": "hi"})
+
+    assert response.status_code == 404
+
+
+class FailingChatbot(StreamingChatbot):
+    def stream_chat(self, message: str):
+        yield "A derivative "
+        raise RuntimeError("tutor failed")
+
+
+def test_chat_stream_reports_failure_part_way(client, monkeypatch) -> None:
+    monkeypatch.setattr(chat, "get_or_create_chatbot", lambda user_id: FailingChatbot())
+
+    response = client.post("/api/chat/stream", json={"user_id": "alice", "message": "What is a derivative?"})
+
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"delta": "A derivative "},
+        {"error": "tutor failed"},
+    ]
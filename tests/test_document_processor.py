@@ -5,24 +5,25 @@ from pathlib import Path
 import pytest
 from langchain_core.documents import Document
 
-from core.document_processor import DocumentProcessor
+from core import document_processor
+from core.document_processor import DocumentProcessor, clean_spaced_text
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def processor():
-    """Create a DocumentProcessor with default settings."""
+    """Create one DocumentProcessor with default settings for the session (it holds no per-call state)."""
     return DocumentProcessor(chunk_size=1000, chunk_overlap=200)
 
 
-@pytest.fixture
-def test_pdf():
-    """Get path to test PDF fixture."""
-    return Path(__file__).parent / "fixtures" / "calculus_sample.pdf"
+@pytest.fixture(scope="module")
+def parsed_pdf(processor, test_pdf):
+    """Parse the test PDF once for the module; tests must not mutate the documents."""
+    return processor.load_pdf(test_pdf)
 
 
-def test_load_pdf_success(processor, test_pdf):
+def test_load_pdf_success(parsed_pdf):
     """Test successful PDF loading."""
-    documents = processor.load_pdf(test_pdf)
+    documents = parsed_pdf
 
     assert len(documents) > 0
     assert all(isinstance(doc, Document) for doc in documents)
@@ -117,9 +118,10 @@ def test_process_pdf_end_to_end(processor, test_pdf):
     assert any(keyword in all_content.lower() for keyword in ["derivative", "integral", "limit", "calculus"])
 
 
-def test_chunk_size_configuration():
+@pytest.mark.parametrize(("chunk_size", "min_chunks"), [(100, 5), (250, 3)])
+def test_chunk_size_configuration(chunk_size, min_chunks):
     """Test custom chunk size configuration."""
-    processor = DocumentProcessor(chunk_size=100, chunk_overlap=20)
+    processor = DocumentProcessor(chunk_size=chunk_size, chunk_overlap=chunk_size // 5)
 
     large_text = "Word " * 200  # ~1000 chars
     documents = [Document(page_content=large_text)]
@@ -127,8 +129,32 @@ def test_chunk_size_configuration():
     chunks = processor.chunk_documents(documents)
 
     # With smaller chunk size, should get more chunks
-    assert len(chunks) > 5
+    assert len(chunks) > min_chunks
 
-    # Each chunk should be roughly around chunk_size
-    for chunk in chunks[:-1]:  # Excluding last chunk which may be smaller
-        assert len(chunk.page_content) <= 120  # chunk_size + some buffer
+    # Each chunk should be roughly around chunk_size; one assertion reports the worst offender
+    lengths = [len(chunk.page_content) for chunk in chunks[:-1]]  # Last chunk may be smaller
+    assert max(lengths) <= chunk_size * 1.2  # chunk_size + some buffer
+
+
+def test_clean_spaced_text_merges_spaced_letters():
+    assert clean_spaced_text("H e l l o  t h e r e") == "Hellothere"
+    assert clean_spaced_text("R o m") == "Rom"
+
+
+def test_clean_spaced_text_leaves_normal_text_alone():
+    text = "A derivative measures how a function changes."
+    assert clean_spaced_text(text) == text
+
+
+@pytest.mark.parametrize("min_bytes", [document_processor.PARALLEL_PDF_MIN_BYTES, 0], ids=["in-process", "worker-pool"])
+def test_process_pdfs_keeps_order_and_errors(processor, test_pdf, tmp_path, monkeypatch, min_bytes):
+    """Test batch processing returns per-file chunks or errors, in input order."""
+    monkeypatch.setattr(document_processor, "PARALLEL_PDF_MIN_BYTES", min_bytes)
+    missing = tmp_path / "missing.pdf"
+
+    results = processor.process_pdfs([test_pdf, missing, test_pdf], max_workers=1)
+
+    assert len(results) == 3
+    assert isinstance(results[1], FileNotFoundError)
+    assert [chunk.page_content for chunk in results[0]] == [chunk.page_content for chunk in results[2]]
+    assert results[0][0].metadata["source_file"] == "calculus_sample.pdf"
@@ -0,0 +1,55 @@
+"""Tests for the document API routes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers import documents
+
+
+class IngestingChatbot:
+    def __init__(self) -> None:
+        self.ingested: list[tuple[Path, bytes]] = []
+
+    def ingest_materials(self, pdf_paths: list[Path]) -> str:
+        self.ingested.extend((path, path.read_bytes()) for path in pdf_paths)
+        return f"Successfully ingested {len(pdf_paths)} files"
+
+    def get_materials_count(self) -> int:
+        return len(self.ingested)
+
+
+@pytest.fixture
+def chatbot(monkeypatch, tmp_path) -> IngestingChatbot:
+    bot = IngestingChatbot()
+    monkeypatch.setattr(documents, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(documents, "get_or_create_chatbot", lambda user_id: bot)
+    return bot
+
+
+@pytest.fixture
+def client(chatbot) -> TestClient:
+    app = FastAPI()
+    app.include_router(documents.router, prefix="/api")
+    return TestClient(app)
+
+
+def test_upload_batch_keeps_files_with_the_same_name_apart(client, chatbot, tmp_path) -> None:
+    files = [
+        ("files", ("notes.pdf", b"first", "application/pdf")),
+        ("files", ("../notes.pdf", b"second", "application/pdf")),
+    ]
+    response = client.post("/api/upload/batch", data={"user_id": "alice"}, files=files)
+
+    assert response.status_code == 200
+    assert sorted(content for _, content in chatbot.ingested) == [b"first", b"second"]
+    paths = [path for path, _ in chatbot.ingested]
+    assert len(set(paths)) == 2
+    upload_dir = tmp_path / "data" / "uploads"
+    assert all(path.name == "notes.pdf" and path.parent.parent == upload_dir for path in paths)
+    # Temp files are removed once ingestion finishes
+    assert list(upload_dir.iterdir()) == []
@@ -0,0 +1,67 @@
+"""Tests for the embedding-based fast intent router."""
+
+from __future__ import annotations
+
+import pytest
+
+from core import fast_intent_router
+from core.fast_intent_router import INTENT_SEED_PHRASES, FastIntentRouter
+
+# One axis per intent; a message embeds onto the axes of the intents whose seed phrases contain it
+AXES = {
+    phrase: i
+    for i, intent in enumerate(("tutor", "scheduler", "analyzer", "motivator"))
+    for phrase in INTENT_SEED_PHRASES[intent]
+}
+
+
+class AxisEmbeddings:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        vectors = []
+        for text in texts:
+            vector = [0.0] * 4
+            if text in AXES:
+                vector[AXES[text]] = 1.0
+            elif text == "hmm":
+                vector[0] = vector[1] = 1.0
+            vectors.append(vector)
+        return vectors
+
+
+@pytest.fixture
+def router(tmp_path) -> FastIntentRouter:
+    return FastIntentRouter(embeddings=AxisEmbeddings(), cache_path=tmp_path / "centroids.npz")
+
+
+def test_route_labels_clear_messages_and_defers_ambiguous(router) -> None:
+    intents = router.route(["Motivate me", "Schedule a study session", "hmm"])
+
+    assert intents == ["motivator", "scheduler", None]
+    # One call for the seed phrases, one for all the messages
+    assert len(router.embeddings.calls) == 2
+
+
+def test_classify_sends_only_ambiguous_messages_to_llm(router, monkeypatch) -> None:
+    sent = []
+
+    def fake_llm(messages, user_id):
+        sent.append(messages)
+        return ["tutor"] * len(messages)
+
+    monkeypatch.setattr(fast_intent_router, "classify_intents_with_llm", fake_llm)
+
+    assert router.classify(["hmm", "I'm done for today"]) == ["tutor", "analyzer"]
+    assert sent == [["hmm"]]
+
+
+def test_centroids_are_cached_on_disk(router) -> None:
+    centroids = router.centroids
+
+    reloaded = FastIntentRouter(embeddings=AxisEmbeddings(), cache_path=router.cache_path)
+
+    assert (reloaded.centroids == centroids).all()
+    assert reloaded.embeddings.calls == []
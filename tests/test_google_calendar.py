@@ -2,11 +2,55 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 from core.google_calendar import GoogleCalendarClient
 
 
+class FakeRequest:
+    """Stands in for an API request object; ``execute`` returns or raises the preset result."""
+
+    def __init__(self, result: object) -> None:
+        self._result = result
+
+    def execute(self) -> object:
+        if isinstance(self._result, Exception):
+            raise self._result
+        return self._result
+
+
+class FakeEvents:
+    """``service.events()`` resource that records each call's parameters."""
+
+    def __init__(self) -> None:
+        self.calls: dict[str, list[dict]] = {"list": [], "insert": [], "patch": [], "delete": []}
+        self.results: dict[str, object] = {}
+
+    def _request(self, method: str, params: dict) -> FakeRequest:
+        self.calls[method].append(params)
+        return FakeRequest(self.results.get(method))
+
+    def list(self, **params) -> FakeRequest:
+        return self._request("list", params)
+
+    def insert(self, **params) -> FakeRequest:
+        return self._request("insert", params)
+
+    def patch(self, **params) -> FakeRequest:
+        return self._request("patch", params)
+
+    def delete(self, **params) -> FakeRequest:
+        return self._request("delete", params)
+
+
+class FakeCalendarService:
+    """Google Calendar service whose ``events()`` always returns the same FakeEvents."""
+
+    def __init__(self) -> None:
+        self.events_resource = FakeEvents()
+
+    def events(self) -> FakeEvents:
+        return self.events_resource
+
+
 class TestGoogleCalendarClientConfig:
     """GoogleCalendarClient reads config from env or explicit params."""
 
@@ -45,17 +89,17 @@ class TestGoogleCalendarClientConfig:
 class TestGoogleCalendarClientMethods:
     """GoogleCalendarClient methods delegate to Google API correctly."""
 
-    def _make_client_with_mock_service(self):
-        """Create a client with a mocked Google Calendar service."""
+    def _make_client_with_fake_events(self):
+        """Create a client backed by a fake Google Calendar service."""
         c = GoogleCalendarClient(credentials_path="/fake/creds.json")
-        mock_service = MagicMock()
-        c._service = mock_service
-        return c, mock_service
+        service = FakeCalendarService()
+        c._service = service
+        return c, service.events_resource
 
     def test_list_events_returns_items(self):
         """list_events returns the items from Google Calendar API response."""
-        c, mock_service = self._make_client_with_mock_service()
-        mock_service.events().list().execute.return_value = {"items": [{"summary": "Meeting", "id": "abc123"}]}
+        c, events = self._make_client_with_fake_events()
+        events.results["list"] = {"items": [{"summary": "Meeting", "id": "abc123"}]}
 
         result = c.list_events(time_min="2026-02-13T00:00:00Z", time_max="2026-02-13T23:59:59Z")
         assert len(result) == 1
@@ -63,16 +107,19 @@ class TestGoogleCalendarClientMethods:
 
     def test_list_events_passes_parameters(self):
         """list_events passes time range and other params to API."""
-        c, mock_service = self._make_client_with_mock_service()
-        mock_service.events().list().execute.return_value = {"items": []}
+        c, events = self._make_client_with_fake_events()
+        events.results["list"] = {"items": []}
 
         c.list_events(time_min="2026-01-01T00:00:00Z", time_max="2026-01-02T00:00:00Z", max_results=10)
-        mock_service.events().list.assert_called()
+        [params] = events.calls["list"]
+        assert params["timeMin"] == "2026-01-01T00:00:00Z"
+        assert params["timeMax"] == "2026-01-02T00:00:00Z"
+        assert params["maxResults"] == 10
 
     def test_create_event_calls_insert(self):
         """create_event calls events().insert() with correct payload."""
-        c, mock_service = self._make_client_with_mock_service()
-        mock_service.events().insert().execute.return_value = {"id": "new123"}
+        c, events = self._make_client_with_fake_events()
+        events.results["insert"] = {"id": "new123"}
 
         payload = {
             "summary": "Study: Python",
@@ -81,37 +128,36 @@ class TestGoogleCalendarClientMethods:
             "end": {"dateTime": "2026-02-14T14:25:00", "timeZone": "Asia/Jerusalem"},
         }
         c.create_event(payload)
-        mock_service.events().insert.assert_called()
+        assert len(events.calls["insert"]) == 1
 
     def test_search_events_uses_q_parameter(self):
         """search_events passes query as 'q' parameter."""
-        c, mock_service = self._make_client_with_mock_service()
-        mock_service.events().list().execute.return_value = {"items": [{"summary": "Python Study"}]}
+        c, events = self._make_client_with_fake_events()
+        events.results["list"] = {"items": [{"summary": "Python Study"}]}
 
         result = c.search_events("Python")
         assert len(result) == 1
-        mock_service.events().list.assert_called()
+        assert events.calls["list"][0]["q"] == "Python"
 
     def test_delete_event_calls_delete(self):
         """delete_event calls events().delete() with correct params."""
-        c, mock_service = self._make_client_with_mock_service()
-        mock_service.events().delete().execute.return_value = None
+        c, events = self._make_client_with_fake_events()
 
         c.delete_event("event123", calendar_id="primary")
-        mock_service.events().delete.assert_called()
+        assert events.calls["delete"] == [{"calendarId": "primary", "eventId": "event123"}]
 
     def test_update_event_calls_patch(self):
         """update_event calls events().patch() with correct params."""
-        c, mock_service = self._make_client_with_mock_service()
-        mock_service.events().patch().execute.return_value = {"id": "event123"}
+        c, events = self._make_client_with_fake_events()
+        events.results["patch"] = {"id": "event123"}
 
         c.update_event("event123", {"summary": "Updated Study"})
-        mock_service.events().patch.assert_called()
+        assert events.calls["patch"][0]["eventId"] == "event123"
 
     def test_api_error_returns_empty_list(self):
         """API errors are caught and return empty results."""
-        c, mock_service = self._make_client_with_mock_service()
-        mock_service.events().list().execute.side_effect = Exception("API error")
+        c, events = self._make_client_with_fake_events()
+        events.results["list"] = Exception("API error")
 
         result = c.list_events()
         assert result == []
@@ -0,0 +1,63 @@
+"""Tests for the shared OpenAI HTTP helpers."""
+
+from __future__ import annotations
+
+import httpx
+
+from core import http
+from core.http import openai_api_keys, openai_key_for, warm_openai_connection
+
+
+def test_openai_api_keys_prefers_key_list(monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-single")
+    monkeypatch.setenv("OPENAI_API_KEYS", "sk-a, sk-b,,sk-c ")
+
+    assert openai_api_keys() == ("sk-a", "sk-b", "sk-c")
+
+
+def test_openai_key_for_is_stable_per_user(monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEYS", "sk-a,sk-b,sk-c")
+
+    assigned = {openai_key_for(f"user-{i}") for i in range(30)}
+
+    assert openai_key_for("alice") == openai_key_for("alice")
+    assert assigned == {"sk-a", "sk-b", "sk-c"}
+
+
+def test_openai_key_for_without_keys(monkeypatch) -> None:
+    monkeypatch.delenv("OPENAI_API_KEYS", raising=False)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    assert openai_key_for("alice") is None
+
+
+def test_warm_openai_connection_looks_up_model_and_ignores_errors(monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEYS", "sk-a,sk-b")
+    requested = []
+
+    class Models:
+        def retrieve(self, model):
+            requested.append(model)
+            raise RuntimeError("offline")
+
+    class Client:
+        models = Models()
+
+    monkeypatch.setattr(http, "get_openai_client", lambda api_key: Client())
+
+    warm_openai_connection()
+
+    assert requested == [http.WARMUP_MODEL]
+
+
+def test_shared_client_throttles_model_requests(monkeypatch) -> None:
+    reserved = []
+    monkeypatch.setattr(http, "throttle_openai_call", reserved.append)
+    body = b"x" * 400
+
+    for hook in http.SHARED_HTTPX.event_hooks["request"]:
+        hook(httpx.Request("POST", "https://api.openai.com/v1/chat/completions", content=body))
+        hook(httpx.Request("POST", "https://api.openai.com/v1/embeddings", content=body))
+        hook(httpx.Request("GET", "https://api.openai.com/v1/models/gpt-4o-mini"))
+
+    assert reserved == [100 + http.COMPLETION_TOKEN_ALLOWANCE, 100]
@@ -0,0 +1,49 @@
+"""Smoke test that every package module imports cleanly."""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+# Modules already imported by other tests are a sys.modules lookup here, so the
+# heavy langchain/langgraph initialization is paid at most once per session
+MODULES = [
+    "agents.motivator_agent",
+    "agents.onboarding",
+    "agents.quote_scraper",
+    "agents.quote_store",
+    "agents.scheduler_agent",
+    "agents.tutor_agent",
+    "agents.tutor_chatbot",
+    "agents.user_profile",
+    "agents.weakness_detector_agent",
+    "api.dependencies",
+    "api.main",
+    "api.models",
+    "api.routers.chat",
+    "api.routers.documents",
+    "api.routers.users",
+    "core.agent_avatars",
+    "core.batching_embeddings",
+    "core.document_processor",
+    "core.fast_intent_router",
+    "core.google_calendar",
+    "core.http",
+    "core.langgraph_chatbot",
+    "core.openai_batch",
+    "core.rag_pipeline",
+    "core.rate_limiter",
+    "core.response_cache",
+    "core.utils",
+    "core.vector_stores",
+    "core.weakness_analyzer",
+    "core.workflow_graph",
+    "core.workflow_nodes",
+    "core.workflow_state",
+]
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_module_imports(module: str) -> None:
+    importlib.import_module(module)
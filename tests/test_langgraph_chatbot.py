@@ -0,0 +1,158 @@
+"""Tests for the LangGraph chatbot wrapper."""
+
+from __future__ import annotations
+
+from typing import Annotated, TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, StateGraph
+from langgraph.graph.message import add_messages
+
+from core import langgraph_chatbot
+from core.langgraph_chatbot import LangGraphChatbot
+
+
+class StreamingGraph:
+    """Replays a tutor turn: a router classification, then the tutor's tokens."""
+
+    def stream(self, state, config, stream_mode):
+        assert config == {"configurable": {"thread_id": "session"}}
+        yield "messages", (AIMessageChunk(content="tutor"), {"langgraph_node": "intent_router"})
+        for token in ("A derivative ", "measures change."):
+            yield "messages", (AIMessageChunk(content=token), {"langgraph_node": "tutor"})
+        final = {**state, "messages": [*state["messages"], AIMessage(content="A derivative measures change.")]}
+        yield "values", final
+
+
+@pytest.fixture
+def chatbot(monkeypatch) -> LangGraphChatbot:
+    monkeypatch.setattr(langgraph_chatbot, "get_rag_pipeline", lambda user_id: object())
+    return LangGraphChatbot(user_id="alice", session_id="session", graph=StreamingGraph())
+
+
+def test_stream_chat_yields_only_tutor_tokens(chatbot) -> None:
+    fragments = list(chatbot.stream_chat("What is a derivative?"))
+
+    assert fragments == ["A derivative ", "measures change."]
+    assert chatbot.conversation_state["messages"][-1].content == "A derivative measures change."
+    assert [m.content for m in chatbot.memory.messages] == ["What is a derivative?", "A derivative measures change."]
+
+
+class FailingGraph:
+    def stream(self, state, config, stream_mode):
+        yield "messages", (AIMessageChunk(content="A derivative "), {"langgraph_node": "tutor"})
+        raise RuntimeError("tutor failed")
+
+
+def test_stream_chat_raises_when_the_turn_fails(monkeypatch) -> None:
+    monkeypatch.setattr(langgraph_chatbot, "get_rag_pipeline", lambda user_id: object())
+    bot = LangGraphChatbot(user_id="alice", session_id="session", graph=FailingGraph())
+    fragments = []
+
+    with pytest.raises(RuntimeError, match="tutor failed"):
+        for fragment in bot.stream_chat("What is a derivative?"):
+            fragments.append(fragment)
+
+    assert fragments == ["A derivative "]
+
+
+class InvokeGraph:
+    def invoke(self, state, config):
+        return {**state, "messages": [*state["messages"], AIMessage(content="x" * 500)]}
+
+
+def test_chat_max_chars_trims_reply_but_keeps_history(monkeypatch) -> None:
+    monkeypatch.setattr(langgraph_chatbot, "get_rag_pipeline", lambda user_id: object())
+    bot = LangGraphChatbot(user_id="alice", session_id="session", graph=InvokeGraph())
+
+    assert bot.chat("Explain everything", max_chars=200) == "x" * 200 + "..."
+    assert bot.memory.messages[-1].content == "x" * 500
+
+
+def test_snapshot_reports_status_fields(monkeypatch) -> None:
+    class Pipeline:
+        def count_documents(self) -> int:
+            return 42
+
+    monkeypatch.setattr(langgraph_chatbot, "get_rag_pipeline", lambda user_id: Pipeline())
+    bot = LangGraphChatbot(user_id="alice", session_id="session", graph=InvokeGraph())
+    bot.chat("Hi")
+
+    assert bot.snapshot() == {
+        "materials": 42,
+        "summary": "Conversation: 2 messages (1 exchanges)",
+        "intent": None,
+        "mode": None,
+        "tutor_active": False,
+    }
+
+
+class EchoState(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+def _echo_graph():
+    """A one-node graph with a real checkpointer, standing in for the shared workflow."""
+
+    def reply(state: EchoState) -> dict:
+        return {"messages": [AIMessage(content=f"echo: {state['messages'][-1].content}")]}
+
+    builder = StateGraph(EchoState)
+    builder.add_node("reply", reply)
+    builder.set_entry_point("reply")
+    builder.add_edge("reply", END)
+    return builder.compile(checkpointer=MemorySaver())
+
+
+def test_default_session_chatbots_do_not_share_history(monkeypatch) -> None:
+    monkeypatch.setattr(langgraph_chatbot, "get_rag_pipeline", lambda user_id: object())
+    graph = _echo_graph()
+
+    alice = LangGraphChatbot(user_id="alice", graph=graph)
+    alice.chat("alice secret question")
+    bob = LangGraphChatbot(user_id="bob", graph=graph)
+    bob.chat("bob question")
+
+    assert [m.content for m in bob.conversation_state["messages"]] == ["bob question", "echo: bob question"]
+
+
+def test_rebuilt_chatbot_starts_from_an_empty_thread(monkeypatch) -> None:
+    monkeypatch.setattr(langgraph_chatbot, "get_rag_pipeline", lambda user_id: object())
+    graph = _echo_graph()
+
+    LangGraphChatbot(user_id="alice", session_id="alice", graph=graph).chat("old question")
+    bot = LangGraphChatbot(user_id="alice", session_id="alice", graph=graph)
+    bot.chat("new question")
+
+    assert [m.content for m in bot.conversation_state["messages"]] == ["new question", "echo: new question"]
+    bot.clear_conversation()
+    assert graph.checkpointer.get_tuple({"configurable": {"thread_id": "alice"}}) is None
+
+
+def test_chat_batch_runs_the_job_without_holding_the_turn_lock(monkeypatch) -> None:
+    monkeypatch.setenv("USE_BATCH_API", "1")
+    monkeypatch.setattr(langgraph_chatbot, "get_rag_pipeline", lambda user_id: object())
+    monkeypatch.setattr(langgraph_chatbot, "openai_key_for", lambda user_id: "sk-test")
+    monkeypatch.setattr(langgraph_chatbot, "get_openai_client", lambda api_key: object())
+    bot = LangGraphChatbot(user_id="alice", session_id="session", graph=InvokeGraph())
+    monkeypatch.setattr(bot.tutor_agent, "get_contexts", lambda messages, k: [["chunk"], []])
+
+    def run_chat_batch(client, bodies):
+        # Another turn on this session could run while the job is pending
+        assert not bot._turn_lock.locked()
+        return ["Derivatives measure change."]
+
+    monkeypatch.setattr(langgraph_chatbot, "run_chat_batch", run_chat_batch)
+
+    answers = bot.chat_batch(["What is a derivative?", "Who won in 1066?"])
+
+    assert answers == ["Derivatives measure change.", langgraph_chatbot.NO_MATERIALS_ANSWER]
+    assert [m.content for m in bot.conversation_state["messages"]] == [
+        "What is a derivative?",
+        "Derivatives measure change.",
+        "Who won in 1066?",
+        langgraph_chatbot.NO_MATERIALS_ANSWER,
+    ]
+    assert bot.conversation_state["tutor_session_active"] is True
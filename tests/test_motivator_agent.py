@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import threading
+from types import SimpleNamespace
 
-from agents.motivator_agent import MotivatorAgent, Quote
+import pytest
+
+from agents.motivator_agent import MotivatorAgent, OpenAIMotivationModel, Quote
 from agents.user_profile import UserProfile, UserProfileStore
+from tests.conftest import FakeProfileStore, QuoteLite
 
 
 class DummyLLM:
@@ -40,37 +44,50 @@ class DummyScraper:
     def __init__(self) -> None:
         self.calls: list[str] = []
 
-    def scrape_quotes(self, persona: str, limit: int = 3) -> list[Quote]:
+    def scrape_quotes(self, persona: str, limit: int = 3) -> list[QuoteLite]:
         """Return mock quotes."""
         self.calls.append(persona)
         return [
-            Quote(
+            QuoteLite(
                 text="Don't play yourself",
                 persona=persona,
-                tags=["motivation", "focus"],
+                tags=("motivation", "focus"),
                 source_url="https://example.com/quote",
             ),
-            Quote(
+            QuoteLite(
                 text="Another one",
                 persona=persona,
-                tags=["persistence"],
+                tags=("persistence",),
             ),
         ]
 
 
-def test_craft_personalized_message(tmp_path: Path) -> None:
-    """Test the main simplified craft_personalized_message flow."""
-    # Setup
-    profile_store = UserProfileStore(tmp_path / "profiles")
-    profile = UserProfile(
-        user_id="rom",
-        name="Rom",
-        primary_persona="DJ Khaled",
-        traits=["procrastination"],
-        goals=["finding a job"],
+@pytest.fixture(scope="module")
+def rom_profile_store() -> FakeProfileStore:
+    """
+    In-memory store holding Rom's profile, shared by the module.
+
+    Crafting a message saves ``last_motivation_at``; tests sharing this store
+    must not depend on that field's value before their own call.
+    """
+    profile_store = FakeProfileStore()
+    profile_store.save(
+        UserProfile(
+            user_id="rom",
+            name="Rom",
+            primary_persona="DJ Khaled",
+            preferred_personas=["Kobe"],
+            traits=["procrastination"],
+            goals=["finding a job"],
+        )
     )
-    profile_store.save(profile)
+    return profile_store
+
 
+def test_craft_personalized_message(rom_profile_store: FakeProfileStore) -> None:
+    """Test the main simplified craft_personalized_message flow."""
+    # Setup
+    profile_store = rom_profile_store
     llm = DummyLLM()
     scraper = DummyScraper()
     agent = MotivatorAgent(profile_store=profile_store, llm=llm)
@@ -102,29 +119,18 @@ def test_craft_personalized_message(tmp_path: Path) -> None:
     assert saved_profile.last_motivation_at is not None
 
 
-def test_craft_personalized_message_requires_llm(tmp_path: Path) -> None:
+def test_craft_personalized_message_requires_llm(shared_profile_store: UserProfileStore) -> None:
     """Test that LLM is required for message generation."""
-    profile_store = UserProfileStore(tmp_path / "profiles")
-    profile = UserProfile(
-        user_id="rom",
-        name="Rom",
-        primary_persona="DJ Khaled",
-    )
-    profile_store.save(profile)
-
-    agent = MotivatorAgent(profile_store=profile_store, llm=None)
+    agent = MotivatorAgent(profile_store=shared_profile_store, llm=None)
     scraper = DummyScraper()
 
-    try:
+    with pytest.raises(RuntimeError, match="LLM is required"):
         agent.craft_personalized_message(user_id="rom", scraper=scraper)
-        assert False, "Should have raised RuntimeError"
-    except RuntimeError as e:
-        assert "LLM is required" in str(e)
 
 
-def test_craft_personalized_message_auto_creates_profile(tmp_path: Path) -> None:
+def test_craft_personalized_message_auto_creates_profile(fake_profile_store: FakeProfileStore) -> None:
     """Test that profile is auto-created if it doesn't exist."""
-    profile_store = UserProfileStore(tmp_path / "profiles")
+    profile_store = fake_profile_store
     llm = DummyLLM()
     scraper = DummyScraper()
     agent = MotivatorAgent(profile_store=profile_store, llm=llm)
@@ -142,3 +148,125 @@ def test_craft_personalized_message_auto_creates_profile(tmp_path: Path) -> None
     # Profile should be loaded and used
     assert message.user_name == "new_user"
     assert message.persona_style == "Steve Jobs"
+
+
+class StreamingDummyLLM(DummyLLM):
+    """Mock LLM that yields its message word by word."""
+
+    def stream(self, *, persona: str, quote: Quote, profile: UserProfile):
+        for word in self.generate(persona=persona, quote=quote, profile=profile).split(" "):
+            yield word + " "
+
+
+@pytest.mark.parametrize("llm_class", [StreamingDummyLLM, DummyLLM], ids=["streaming", "whole-message"])
+def test_craft_message_stream_yields_fragments(fake_profile_store: FakeProfileStore, llm_class: type[DummyLLM]) -> None:
+    profile_store = fake_profile_store
+    profile_store.save(UserProfile(user_id="rom", name="Rom", primary_persona="DJ Khaled"))
+    agent = MotivatorAgent(profile_store=profile_store, llm=llm_class())
+
+    fragments = list(agent.craft_message_stream(user_id="rom", scraper=DummyScraper()))
+
+    assert (len(fragments) > 1) == (llm_class is StreamingDummyLLM)
+    assert "".join(fragments).startswith('"Don\'t play yourself" — DJ Khaled')
+    assert profile_store.load("rom").last_motivation_at is not None
+
+
+class BulkDummyLLM(DummyLLM):
+    """Mock LLM that writes every persona's message in one call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.bulk_calls: list[list[str]] = []
+
+    def generate_many(self, *, quotes: dict[str, Quote], profile: UserProfile) -> list[str]:
+        self.bulk_calls.append(list(quotes))
+        return [f"{persona} cheers on {profile.name}" for persona in quotes]
+
+
+def test_craft_messages_from_user_personas_uses_one_bulk_call(fake_profile_store: FakeProfileStore) -> None:
+    profile_store = fake_profile_store
+    profile = UserProfile(
+        user_id="rom",
+        name="Rom",
+        primary_persona="DJ Khaled",
+        preferred_personas=["Kobe Bryant", "DJ Khaled"],
+    )
+    profile_store.save(profile)
+
+    llm = BulkDummyLLM()
+    scraper = DummyScraper()
+    agent = MotivatorAgent(profile_store=profile_store, llm=llm)
+
+    messages = agent.craft_messages_from_user_personas(user_id="rom", scraper=scraper)
+
+    assert [m.persona_style for m in messages] == ["DJ Khaled", "Kobe Bryant"]
+    assert messages[1].text == "Kobe Bryant cheers on Rom"
+    assert llm.bulk_calls == [["DJ Khaled", "Kobe Bryant"]]
+    assert llm.calls == []
+    assert profile_store.load("rom").last_motivation_at is not None
+
+
+def test_craft_messages_from_user_personas_without_bulk_support(rom_profile_store: FakeProfileStore) -> None:
+    llm = DummyLLM()
+    agent = MotivatorAgent(profile_store=rom_profile_store, llm=llm)
+
+    messages = agent.craft_messages_from_user_personas(user_id="rom", scraper=DummyScraper())
+
+    # Calls run concurrently, so only the messages are guaranteed to be in persona order
+    assert [m.persona_style for m in messages] == ["DJ Khaled", "Kobe"]
+    assert sorted(call["persona"] for call in llm.calls) == ["DJ Khaled", "Kobe"]
+
+
+def test_craft_messages_batch_uses_given_personas(rom_profile_store: FakeProfileStore) -> None:
+    scraper = DummyScraper()
+    llm = BulkDummyLLM()
+    agent = MotivatorAgent(profile_store=rom_profile_store, llm=llm)
+
+    messages = agent.craft_messages_batch("rom", ["Serena Williams", "Marie Curie"], scraper=scraper)
+
+    assert [m.text for m in messages] == ["Serena Williams cheers on Rom", "Marie Curie cheers on Rom"]
+    assert sorted(scraper.calls) == ["Marie Curie", "Serena Williams"]
+    assert llm.bulk_calls == [["Serena Williams", "Marie Curie"]]
+
+
+def test_craft_messages_from_user_personas_scrapes_concurrently(rom_profile_store: FakeProfileStore) -> None:
+    # Both scrapes must be in flight at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BlockingScraper(DummyScraper):
+        def scrape_quotes(self, persona: str, limit: int = 3) -> list[Quote]:
+            barrier.wait()
+            return super().scrape_quotes(persona, limit)
+
+    agent = MotivatorAgent(profile_store=rom_profile_store, llm=BulkDummyLLM())
+
+    messages = agent.craft_messages_from_user_personas(user_id="rom", scraper=BlockingScraper())
+
+    assert [m.persona_style for m in messages] == ["DJ Khaled", "Kobe"]
+
+
+@pytest.mark.parametrize(
+    ("reply", "expected_requests"),
+    [('{"messages": ["Khaled says go", "Kobe says go"]}', 1), ('{"messages": ["only one"]}', 3)],
+)
+def test_generate_many_batches_personas_and_falls_back(reply: str, expected_requests: int) -> None:
+    model = OpenAIMotivationModel()
+    requests = []
+
+    def create(**kwargs):
+        requests.append(kwargs)
+        content = reply if "response_format" in kwargs else f"single {len(requests)}"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    model._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    quotes = {
+        "DJ Khaled": Quote(text="Don't play yourself", persona="DJ Khaled"),
+        "Kobe Bryant": Quote(text="Mamba mentality", persona="Kobe Bryant"),
+    }
+
+    texts = model.generate_many(quotes=quotes, profile=UserProfile(user_id="rom", name="Rom"))
+
+    assert len(texts) == 2
+    assert len(requests) == expected_requests
+    if expected_requests == 1:
+        assert texts == ["Khaled says go", "Kobe says go"]
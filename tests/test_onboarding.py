@@ -2,13 +2,43 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from collections import deque
 
 import pytest
 
 from agents.onboarding import OnboardingAgent
 from agents.user_profile import UserProfile, UserProfileStore
 
+# PAIN_POINTS is an ordered list for the menu; membership checks go through a set.
+# PERSONAS is already a dict, so `in` on it is a hash lookup
+PAIN_POINT_SET = frozenset(OnboardingAgent.PAIN_POINTS)
+
+
+@pytest.fixture
+def fake_input(monkeypatch):
+    """
+    Replace input() with a queue of scripted answers.
+
+    Returns a function that appends answers and returns the pending queue;
+    exception instances in the queue are raised instead of returned. Running
+    out of answers raises IndexError, so unexpected prompts fail the test.
+    """
+    answers: deque[str | BaseException] = deque()
+
+    def scripted_input(prompt: str = "") -> str:
+        answer = answers.popleft()
+        if isinstance(answer, BaseException):
+            raise answer
+        return answer
+
+    monkeypatch.setattr("builtins.input", scripted_input)
+
+    def feed(values: list[str | BaseException]) -> deque[str | BaseException]:
+        answers.extend(values)
+        return answers
+
+    return feed
+
 
 @pytest.fixture
 def temp_profiles_dir(tmp_path):
@@ -25,8 +55,14 @@ def profile_store(temp_profiles_dir):
 
 
 @pytest.fixture
-def onboarding_agent(profile_store):
-    """Create an OnboardingAgent instance."""
+def onboarding_agent(fake_profile_store):
+    """Create an OnboardingAgent backed by an in-memory profile store."""
+    return OnboardingAgent(fake_profile_store)
+
+
+@pytest.fixture
+def disk_onboarding_agent(profile_store):
+    """Create an OnboardingAgent that persists profiles to the temporary directory."""
     return OnboardingAgent(profile_store)
 
 
@@ -43,120 +79,112 @@ class TestOnboardingAgent:
     def test_pain_points_available(self, onboarding_agent):
         """Test that pain points are defined."""
         assert len(OnboardingAgent.PAIN_POINTS) > 0
-        assert "procrastination" in OnboardingAgent.PAIN_POINTS
-        assert "perfectionism" in OnboardingAgent.PAIN_POINTS
-        assert "burnout" in OnboardingAgent.PAIN_POINTS
+        assert {"procrastination", "perfectionism", "burnout"} <= PAIN_POINT_SET
 
-    @patch("builtins.input")
-    def test_collect_name(self, mock_input, onboarding_agent):
+    def test_collect_name(self, fake_input, onboarding_agent):
         """Test name collection."""
-        mock_input.return_value = "Alice"
+        fake_input(["Alice"])
         name = onboarding_agent._collect_name()
         assert name == "Alice"
 
-    @patch("builtins.input")
-    def test_collect_name_retry_on_empty(self, mock_input, onboarding_agent):
+    def test_collect_name_retry_on_empty(self, fake_input, onboarding_agent):
         """Test that name collection retries on empty input."""
-        mock_input.side_effect = ["", "  ", "Bob"]
+        pending = fake_input(["", "  ", "Bob"])
         name = onboarding_agent._collect_name()
         assert name == "Bob"
-        assert mock_input.call_count == 3
+        assert not pending  # all three answers consumed
 
-    @patch("builtins.input")
-    def test_select_persona(self, mock_input, onboarding_agent):
+    def test_select_persona(self, fake_input, onboarding_agent):
         """Test persona selection."""
-        mock_input.return_value = "1"  # Select first persona
+        fake_input(["1"])  # Select first persona
         persona = onboarding_agent._select_persona()
         assert persona in OnboardingAgent.PERSONAS
 
-    @patch("builtins.input")
-    def test_select_persona_invalid_then_valid(self, mock_input, onboarding_agent):
+    def test_select_persona_invalid_then_valid(self, fake_input, onboarding_agent):
         """Test persona selection with invalid input first."""
-        mock_input.side_effect = ["99", "0", "abc", "1"]
+        fake_input(["99", "0", "abc", "1"])
         persona = onboarding_agent._select_persona()
         assert persona in OnboardingAgent.PERSONAS
 
-    @patch("builtins.input")
-    def test_collect_academic_field(self, mock_input, onboarding_agent):
+    def test_collect_academic_field(self, fake_input, onboarding_agent):
         """Test academic field collection."""
-        mock_input.return_value = "Computer Science"
+        fake_input(["Computer Science"])
         field = onboarding_agent._collect_academic_field()
         assert field == "Computer Science"
 
-    @patch("builtins.input")
-    def test_collect_academic_field_skip(self, mock_input, onboarding_agent):
+    def test_collect_academic_field_skip(self, fake_input, onboarding_agent):
         """Test skipping academic field."""
-        mock_input.return_value = ""
+        fake_input([""])
         field = onboarding_agent._collect_academic_field()
         assert field is None
 
-    @patch("builtins.input")
-    def test_collect_study_topics(self, mock_input, onboarding_agent):
+    def test_collect_study_topics(self, fake_input, onboarding_agent):
         """Test study topics collection."""
-        mock_input.side_effect = ["Python", "Machine Learning", ""]
+        fake_input(["Python", "Machine Learning", ""])
         topics = onboarding_agent._collect_study_topics()
         assert topics == ["Python", "Machine Learning"]
 
-    @patch("builtins.input")
-    def test_collect_study_topics_empty(self, mock_input, onboarding_agent):
+    def test_collect_study_topics_empty(self, fake_input, onboarding_agent):
         """Test collecting no topics."""
-        mock_input.return_value = ""
+        fake_input([""])
         topics = onboarding_agent._collect_study_topics()
         assert topics == []
 
-    @patch("builtins.input")
-    def test_collect_goals(self, mock_input, onboarding_agent):
+    def test_collect_goals(self, fake_input, onboarding_agent):
         """Test goals collection."""
-        mock_input.side_effect = ["Pass exam", "Learn Python", ""]
+        fake_input(["Pass exam", "Learn Python", ""])
         goals = onboarding_agent._collect_goals()
         assert goals == ["Pass exam", "Learn Python"]
 
-    @patch("builtins.input")
-    def test_collect_goals_empty(self, mock_input, onboarding_agent):
+    def test_collect_goals_empty(self, fake_input, onboarding_agent):
         """Test collecting no goals."""
-        mock_input.return_value = ""
+        fake_input([""])
         goals = onboarding_agent._collect_goals()
         assert goals == []
 
-    @patch("builtins.input")
-    def test_collect_pain_points(self, mock_input, onboarding_agent):
+    def test_collect_pain_points(self, fake_input, onboarding_agent):
         """Test pain points collection."""
-        mock_input.return_value = "1,2,3"
+        fake_input(["1,2,3"])
         traits = onboarding_agent._collect_pain_points()
         assert len(traits) == 3
-        assert all(trait in OnboardingAgent.PAIN_POINTS for trait in traits)
+        assert PAIN_POINT_SET.issuperset(traits)
+
+    def test_collect_pain_points_deduplicates(self, fake_input, onboarding_agent):
+        """Test repeated numbers select a challenge once."""
+        fake_input(["1,1,1,2"])
+        traits = onboarding_agent._collect_pain_points()
+        assert traits == OnboardingAgent.PAIN_POINTS[:2]
 
-    @patch("builtins.input")
-    def test_collect_pain_points_skip(self, mock_input, onboarding_agent):
+    def test_collect_pain_points_skip(self, fake_input, onboarding_agent):
         """Test skipping pain points."""
-        mock_input.return_value = ""
+        fake_input([""])
         traits = onboarding_agent._collect_pain_points()
         assert traits == []
 
-    @patch("builtins.input")
-    def test_collect_pain_points_invalid(self, mock_input, onboarding_agent):
+    def test_collect_pain_points_invalid(self, fake_input, onboarding_agent):
         """Test invalid pain points input."""
-        mock_input.return_value = "abc,xyz"
+        fake_input(["abc,xyz"])
         traits = onboarding_agent._collect_pain_points()
         assert traits == []
 
-    @patch("builtins.input")
-    def test_full_onboarding_flow(self, mock_input, onboarding_agent, temp_profiles_dir):
+    def test_full_onboarding_flow(self, fake_input, disk_onboarding_agent, temp_profiles_dir):
         """Test complete onboarding flow."""
         # Mock all user inputs
-        mock_input.side_effect = [
-            "Alice",  # name
-            "1",  # persona selection
-            "Computer Science",  # academic field
-            "Python",  # topic 1
-            "AI",  # topic 2
-            "",  # finish topics
-            "Pass exams",  # goal 1
-            "",  # finish goals
-            "1,2",  # pain points
-        ]
-
-        profile = onboarding_agent.run_onboarding("test_user")
+        fake_input(
+            [
+                "Alice",  # name
+                "1",  # persona selection
+                "Computer Science",  # academic field
+                "Python",  # topic 1
+                "AI",  # topic 2
+                "",  # finish topics
+                "Pass exams",  # goal 1
+                "",  # finish goals
+                "1,2",  # pain points
+            ]
+        )
+
+        profile = disk_onboarding_agent.run_onboarding("test_user")
 
         # Verify profile was created correctly
         assert profile.user_id == "test_user"
@@ -173,19 +201,18 @@ class TestOnboardingAgent:
         assert profile_path.exists()
 
         # Verify saved profile can be loaded
-        loaded_profile = onboarding_agent.profile_store.load("test_user")
+        loaded_profile = disk_onboarding_agent.profile_store.load("test_user")
         assert loaded_profile.user_id == profile.user_id
         assert loaded_profile.name == profile.name
 
-    @patch("builtins.input")
-    def test_onboarding_keyboard_interrupt(self, mock_input, onboarding_agent):
+    def test_onboarding_keyboard_interrupt(self, fake_input, onboarding_agent):
         """Test onboarding handles keyboard interrupt."""
-        mock_input.side_effect = KeyboardInterrupt()
+        fake_input([KeyboardInterrupt()])
 
         with pytest.raises(KeyboardInterrupt):
             onboarding_agent.run_onboarding("test_user")
 
-    def test_profile_store_integration(self, onboarding_agent, temp_profiles_dir):
+    def test_profile_store_integration(self, disk_onboarding_agent):
         """Test that OnboardingAgent correctly integrates with UserProfileStore."""
         # Create a profile manually
         profile = UserProfile(
@@ -199,10 +226,10 @@ class TestOnboardingAgent:
         )
 
         # Save it
-        onboarding_agent.profile_store.save(profile)
+        disk_onboarding_agent.profile_store.save(profile)
 
         # Verify it can be loaded
-        loaded = onboarding_agent.profile_store.load("test_integration")
+        loaded = disk_onboarding_agent.profile_store.load("test_integration")
         assert loaded.user_id == "test_integration"
         assert loaded.name == "Test User"
         assert loaded.primary_persona == "Richard Feynman"
@@ -211,17 +238,18 @@ class TestOnboardingAgent:
 class TestOnboardingDataValidation:
     """Test data validation during onboarding."""
 
-    @patch("builtins.input")
-    def test_profile_with_minimal_data(self, mock_input, onboarding_agent):
+    def test_profile_with_minimal_data(self, fake_input, onboarding_agent):
         """Test profile creation with minimal required data."""
-        mock_input.side_effect = [
-            "Bob",  # name
-            "1",  # persona
-            "",  # skip academic field
-            "",  # no topics
-            "",  # no goals
-            "",  # no pain points
-        ]
+        fake_input(
+            [
+                "Bob",  # name
+                "1",  # persona
+                "",  # skip academic field
+                "",  # no topics
+                "",  # no goals
+                "",  # no pain points
+            ]
+        )
 
         profile = onboarding_agent.run_onboarding("minimal_user")
 
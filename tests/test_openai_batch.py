@@ -0,0 +1,78 @@
+"""Tests for the OpenAI Batch API helper."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from core.openai_batch import run_chat_batch, to_openai_messages
+
+
+class FakeBatchClient:
+    """Answers each request with its own custom_id, in reverse order."""
+
+    def __init__(self, statuses: list[str]) -> None:
+        self.statuses = list(statuses)
+        self.uploaded: list[dict] = []
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve)
+
+    def _create_file(self, file, purpose):
+        assert purpose == "batch"
+        self.uploaded = [json.loads(line) for line in file[1].decode("utf-8").splitlines()]
+        return SimpleNamespace(id="file-in")
+
+    def _batch(self):
+        return SimpleNamespace(id="batch-1", status=self.statuses.pop(0), output_file_id="file-out")
+
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        assert input_file_id == "file-in"
+        return self._batch()
+
+    def _retrieve(self, batch_id):
+        return self._batch()
+
+    def _content(self, file_id):
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": {"content": f"answer {request['custom_id']}"}}]},
+                    },
+                }
+            )
+            for request in reversed(self.uploaded)
+        ]
+        return SimpleNamespace(text="\n".join(lines))
+
+
+def test_run_chat_batch_returns_answers_in_input_order() -> None:
+    client = FakeBatchClient(["validating", "in_progress", "completed"])
+    bodies = [{"model": "gpt-4o-mini", "messages": []} for _ in range(3)]
+
+    answers = run_chat_batch(client, bodies, poll_interval=0)
+
+    assert answers == ["answer 0", "answer 1", "answer 2"]
+    assert [request["url"] for request in client.uploaded] == ["/v1/chat/completions"] * 3
+
+
+def test_run_chat_batch_raises_when_batch_fails() -> None:
+    client = FakeBatchClient(["in_progress", "failed"])
+
+    with pytest.raises(RuntimeError, match="failed"):
+        run_chat_batch(client, [{"model": "gpt-4o-mini", "messages": []}], poll_interval=0)
+
+
+def test_to_openai_messages_maps_roles() -> None:
+    messages = [SystemMessage(content="rules"), HumanMessage(content="hi"), AIMessage(content="hello")]
+
+    assert to_openai_messages(messages) == [
+        {"role": "system", "content": "rules"},
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+    ]
@@ -0,0 +1,115 @@
+"""Tests for the LLM-backed quote scraper."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agents.quote_scraper import WebSearchQuoteScraper
+
+
+def make_scraper(reply: str, cache_dir=None) -> WebSearchQuoteScraper:
+    scraper = WebSearchQuoteScraper(cache_dir=cache_dir)
+    completion = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+    scraper.requests = 0
+
+    def create(**kwargs):
+        scraper.requests += 1
+        return completion
+
+    scraper._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return scraper
+
+
+@pytest.mark.parametrize("persona", ["Kobe Bryant", "Serena Williams", "Marie Curie"])
+def test_scrape_quotes_parses_fenced_json(persona: str) -> None:
+    reply = f"""```json
+[
+  {{"text": "Rest when you're weary.", "persona": "{persona}", "tags": ["rest"], "source_url": null}},
+  {{"text": "Job's not finished.", "persona": "{persona}", "source_url": "https://example.com/quote"}},
+  {{"text": "Keep going.", "persona": "{persona}", "tags": ["focus"]}}
+]
+```"""
+
+    quotes = make_scraper(reply).scrape_quotes(persona, limit=2)
+
+    assert [quote.text for quote in quotes] == ["Rest when you're weary.", "Job's not finished."]
+    assert {quote.persona for quote in quotes} == {persona}
+    assert quotes[0].tags == ["rest"]
+    assert quotes[1].tags == []
+    assert str(quotes[1].source_url) == "https://example.com/quote"
+
+
+@pytest.mark.parametrize("reply", ["not json", '[{"text": "No persona"}]'])
+def test_scrape_quotes_returns_empty_list_on_bad_reply(reply) -> None:
+    assert make_scraper(reply).scrape_quotes("Kobe Bryant") == []
+
+
+class FakeAsyncOpenAI:
+    """Async client whose requests only complete once ``expected`` of them are in flight."""
+
+    def __init__(self, expected: int) -> None:
+        self.expected = expected
+        self.in_flight = 0
+        self.closed = False
+        self.all_started = asyncio.Event()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, model, messages, temperature):
+        self.in_flight += 1
+        if self.in_flight == self.expected:
+            self.all_started.set()
+        await asyncio.wait_for(self.all_started.wait(), timeout=5)
+        persona = messages[1]["content"].split(" from ")[1].split(".")[0]
+        reply = f'[{{"text": "Keep going.", "persona": "{persona}"}}]'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+
+def test_ascrape_personas_runs_requests_concurrently(monkeypatch, tmp_path) -> None:
+    scraper = make_scraper("[]", cache_dir=tmp_path)
+    personas = ["Kobe Bryant", "Serena Williams", "Marie Curie"]
+    client = FakeAsyncOpenAI(expected=len(personas))
+    monkeypatch.setattr(scraper, "_async_client", lambda: client)
+
+    results = asyncio.run(scraper.ascrape_personas(personas, limit=2))
+
+    assert list(results) == personas
+    assert [quote.persona for quote in results["Marie Curie"]] == ["Marie Curie"]
+    assert client.closed
+    # Results land in the shared disk cache, so the sync path doesn't call the API
+    assert scraper.scrape_quotes("Serena Williams", limit=2)[0].text == "Keep going."
+    assert scraper.requests == 0
+
+
+def test_scrape_quotes_reuses_disk_cache(tmp_path) -> None:
+    reply = '[{"text": "Mamba mentality.", "persona": "Kobe Bryant", "tags": ["focus"]}]'
+    make_scraper(reply, cache_dir=tmp_path).scrape_quotes("Kobe Bryant", limit=1)
+
+    # A new scraper (e.g. the next run) reads the file instead of calling the API
+    scraper = make_scraper("[]", cache_dir=tmp_path)
+    quotes = scraper.scrape_quotes(" kobe bryant", limit=1)
+
+    assert [quote.text for quote in quotes] == ["Mamba mentality."]
+    assert scraper.requests == 0
+
+
+def test_scrape_quotes_skips_expired_and_empty_cache(tmp_path) -> None:
+    scraper = make_scraper("not json", cache_dir=tmp_path)
+    assert scraper.scrape_quotes("Kobe Bryant") == []
+    assert list(tmp_path.iterdir()) == []
+
+    reply = '[{"text": "Mamba mentality.", "persona": "Kobe Bryant"}]'
+    make_scraper(reply, cache_dir=tmp_path).scrape_quotes("Kobe Bryant")
+    expired = make_scraper("[]", cache_dir=tmp_path)
+    expired.cache_ttl = 0
+
+    assert expired.scrape_quotes("Kobe Bryant") == []
+    assert expired.requests == 1
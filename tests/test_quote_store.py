@@ -2,40 +2,50 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from agents.quote_store import Quote, QuoteStore
 
 
-def test_add_and_retrieve_quotes(tmp_path) -> None:
-    store = QuoteStore(tmp_path / "quotes.json")
-    quote_one = Quote(
-        text="Stay hungry, stay foolish.",
-        persona="Steve Jobs",
-        tags=["focus", "innovation"],
-        source_url="https://example.com/jobs",
-    )
-    quote_two = Quote(
-        text="Everything negative – pressure, challenges – is an opportunity to rise.",
-        persona="Kobe Bryant",
-        tags=["perseverance"],
-    )
-
-    store.add([quote_one, quote_two])
-
-    jobs_quotes = store.get_by_persona("Steve Jobs")
+def test_retrieve_quotes_by_persona_and_tag(shared_quote_store: QuoteStore) -> None:
+    jobs_quotes = shared_quote_store.get_by_persona("Steve Jobs")
     assert len(jobs_quotes) == 1
-    assert jobs_quotes[0].text == quote_one.text
+    assert jobs_quotes[0].text == "Stay hungry, stay foolish."
 
-    perseverance_quotes = store.search_by_tag("perseverance")
+    perseverance_quotes = shared_quote_store.search_by_tag("perseverance")
     assert len(perseverance_quotes) == 1
     assert perseverance_quotes[0].persona == "Kobe Bryant"
 
 
+def test_added_quotes_persist_to_disk(shared_quote_store: QuoteStore) -> None:
+    reloaded = QuoteStore(shared_quote_store.path)
+    assert {quote.persona for quote in reloaded.all()} == {"Steve Jobs", "Kobe Bryant"}
+
+
 def test_add_deduplicates_by_persona_and_text(tmp_path) -> None:
     store = QuoteStore(tmp_path / "quotes.json")
     quote = Quote(text="Focus wins games.", persona="Kobe Bryant", tags=["focus"])
 
-    store.add([quote])
-    store.add([quote])  # duplicate
+    assert store.add([quote]) == 1
+    assert store.add([quote]) == 0  # duplicate
+    assert store.add([quote, quote.model_copy(update={"text": "  focus WINS games. "})]) == 0
 
     all_quotes = store.all()
     assert len(all_quotes) == 1
+    assert store.count() == len(store) == 1
+
+
+def test_add_many_single_write(tmp_path, monkeypatch) -> None:
+    store = QuoteStore(tmp_path / "quotes.json")
+    writes: list[Path] = []
+    original = Path.write_bytes
+    monkeypatch.setattr(Path, "write_bytes", lambda self, data: writes.append(self) or original(self, data))
+
+    for i in range(5):
+        assert store.add([Quote(text=f"Quote {i}", persona="Kobe Bryant")], persist=False) == 1
+    assert writes == []
+
+    assert store.flush() is True
+    assert store.flush() is False  # nothing pending
+    assert len(writes) == 1
+    assert QuoteStore(store.path).count() == 5
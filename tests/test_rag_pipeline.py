@@ -1,22 +1,75 @@
 """Tests for RAGPipeline - end-to-end document ingestion and retrieval."""
 
-from pathlib import Path
+import shutil
 
 import pytest
 
+from core.document_processor import DocumentProcessor
 from core.rag_pipeline import RAGPipeline
 
+try:  # pragma: no cover - reflink copies are Linux-only
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+# ioctl request that shares a file's extents with another (btrfs, XFS); see ioctl_ficlone(2)
+FICLONE = 0x40049409
+
+
+def _reflink_copy(src: str, dst: str) -> str:
+    """Clone ``src`` in O(1) where the filesystem supports it, otherwise copy it."""
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+@pytest.fixture(scope="session")
+def parsed_chunks(test_pdf):
+    """Chunks of the test PDF, parsed once for the session; tests must not mutate them."""
+    return DocumentProcessor().process_pdf(test_pdf)
+
 
 @pytest.fixture
-def test_pdf():
-    """Get path to test PDF fixture."""
-    return Path(__file__).parent / "fixtures" / "calculus_sample.pdf"
+def pipeline(tmp_path, fake_embeddings):
+    """Create an empty RAG pipeline with temporary storage, for tests that ingest or clear."""
+    return RAGPipeline(
+        collection_name="test_collection", persist_directory=tmp_path / "chroma_test", embeddings=fake_embeddings
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_pipeline(worker_persist_root, fake_embeddings, parsed_chunks):
+    """RAG pipeline with the test PDF ingested once for the session; tests must only query it."""
+    pipeline = RAGPipeline(
+        collection_name="shared_collection",
+        persist_directory=worker_persist_root / "shared",
+        embeddings=fake_embeddings,
+    )
+    pipeline.ingest_documents(parsed_chunks)
+    return pipeline
+
+
+@pytest.fixture(scope="session")
+def golden_chroma_dir(worker_persist_root, fake_embeddings, parsed_chunks):
+    """Chroma directory holding the ingested test PDF; tests copy it rather than write to it."""
+    persist_dir = worker_persist_root / "golden"
+    RAGPipeline(
+        collection_name="test_collection", persist_directory=persist_dir, embeddings=fake_embeddings
+    ).ingest_documents(parsed_chunks)
+    return persist_dir
 
 
 @pytest.fixture
-def pipeline(tmp_path):
-    """Create a RAG pipeline with temporary storage."""
-    return RAGPipeline(collection_name="test_collection", persist_directory=tmp_path / "chroma_test")
+def ingested_pipeline(tmp_path, fake_embeddings, golden_chroma_dir):
+    """Pipeline over a private copy of the golden store, for tests that change an ingested collection."""
+    persist_dir = shutil.copytree(golden_chroma_dir, tmp_path / "chroma_test", copy_function=_reflink_copy)
+    return RAGPipeline(collection_name="test_collection", persist_directory=persist_dir, embeddings=fake_embeddings)
 
 
 def test_pipeline_initialization(pipeline):
@@ -28,6 +81,16 @@ def test_pipeline_initialization(pipeline):
     assert pipeline.vector_store is not None
 
 
+def test_injected_embeddings_need_no_api_key(tmp_path, fake_embeddings, monkeypatch):
+    """Test a pipeline given its own embeddings doesn't require an OpenAI key."""
+    monkeypatch.delenv("OPENAI_API_KEY")
+
+    pipeline = RAGPipeline(persist_directory=tmp_path / "chroma_test", embeddings=fake_embeddings)
+
+    assert pipeline.embeddings is fake_embeddings
+    assert pipeline.vector_store.embedding_function is fake_embeddings
+
+
 def test_ingest_pdf_success(pipeline, test_pdf):
     """Test successful PDF ingestion."""
     num_chunks = pipeline.ingest([test_pdf])
@@ -54,13 +117,10 @@ def test_ingest_nonexistent_file(pipeline, tmp_path):
         pipeline.ingest([fake_path])
 
 
-def test_run_query_returns_relevant_results(pipeline, test_pdf):
+def test_run_query_returns_relevant_results(shared_pipeline):
     """Test query returns relevant content."""
-    # Ingest the calculus PDF
-    pipeline.ingest([test_pdf])
-
     # Query about derivatives
-    results = pipeline.run_query("What is a derivative?", k=3)
+    results = shared_pipeline.run_query("What is a derivative?", k=3)
 
     assert len(results) <= 3
     assert all(isinstance(result, str) for result in results)
@@ -70,16 +130,14 @@ def test_run_query_returns_relevant_results(pipeline, test_pdf):
     assert "derivative" in all_content
 
 
-def test_run_query_different_topics(pipeline, test_pdf):
+def test_run_query_different_topics(shared_pipeline):
     """Test queries for different topics return appropriate content."""
-    pipeline.ingest([test_pdf])
-
     # Query about integrals
-    integral_results = pipeline.run_query("Tell me about integrals", k=2)
+    integral_results = shared_pipeline.run_query("Tell me about integrals", k=2)
     integral_content = " ".join(integral_results).lower()
 
     # Query about limits
-    limit_results = pipeline.run_query("What are limits?", k=2)
+    limit_results = shared_pipeline.run_query("What are limits?", k=2)
     limit_content = " ".join(limit_results).lower()
 
     # Should find relevant content for each topic
@@ -87,22 +145,70 @@ def test_run_query_different_topics(pipeline, test_pdf):
     assert "limit" in limit_content
 
 
-def test_run_query_k_parameter(pipeline, test_pdf):
+def test_run_query_k_parameter(shared_pipeline):
     """Test k parameter controls number of results."""
-    pipeline.ingest([test_pdf])
-
-    results_3 = pipeline.run_query("calculus", k=3)
-    results_5 = pipeline.run_query("calculus", k=5)
+    results_3 = shared_pipeline.run_query("calculus", k=3)
+    results_5 = shared_pipeline.run_query("calculus", k=5)
 
     assert len(results_3) <= 3
     assert len(results_5) <= 5
 
 
-def test_run_query_with_scores(pipeline, test_pdf):
-    """Test query with similarity scores."""
-    pipeline.ingest([test_pdf])
+def test_run_query_caches_repeated_queries(ingested_pipeline, parsed_chunks, monkeypatch):
+    """Test repeated queries are served from cache until the store changes."""
+    pipeline = ingested_pipeline
+    calls = []
+    search = pipeline.vector_store.similarity_search
+    monkeypatch.setattr(
+        pipeline.vector_store,
+        "similarity_search",
+        lambda query, k=5: calls.append(query) or search(query, k=k),
+    )
+
+    first = pipeline.run_query("What is a derivative?", k=2)
+    second = pipeline.run_query("  what is a   DERIVATIVE? ", k=2)
 
-    results = pipeline.run_query_with_scores("derivative", k=3)
+    assert second == first
+    assert len(calls) == 1
+
+    pipeline.ingest_documents(parsed_chunks)
+    pipeline.run_query("What is a derivative?", k=2)
+
+    assert len(calls) == 2
+
+
+def test_run_queries_shares_the_query_cache(shared_pipeline, monkeypatch):
+    """Test batched queries only fetch what run_query hasn't cached, and fill the cache."""
+    pipeline = shared_pipeline
+    monkeypatch.setattr(pipeline, "_query_cache", type(pipeline._query_cache)())
+    single_calls, batch_calls = [], []
+    search = pipeline.vector_store.similarity_search
+    search_batch = pipeline.vector_store.similarity_search_batch
+    monkeypatch.setattr(
+        pipeline.vector_store,
+        "similarity_search",
+        lambda query, k=5: single_calls.append(query) or search(query, k=k),
+    )
+    monkeypatch.setattr(
+        pipeline.vector_store,
+        "similarity_search_batch",
+        lambda queries, k=5: batch_calls.append(list(queries)) or search_batch(queries, k=k),
+    )
+
+    derivative = pipeline.run_query("What is a derivative?", k=2)
+    results = pipeline.run_queries(["what is a DERIVATIVE?", "What are limits?", "what are  limits?"], k=2)
+
+    assert results[0] == derivative
+    assert results[1] == results[2]
+    assert batch_calls == [["What are limits?"]]
+
+    assert pipeline.run_query("What are limits?", k=2) == results[1]
+    assert single_calls == ["What is a derivative?"]
+
+
+def test_run_query_with_scores(shared_pipeline):
+    """Test query with similarity scores."""
+    results = shared_pipeline.run_query_with_scores("derivative", k=3)
 
     assert len(results) <= 3
     for content, score in results:
@@ -111,33 +217,37 @@ def test_run_query_with_scores(pipeline, test_pdf):
         assert score >= 0  # Scores should be non-negative
 
 
-def test_count_documents(pipeline, test_pdf):
+def test_count_documents(pipeline, parsed_chunks):
     """Test document counting."""
     assert pipeline.count_documents() == 0
 
-    pipeline.ingest([test_pdf])
+    pipeline.ingest_documents(parsed_chunks)
 
     count = pipeline.count_documents()
     assert count > 0
 
 
-def test_clear_pipeline(pipeline, test_pdf):
+def test_clear_pipeline(ingested_pipeline, golden_chroma_dir, fake_embeddings):
     """Test clearing all documents."""
-    pipeline.ingest([test_pdf])
-    assert pipeline.count_documents() > 0
+    assert ingested_pipeline.count_documents() > 0
 
-    pipeline.clear()
+    ingested_pipeline.clear()
 
-    assert pipeline.count_documents() == 0
+    assert ingested_pipeline.count_documents() == 0
+    # The copy is independent of the snapshot it came from
+    golden = RAGPipeline(
+        collection_name="test_collection", persist_directory=golden_chroma_dir, embeddings=fake_embeddings
+    )
+    assert golden.count_documents() > 0
 
 
-def test_persistence(tmp_path, test_pdf):
+def test_persistence(tmp_path, parsed_chunks):
     """Test that documents persist between pipeline instances."""
     persist_dir = tmp_path / "persist_test"
 
     # Create pipeline and ingest
     pipeline1 = RAGPipeline(collection_name="persist_test", persist_directory=persist_dir)
-    num_chunks = pipeline1.ingest([test_pdf])
+    num_chunks = pipeline1.ingest_documents(parsed_chunks)
 
     # Create new pipeline instance with same directory
     pipeline2 = RAGPipeline(collection_name="persist_test", persist_directory=persist_dir)
@@ -150,14 +260,22 @@ def test_persistence(tmp_path, test_pdf):
     assert len(results) > 0
 
 
-def test_get_retriever(pipeline, test_pdf):
+def test_get_retriever(shared_pipeline):
     """Test getting a LangChain retriever."""
-    pipeline.ingest([test_pdf])
-
-    retriever = pipeline.get_retriever(k=3)
+    retriever = shared_pipeline.get_retriever(k=3)
 
     assert retriever is not None
 
     # Test retriever works (using invoke API)
     docs = retriever.invoke("What is a derivative?")
     assert len(docs) > 0
+
+
+def test_pipelines_share_clients(tmp_path):
+    """Test pipelines in one directory reuse the embeddings and Chroma clients."""
+    first = RAGPipeline(collection_name="user_a", persist_directory=tmp_path / "chroma_shared")
+    second = RAGPipeline(collection_name="user_b", persist_directory=tmp_path / "chroma_shared")
+
+    assert first.embeddings is second.embeddings
+    assert first.vector_store.client is second.vector_store.client
+    assert first.collection_name != second.collection_name
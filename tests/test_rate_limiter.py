@@ -0,0 +1,43 @@
+"""Tests for the client-side token bucket."""
+
+from __future__ import annotations
+
+import pytest
+
+from core import rate_limiter
+from core.rate_limiter import TokenBucket
+
+
+def test_acquire_within_capacity_does_not_sleep(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleeps.append)
+
+    bucket = TokenBucket(capacity=3, period=60.0)
+    for _ in range(3):
+        bucket.acquire()
+
+    assert sleeps == []
+
+
+def test_acquire_waits_for_refill_when_empty(monkeypatch) -> None:
+    clock = [100.0]
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(rate_limiter.time, "sleep", fake_sleep)
+
+    bucket = TokenBucket(capacity=2, period=60.0)
+    bucket.acquire(2)
+    bucket.acquire()
+
+    # One token refills every 30 seconds
+    assert sleeps == [pytest.approx(30.0)]
+
+
+def test_invalid_capacity_raises() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        TokenBucket(capacity=0)
@@ -0,0 +1,44 @@
+"""Tests for the exact-match LLM response cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from core import response_cache
+from core.response_cache import ResponseCache, prompt_key
+
+
+def test_prompt_key_separates_parts() -> None:
+    assert prompt_key("ab", "c") != prompt_key("a", "bc")
+    assert prompt_key("model", "prompt") == prompt_key("model", "prompt")
+
+
+def test_get_returns_stored_value_until_ttl_expires(monkeypatch) -> None:
+    clock = [0.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: clock[0])
+
+    cache = ResponseCache(max_entries=4, ttl=10.0)
+    cache.set("key", '{"weak_points": []}')
+
+    assert cache.get("key") == '{"weak_points": []}'
+
+    clock[0] = 11.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_set_evicts_least_recently_used() -> None:
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")  # "b" is now the oldest
+    cache.set("c", "3")
+
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+
+
+def test_invalid_limits_raise() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        ResponseCache(max_entries=0)
@@ -2,30 +2,28 @@
 
 from __future__ import annotations
 
+import re
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
 import pytest
 
 from agents.scheduler_agent import SchedulerAgent
 
+# Expected error messages, compiled once rather than by every pytest.raises(match=...)
+_ERR_USER_INPUT = re.compile(r"Context must include 'user_input'")
+_ERR_JSON = re.compile(r"valid JSON")
+_ERR_FIELDS = re.compile(r"missing fields")
+_ERR_END_BEFORE_START = re.compile(r"End time must be after start time")
+_ERR_TIME_FORMAT = re.compile(r"HH:MM 24-hour")
+_ERR_WINDOW_TOO_SMALL = re.compile(r"No Pomodoro blocks fit")
+_ERR_EMPTY_SUBJECTS = re.compile(r"non-empty 'subjects'")
 
-class DummyLLM:
-    """Returns a canned JSON response for deterministic testing."""
-
-    def __init__(self, response: str) -> None:
-        self.response = response
-        self.last_prompt: str | None = None
-
-    def generate(self, prompt: str) -> str:
-        self.last_prompt = prompt
-        return self.response
-
-
-def make_agent(json_response: str) -> SchedulerAgent:
-    """Helper to build a scheduler agent with a canned LLM reply."""
-    return SchedulerAgent(llm=DummyLLM(json_response))
 
-
-def test_generate_schedule_creates_rotating_pomodoro_blocks() -> None:
-    agent = make_agent('{"start_time": "17:00", "end_time": "19:00", "subjects": ["Math", "Physics"], "notes": ""}')
+def test_generate_schedule_creates_rotating_pomodoro_blocks(scheduler_agent_factory) -> None:
+    agent = scheduler_agent_factory(
+        {"start_time": "17:00", "end_time": "19:00", "subjects": ["Math", "Physics"], "notes": ""}
+    )
 
     schedule = agent.generate_schedule({"user_input": "I am free after 5pm until 7pm for math and physics."})
 
@@ -54,58 +52,104 @@ def test_generate_schedule_creates_rotating_pomodoro_blocks() -> None:
     assert "subjects" in schedule["preferences"]
 
 
-def test_generate_schedule_requires_user_input() -> None:
-    agent = make_agent('{"start_time": "09:00", "end_time": "10:00", "subjects": ["Math"]}')
-    with pytest.raises(ValueError, match="Context must include 'user_input'"):
+def test_generate_schedule_requires_user_input(scheduler_agent_factory) -> None:
+    agent = scheduler_agent_factory({"start_time": "09:00", "end_time": "10:00", "subjects": ["Math"]})
+    with pytest.raises(ValueError, match=_ERR_USER_INPUT):
         agent.generate_schedule({})
 
 
-def test_invalid_json_from_llm_raises() -> None:
-    agent = make_agent("not valid json")
-    with pytest.raises(ValueError, match="valid JSON"):
-        agent.generate_schedule({"user_input": "study time"})
-
-
-def test_missing_required_fields_raises() -> None:
-    agent = make_agent('{"start_time": "08:00"}')
-    with pytest.raises(ValueError, match="missing fields"):
-        agent.generate_schedule({"user_input": "morning study"})
-
-
-def test_end_before_start_raises() -> None:
-    agent = make_agent('{"start_time": "12:00", "end_time": "11:00", "subjects": ["History"]}')
-    with pytest.raises(ValueError, match="End time must be after start time"):
-        agent.generate_schedule({"user_input": "lunch study"})
-
-
-def test_window_too_small_for_pomodoro_raises() -> None:
-    agent = SchedulerAgent(
-        llm=DummyLLM('{"start_time": "10:00", "end_time": "10:10", "subjects": ["Biology"]}'),
+@pytest.mark.parametrize(
+    ("llm_reply", "user_input", "match"),
+    [
+        pytest.param("not valid json", "study time", _ERR_JSON, id="invalid-json"),
+        pytest.param({"start_time": "08:00"}, "morning study", _ERR_FIELDS, id="missing-fields"),
+        pytest.param(
+            {"start_time": "12:00", "end_time": "11:00", "subjects": ["History"]},
+            "lunch study",
+            _ERR_END_BEFORE_START,
+            id="end-before-start",
+        ),
+        pytest.param(
+            {"start_time": "10AM", "end_time": "12:00", "subjects": ["Chemistry"]},
+            "late morning study",
+            _ERR_TIME_FORMAT,
+            id="invalid-time-format",
+        ),
+    ],
+)
+def test_invalid_llm_reply_raises(
+    scheduler_agent_factory, llm_reply: str | dict, user_input: str, match: re.Pattern[str]
+) -> None:
+    agent = scheduler_agent_factory(llm_reply)
+    with pytest.raises(ValueError, match=match):
+        agent.generate_schedule({"user_input": user_input})
+
+
+def test_window_too_small_for_pomodoro_raises(scheduler_agent_factory) -> None:
+    agent = scheduler_agent_factory(
+        {"start_time": "10:00", "end_time": "10:10", "subjects": ["Biology"]},
         pomodoro_minutes=25,
         break_minutes=5,
     )
-    with pytest.raises(ValueError, match="No Pomodoro blocks fit"):
+    with pytest.raises(ValueError, match=_ERR_WINDOW_TOO_SMALL):
         agent.generate_schedule({"user_input": "short break"})
 
 
+def test_extract_subjects_returns_independent_lists() -> None:
+    agent = SchedulerAgent()
+    note = "I want to focus on algebra and chemistry."
+
+    first = agent._extract_subjects(note)
+    first.append("History")
+
+    assert agent._extract_subjects(note) == ["algebra", "chemistry"]
+
+
 class FakeCalendarConnector:
-    """In-memory fake for testing calendar interactions."""
+    """
+    In-memory fake for testing calendar interactions.
+
+    Events are indexed by start date once, and list_events answers the
+    time_min/time_max range like the real API, recording each query.
+    """
 
     def __init__(self, existing_events=None):
         self.existing_events = existing_events or []
         self.created_events = []
+        self.list_calls: list[tuple[str | None, str | None]] = []
+        self._events_by_day: dict[date, list[tuple[datetime, datetime, dict]]] = defaultdict(list)
+        for event in self.existing_events:
+            start = datetime.fromisoformat(event["start"]["dateTime"])
+            end = datetime.fromisoformat(event["end"]["dateTime"])
+            self._events_by_day[start.date()].append((start, end, event))
 
     def create_event(self, payload):
         self.created_events.append(payload)
 
     def list_events(self, time_min=None, time_max=None, calendar_id="primary", max_results=50):
-        return self.existing_events
+        self.list_calls.append((time_min, time_max))
+        if time_min is None or time_max is None:
+            return self.existing_events[:max_results]
+        window_start = datetime.fromisoformat(time_min)
+        window_end = datetime.fromisoformat(time_max)
+        # Events may start the day before and run past midnight
+        matches = [
+            event
+            for day in _days_between(window_start - timedelta(days=1), window_end)
+            for start, end, event in self._events_by_day.get(day, ())
+            if start < window_end and end > window_start
+        ]
+        return matches[:max_results]
 
     def call_tool(self, tool_name, arguments):
         return None
 
 
-def test_check_availability_finds_conflicts():
+def _days_between(start: datetime, end: datetime) -> list[date]:
+    return [start.date() + timedelta(days=offset) for offset in range((end.date() - start.date()).days + 1)]
+
+
+def test_check_availability_finds_conflicts(scheduler_agent_factory):
     """SchedulerAgent.check_availability returns overlapping events."""
     existing = [
         {
@@ -115,8 +159,8 @@ def test_check_availability_finds_conflicts():
         },
     ]
     connector = FakeCalendarConnector(existing_events=existing)
-    agent = SchedulerAgent(
-        llm=DummyLLM('{"start_time": "17:00", "end_time": "19:00", "subjects": ["Math"]}'),
+    agent = scheduler_agent_factory(
+        {"start_time": "17:00", "end_time": "19:00", "subjects": ["Math"]},
         calendar_connector=connector,
     )
     conflicts = agent.check_availability("2026-02-14", "17:00", "19:00")
@@ -124,24 +168,61 @@ def test_check_availability_finds_conflicts():
     assert conflicts[0]["summary"] == "Team Meeting"
 
 
-def test_check_availability_returns_empty_when_free():
+def test_check_availability_returns_empty_when_free(scheduler_agent_factory):
     connector = FakeCalendarConnector(existing_events=[])
-    agent = SchedulerAgent(
-        llm=DummyLLM('{"start_time":"10:00","end_time":"12:00","subjects":["Math"]}'),
+    agent = scheduler_agent_factory(
+        {"start_time": "10:00", "end_time": "12:00", "subjects": ["Math"]},
         calendar_connector=connector,
     )
     conflicts = agent.check_availability("2026-02-14", "10:00", "12:00")
     assert conflicts == []
 
 
-def test_check_availability_none_connector():
+def test_check_availability_none_connector(scheduler_agent_factory):
     """No connector configured returns empty (graceful degradation)."""
-    agent = SchedulerAgent(llm=DummyLLM("{}"), calendar_connector=None)
+    agent = scheduler_agent_factory({}, calendar_connector=None)
     conflicts = agent.check_availability("2026-02-14", "10:00", "12:00")
     assert conflicts == []
 
 
-def test_invalid_time_format_raises() -> None:
-    agent = make_agent('{"start_time": "10AM", "end_time": "12:00", "subjects": ["Chemistry"]}')
-    with pytest.raises(ValueError, match="HH:MM 24-hour"):
-        agent.generate_schedule({"user_input": "late morning study"})
+def test_preferences_prompt_carries_date_and_note(scheduler_agent_factory) -> None:
+    agent = scheduler_agent_factory({"start_time": "09:00", "end_time": "10:00", "subjects": ["Math"]})
+
+    agent.generate_schedule({"user_input": "math at 9"})
+
+    prompt = agent.llm.last_prompt
+    assert f"({date.today():%Y-%m-%d})" in prompt
+    assert prompt.endswith("USER_NOTE: math at 9\n")
+
+
+def test_dict_reply_is_validated_and_not_mutated(scheduler_agent_factory) -> None:
+    reply = {"start_time": "09:00", "end_time": "10:00", "subjects": ["Math"]}
+    agent = scheduler_agent_factory(reply)
+
+    schedule = agent.generate_schedule({"user_input": "math at 9"})
+
+    assert schedule["preferences"]["notes"] == ""
+    assert "notes" not in reply
+    assert agent._validate_preferences(reply) is reply
+    with pytest.raises(ValueError, match=_ERR_EMPTY_SUBJECTS):
+        agent._validate_preferences({**reply, "subjects": []})
+
+
+def test_check_availability_queries_only_the_window(scheduler_agent_factory):
+    """The agent pushes its window down to list_events rather than scanning the whole calendar."""
+    existing = [
+        {
+            "summary": f"Event {hour}",
+            "start": {"dateTime": f"2026-02-{day}T{hour:02d}:00:00"},
+            "end": {"dateTime": f"2026-02-{day}T{hour:02d}:30:00"},
+        }
+        for day in (13, 14, 15)
+        for hour in range(8, 20)
+    ]
+    connector = FakeCalendarConnector(existing_events=existing)
+    agent = scheduler_agent_factory({}, calendar_connector=connector)
+
+    conflicts = agent.check_availability("2026-02-14", "10:00", "12:00")
+
+    assert connector.list_calls == [("2026-02-14T10:00:00", "2026-02-14T12:00:00")]
+    assert [event["summary"] for event in conflicts] == ["Event 10", "Event 11"]
@@ -1,55 +1,89 @@
 """Tests for TutorAgent - high-level RAG-powered tutoring interface."""
 
-from pathlib import Path
-
 import pytest
 
 from agents.tutor_agent import QuizItem, TutorAgent
 from core.rag_pipeline import RAGPipeline
 
 
-@pytest.fixture
-def test_pdf():
-    """Get path to test PDF fixture."""
-    return Path(__file__).parent / "fixtures" / "calculus_sample.pdf"
+@pytest.fixture(scope="module")
+def tutor_agent(worker_persist_root, fake_embeddings, test_pdf):
+    """TutorAgent with the test PDF ingested once for the module; tests must only query it."""
+    pipeline = RAGPipeline(
+        collection_name="test_tutor",
+        persist_directory=worker_persist_root / "tutor",
+        embeddings=fake_embeddings,
+    )
+    agent = TutorAgent(rag_pipeline=pipeline)
+    agent.ingest_material(test_pdf)
+    return agent
+
+
+@pytest.fixture(scope="module")
+def scratch_tutor_agent(worker_persist_root, fake_embeddings):
+    """TutorAgent reused by every test that ingests or clears; use it through fresh_tutor_agent."""
+    pipeline = RAGPipeline(
+        collection_name="test_tutor_scratch",
+        persist_directory=worker_persist_root / "tutor_scratch",
+        embeddings=fake_embeddings,
+    )
+    return TutorAgent(rag_pipeline=pipeline)
 
 
 @pytest.fixture
-def tutor_agent(tmp_path):
-    """Create a TutorAgent with temporary storage."""
-    pipeline = RAGPipeline(collection_name="test_tutor", persist_directory=tmp_path / "tutor_test")
-    return TutorAgent(rag_pipeline=pipeline)
+def fresh_tutor_agent(scratch_tutor_agent):
+    """Empty TutorAgent for tests that ingest or clear; emptied again afterwards instead of rebuilt."""
+    yield scratch_tutor_agent
+    if scratch_tutor_agent.count_materials():
+        scratch_tutor_agent.clear_materials()
 
 
-def test_ingest_material_success(tutor_agent, test_pdf):
+def test_ingest_material_success(fresh_tutor_agent, test_pdf):
     """Test successful PDF ingestion."""
-    num_chunks = tutor_agent.ingest_material(test_pdf)
+    num_chunks = fresh_tutor_agent.ingest_material(test_pdf)
 
     assert num_chunks > 0
-    assert tutor_agent.count_materials() == num_chunks
+    assert fresh_tutor_agent.count_materials() == num_chunks
 
 
-def test_ingest_material_nonexistent_file(tutor_agent, tmp_path):
+def test_ingest_material_nonexistent_file(fresh_tutor_agent, tmp_path):
     """Test ingesting non-existent file raises error."""
     fake_path = tmp_path / "nonexistent.pdf"
 
     with pytest.raises(FileNotFoundError):
-        tutor_agent.ingest_material(fake_path)
+        fresh_tutor_agent.ingest_material(fake_path)
 
 
-def test_ingest_material_wrong_file_type(tutor_agent, tmp_path):
+def test_ingest_material_wrong_file_type(fresh_tutor_agent, tmp_path):
     """Test ingesting non-PDF file raises error."""
     txt_file = tmp_path / "notes.txt"
     txt_file.write_text("Some notes")
 
     with pytest.raises(ValueError, match="Only PDF files are supported"):
-        tutor_agent.ingest_material(txt_file)
+        fresh_tutor_agent.ingest_material(txt_file)
 
 
-def test_get_context(tutor_agent, test_pdf):
-    """Test retrieving context for a query."""
-    tutor_agent.ingest_material(test_pdf)
+def test_ingest_materials_batches_files(fresh_tutor_agent, test_pdf, test_pdf_bytes, tmp_path):
+    """Test ingesting several PDFs in one call."""
+    second_pdf = tmp_path / "copy.pdf"
+    second_pdf.write_bytes(test_pdf_bytes)
+
+    num_chunks = fresh_tutor_agent.ingest_materials([test_pdf, second_pdf])
+
+    assert num_chunks > 0
+    assert fresh_tutor_agent.count_materials() == num_chunks
+
+
+def test_ingest_materials_validates_before_ingesting(fresh_tutor_agent, test_pdf, tmp_path):
+    """Test a bad path in the batch fails before anything is indexed."""
+    with pytest.raises(FileNotFoundError):
+        fresh_tutor_agent.ingest_materials([test_pdf, tmp_path / "missing.pdf"])
+
+    assert fresh_tutor_agent.count_materials() == 0
 
+
+def test_get_context(tutor_agent):
+    """Test retrieving context for a query."""
     context = tutor_agent.get_context("What is a derivative?", k=3)
 
     assert len(context) <= 3
@@ -60,10 +94,22 @@ def test_get_context(tutor_agent, test_pdf):
     assert "derivative" in all_content
 
 
-def test_get_context_different_k_values(tutor_agent, test_pdf):
-    """Test k parameter controls number of context snippets."""
-    tutor_agent.ingest_material(test_pdf)
+def test_get_contexts_batches_queries(tutor_agent):
+    """Test batched retrieval returns one result list per query."""
+    contexts = tutor_agent.get_contexts(["derivatives", "integrals", "limits"], k=2)
+
+    assert len(contexts) == 3
+    assert all(1 <= len(snippets) <= 2 for snippets in contexts)
+    assert all(isinstance(snippet, str) for snippets in contexts for snippet in snippets)
+
+
+def test_get_contexts_without_materials(fresh_tutor_agent):
+    """Test batched retrieval on an empty knowledge base."""
+    assert fresh_tutor_agent.get_contexts(["derivatives", "integrals"], k=2) == [[], []]
 
+
+def test_get_context_different_k_values(tutor_agent):
+    """Test k parameter controls number of context snippets."""
     context_2 = tutor_agent.get_context("integrals", k=2)
     context_5 = tutor_agent.get_context("integrals", k=5)
 
@@ -71,63 +117,59 @@ def test_get_context_different_k_values(tutor_agent, test_pdf):
     assert len(context_5) <= 5
 
 
-def test_count_materials(tutor_agent, test_pdf):
+def test_count_materials(fresh_tutor_agent, test_pdf):
     """Test counting ingested materials."""
-    assert tutor_agent.count_materials() == 0
+    assert fresh_tutor_agent.count_materials() == 0
 
-    tutor_agent.ingest_material(test_pdf)
+    fresh_tutor_agent.ingest_material(test_pdf)
 
-    assert tutor_agent.count_materials() > 0
+    assert fresh_tutor_agent.count_materials() > 0
 
 
-def test_clear_materials(tutor_agent, test_pdf):
+def test_clear_materials(fresh_tutor_agent, test_pdf):
     """Test clearing all materials."""
-    tutor_agent.ingest_material(test_pdf)
-    assert tutor_agent.count_materials() > 0
+    fresh_tutor_agent.ingest_material(test_pdf)
+    assert fresh_tutor_agent.count_materials() > 0
 
-    tutor_agent.clear_materials()
+    fresh_tutor_agent.clear_materials()
 
-    assert tutor_agent.count_materials() == 0
+    assert fresh_tutor_agent.count_materials() == 0
 
 
-def test_generate_quiz_returns_items(tutor_agent, test_pdf):
+def test_generate_quiz_returns_items(tutor_agent):
     """Test quiz generation (stub implementation)."""
-    tutor_agent.ingest_material(test_pdf)
-
     quiz = tutor_agent.generate_quiz("derivatives")
 
     assert all(isinstance(item, QuizItem) for item in quiz)
     # Stub implementation returns context-aware message
-    assert "context available" in quiz[0].question or "No context found" in quiz[0].question
+    assert "context available" in quiz[0].question
 
 
-def test_generate_quiz_without_materials(tutor_agent):
+def test_generate_quiz_without_materials(fresh_tutor_agent):
     """Test quiz generation without ingested materials."""
-    quiz = tutor_agent.generate_quiz("derivatives")
+    quiz = fresh_tutor_agent.generate_quiz("derivatives")
 
     assert all(isinstance(item, QuizItem) for item in quiz)
     # Without materials, should indicate no context
-    assert "No context found" in quiz[0].question or "context" in quiz[0].question.lower()
+    assert "No context found" in quiz[0].question
 
 
-def test_multiple_material_ingestion(tutor_agent, test_pdf):
+def test_multiple_material_ingestion(fresh_tutor_agent, test_pdf):
     """Test ingesting materials multiple times."""
-    chunks1 = tutor_agent.ingest_material(test_pdf)
-    total_before = tutor_agent.count_materials()
+    chunks1 = fresh_tutor_agent.ingest_material(test_pdf)
+    total_before = fresh_tutor_agent.count_materials()
 
     # Ingest again (same file)
-    chunks2 = tutor_agent.ingest_material(test_pdf)
-    total_after = tutor_agent.count_materials()
+    chunks2 = fresh_tutor_agent.ingest_material(test_pdf)
+    total_after = fresh_tutor_agent.count_materials()
 
     # Should accumulate
     assert total_after == total_before + chunks2
     assert chunks1 == chunks2  # Same file produces same chunks
 
 
-def test_context_relevance(tutor_agent, test_pdf):
+def test_context_relevance(tutor_agent):
     """Test that context retrieval returns relevant content for specific topics."""
-    tutor_agent.ingest_material(test_pdf)
-
     # Query about derivatives
     derivative_context = tutor_agent.get_context("derivative rate of change", k=2)
     derivative_text = " ".join(derivative_context).lower()
@@ -0,0 +1,67 @@
+"""Tests for the tutor chat interface's slash commands."""
+
+from __future__ import annotations
+
+import pytest
+
+from agents.tutor_chatbot import ChatInterface
+
+
+class StubChatbot:
+    def __init__(self) -> None:
+        self.ingested = []
+
+    def ingest_material(self, path):
+        self.ingested.append(path)
+        return f"Loaded {path.name}"
+
+    def get_materials_count(self) -> int:
+        return 7
+
+    def clear_conversation(self) -> str:
+        return "Conversation cleared"
+
+
+@pytest.fixture
+def interface() -> ChatInterface:
+    return ChatInterface(chatbot=StubChatbot())
+
+
+@pytest.mark.parametrize("command", ["/quit", "/EXIT"])
+def test_quit_commands_stop_the_loop(interface, command, capsys) -> None:
+    assert interface._handle_command(command) is False
+    assert "Goodbye" in capsys.readouterr().out
+
+
+def test_commands_dispatch_with_arguments(interface, capsys) -> None:
+    assert interface._handle_command("/Ingest   notes/calculus.pdf ") is True
+    assert interface._handle_command("/count") is True
+    assert interface._handle_command("/clear") is True
+
+    out = capsys.readouterr().out
+    assert [path.as_posix() for path in interface.chatbot.ingested] == ["notes/calculus.pdf"]
+    assert "✓ Loaded calculus.pdf" in out
+    assert "📊 Knowledge base: 7 document chunks" in out
+    assert "🧹 Conversation cleared" in out
+
+
+def test_ingest_without_path_and_unknown_command(interface, capsys) -> None:
+    interface._handle_command("/ingest")
+    interface._handle_command("/dance")
+
+    out = capsys.readouterr().out
+    assert "Usage: /ingest <path_to_pdf>" in out
+    assert "Unknown command: /dance" in out
+    assert interface.chatbot.ingested == []
+
+
+def test_ingest_reports_missing_file(interface, monkeypatch, capsys) -> None:
+    def missing(path):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(interface.chatbot, "ingest_material", missing)
+    interface._handle_command("/ingest notes/missing.pdf")
+
+    out = capsys.readouterr().out
+    assert "❌ File not found: notes/missing.pdf" in out
+    assert "✓" not in out
@@ -2,20 +2,43 @@
 
 from __future__ import annotations
 
-from agents.user_profile import UserProfile, UserProfileStore, UserProgressEvent
+from pathlib import Path
 
+import pytest
 
-def test_register_event_keeps_recent_entries_only(tmp_path) -> None:
+from agents.user_profile import PROGRESS_LOG_LIMIT, UserProfile, UserProfileStore, UserProgressEvent
+
+
+@pytest.mark.parametrize("bulk", [True, False], ids=["register_events", "register_event"])
+def test_register_event_keeps_recent_entries_only(bulk: bool) -> None:
     profile = UserProfile(user_id="rom", name="Rom")
+    events = [UserProgressEvent(category="win", summary=f"event-{idx}") for idx in range(60)]
 
-    for idx in range(60):
-        profile.register_event(UserProgressEvent(category="win", summary=f"event-{idx}"))
+    if bulk:
+        profile.register_events(events)
+    else:
+        for event in events:
+            profile.register_event(event)
 
-    assert len(profile.progress_log) == 50
+    assert len(profile.progress_log) == PROGRESS_LOG_LIMIT == 50
     assert profile.progress_log[0].summary == "event-10"
     assert profile.progress_log[-1].summary == "event-59"
 
 
+def test_list_fields_drop_duplicates_in_order() -> None:
+    profile = UserProfile(
+        user_id="rom",
+        name="Rom",
+        study_topics=["Python", "AI", "Python"],
+        goals=["Pass exams", "Pass exams"],
+        traits=["procrastination", "burnout", "procrastination"],
+    )
+
+    assert profile.study_topics == ["Python", "AI"]
+    assert profile.goals == ["Pass exams"]
+    assert profile.traits == ["procrastination", "burnout"]
+
+
 def test_profile_store_roundtrip(tmp_path) -> None:
     store = UserProfileStore(tmp_path)
     profile = UserProfile(
@@ -31,3 +54,52 @@ def test_profile_store_roundtrip(tmp_path) -> None:
     assert loaded.user_id == "learner"
     assert loaded.primary_persona == "Kobe Bryant"
     assert loaded.study_topics == ["Neural Networks"]
+
+
+def test_profile_store_load_reuses_parsed_profile(tmp_path, monkeypatch) -> None:
+    store = UserProfileStore(tmp_path)
+    store.save(UserProfile(user_id="learner", name="Learner"))
+
+    first = store.load("learner")
+    first.name = "Changed locally"
+
+    calls = []
+    original = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: calls.append(self) or original(self))
+
+    assert UserProfileStore(tmp_path).load("learner").name == "Learner"
+    assert calls == []
+
+    store.save(UserProfile(user_id="learner", name="Renamed"))
+    calls.clear()  # save() reads the old file to compare
+    assert store.load("learner").name == "Renamed"
+    assert len(calls) == 1
+
+
+def test_profile_store_save_skips_unchanged_profile(tmp_path, monkeypatch) -> None:
+    store = UserProfileStore(tmp_path)
+    profile = UserProfile(user_id="learner", name="Learner", traits=["procrastination"])
+    store.save(profile)
+
+    writes = []
+    original = Path.write_bytes
+    monkeypatch.setattr(Path, "write_bytes", lambda self, data: writes.append(self) or original(self, data))
+
+    store.save(profile.model_copy(deep=True))
+    assert writes == []
+
+    store.save(profile.model_copy(update={"name": "Renamed"}))
+    assert len(writes) == 1
+    assert store.load("learner").name == "Renamed"
+
+
+def test_get_personas_deduplicates_case_insensitively() -> None:
+    profile = UserProfile(
+        user_id="learner",
+        name="Learner",
+        primary_persona="Kobe Bryant",
+        preferred_personas=[" kobe bryant", "Serena Williams", "", "SERENA WILLIAMS"],
+    )
+
+    assert profile.get_personas() == ["Kobe Bryant", "Serena Williams"]
+    assert UserProfile(user_id="learner", name="Learner", primary_persona="").get_personas() == ["default"]
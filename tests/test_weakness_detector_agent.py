@@ -0,0 +1,15 @@
+"""Tests for the LLM weakness detector agent."""
+
+from __future__ import annotations
+
+from agents.weakness_detector_agent import WeaknessDetectorAgent
+
+
+def test_get_shares_one_detector_per_model() -> None:
+    WeaknessDetectorAgent.get.cache_clear()
+
+    detector = WeaknessDetectorAgent.get("gpt-4o-mini")
+
+    assert WeaknessDetectorAgent.get("gpt-4o-mini") is detector
+    assert WeaknessDetectorAgent.get("gpt-4o").model == "gpt-4o"
+    assert detector.model == "gpt-4o-mini"
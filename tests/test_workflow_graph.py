@@ -0,0 +1,38 @@
+"""Tests for the workflow graph run helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+from core import workflow_graph
+
+
+class OverlapGraph:
+    """Records how many runs are in flight at once."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def ainvoke(self, state, config):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return {**state, "thread_id": config["configurable"]["thread_id"]}
+
+
+def test_arun_workflow_runs_sessions_concurrently(monkeypatch) -> None:
+    graph = OverlapGraph()
+    monkeypatch.setattr(workflow_graph, "create_study_pal_graph", lambda: graph)
+
+    async def run_all():
+        return await asyncio.gather(
+            *(workflow_graph.arun_workflow(f"message {i}", session_id=f"session-{i}") for i in range(4))
+        )
+
+    results = asyncio.run(run_all())
+
+    assert [result["thread_id"] for result in results] == [f"session-{i}" for i in range(4)]
+    assert results[0]["messages"][0].content == "message 0"
+    assert graph.peak == 4
@@ -0,0 +1,206 @@
+"""Tests for the LangGraph workflow nodes."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from agents import scheduler_agent
+from core import google_calendar, rag_pipeline, workflow_nodes
+
+
+@pytest.fixture(autouse=True)
+def empty_intent_cache():
+    workflow_nodes.INTENT_CACHE.clear()
+    yield
+    workflow_nodes.INTENT_CACHE.clear()
+
+
+class RecordingPipeline:
+    def __init__(self) -> None:
+        self.queries: list[tuple[str, int]] = []
+
+    def run_query(self, query: str, k: int = 5) -> list[str]:
+        self.queries.append((query, k))
+        return ["chunk"]
+
+
+class InlineExecutor:
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def test_intent_router_prefetches_tutor_context(monkeypatch) -> None:
+    pipeline = RecordingPipeline()
+    monkeypatch.setattr(rag_pipeline, "get_rag_pipeline", lambda user_id="default_user": pipeline)
+    monkeypatch.setattr(workflow_nodes, "classify_intent_with_llm", lambda *args: "tutor")
+
+    state = {"messages": [HumanMessage(content="  What is a derivative? ")], "user_id": "alice"}
+    updates = workflow_nodes.intent_router_node(state)
+
+    assert updates["next_agent"] == "tutor"
+    assert pipeline.queries == [("What is a derivative?", workflow_nodes.TUTOR_CONTEXT_K)]
+
+
+@pytest.mark.parametrize(
+    ("message", "extra_state", "intent"),
+    [
+        ("Schedule a study session for tomorrow", {}, "scheduler"),
+        ("I need some motivation", {}, "motivator"),
+        ("yes", {"awaiting_schedule_confirmation": True}, "scheduler"),
+    ],
+)
+def test_intent_router_skips_prefetch_on_non_tutor_turns(monkeypatch, message, extra_state, intent) -> None:
+    pipeline = RecordingPipeline()
+    monkeypatch.setattr(rag_pipeline, "get_rag_pipeline", lambda user_id="default_user": pipeline)
+    monkeypatch.setattr(workflow_nodes, "classify_intent_with_llm", lambda *args: intent)
+    # Run background work inline so a stray prefetch would be recorded before the asserts
+    monkeypatch.setattr(workflow_nodes, "_BACKGROUND_POOL", InlineExecutor())
+
+    state = {"messages": [HumanMessage(content=message)], "user_id": "alice", **extra_state}
+    updates = workflow_nodes.intent_router_node(state)
+
+    assert updates["next_agent"] == intent
+    assert pipeline.queries == []
+
+
+def test_scheduler_confirmation_syncs_calendar_in_background(monkeypatch) -> None:
+    release = threading.Event()
+    done = threading.Event()
+    synced = []
+
+    class SlowScheduler:
+        def __init__(self, calendar_connector=None) -> None:
+            pass
+
+        def sync_schedule(self, schedule: dict) -> None:
+            release.wait(timeout=5)
+            synced.append(schedule)
+            done.set()
+
+    monkeypatch.setattr(scheduler_agent, "SchedulerAgent", SlowScheduler)
+    monkeypatch.setattr(google_calendar, "GoogleCalendarClient", lambda: None)
+
+    schedule = {"sessions": []}
+    state = {"messages": [HumanMessage(content="yes please")], "user_id": "alice", "generated_schedule": schedule}
+    updates = workflow_nodes.scheduler_agent_node(state)
+
+    assert "syncing your study schedule" in updates["messages"][0].content
+    assert synced == []
+
+    release.set()
+    assert done.wait(timeout=5)
+    assert synced == [schedule]
+
+
+def test_classify_intents_with_llm_batches_requests(monkeypatch) -> None:
+    calls = []
+    prompts = []
+
+    class BatchingClassifier:
+        def batch(self, inputs, config=None):
+            calls.append((len(inputs), config))
+            prompts.extend(inputs)
+            replies = {"make a quiz": "tutor", "add to my calendar": " Scheduler\n", "I'm done": "farewell"}
+            messages = [prompt[-1].content.split('CURRENT MESSAGE: "')[1].split('"')[0] for prompt in inputs]
+            return [AIMessage(content=replies[message]) for message in messages]
+
+    monkeypatch.setattr(workflow_nodes, "_get_intent_classifier", lambda api_key=None: BatchingClassifier())
+
+    intents = workflow_nodes.classify_intents_with_llm(["make a quiz", "add to my calendar", "I'm done"])
+
+    assert intents == ["tutor", "scheduler", "tutor"]
+    assert calls == [(3, {"max_concurrency": 20})]
+    assert {prompt[0].content for prompt in prompts} == {workflow_nodes.INTENT_SYSTEM_PROMPT}
+
+    # Repeated prompts come from the cache without another request
+    intents = workflow_nodes.classify_intents_with_llm(["I'm done", "make a quiz", "add to my calendar"])
+    assert intents == ["tutor", "tutor", "scheduler"]
+    assert calls[1:] == []
+
+
+class BulkClassifier:
+    def __init__(self, reply: str) -> None:
+        self.reply = reply
+        self.requests = []
+
+    def bind(self, **kwargs):
+        assert kwargs == {"response_format": {"type": "json_object"}}
+        return self
+
+    def invoke(self, messages):
+        self.requests.append(messages)
+        return AIMessage(content=self.reply)
+
+
+def test_classify_intents_bulk_uses_one_request(monkeypatch) -> None:
+    classifier = BulkClassifier('{"intents": ["Tutor", "scheduler", "nonsense"]}')
+    monkeypatch.setattr(workflow_nodes, "_get_intent_classifier", lambda api_key=None: classifier)
+
+    intents = workflow_nodes.classify_intents_bulk(["make a quiz", "add to my calendar", "hmm"])
+
+    assert intents == ["tutor", "scheduler", "tutor"]
+    assert len(classifier.requests) == 1
+    assert classifier.requests[0][0].content == workflow_nodes.INTENT_SYSTEM_PROMPT
+    assert '["make a quiz", "add to my calendar", "hmm"]' in classifier.requests[0][-1].content
+
+
+@pytest.mark.parametrize("reply", ['{"intents": ["tutor"]}', "not json"])
+def test_classify_intents_bulk_falls_back_on_bad_reply(monkeypatch, reply) -> None:
+    monkeypatch.setattr(workflow_nodes, "_get_intent_classifier", lambda api_key=None: BulkClassifier(reply))
+    monkeypatch.setattr(
+        workflow_nodes, "classify_intents_with_llm", lambda messages, history, user_id: ["motivator"] * len(messages)
+    )
+
+    assert workflow_nodes.classify_intents_bulk(["cheer me up", "again"]) == ["motivator", "motivator"]
+
+
+@pytest.mark.parametrize(
+    ("message", "intent"),
+    [
+        ("I need some motivation", "motivator"),
+        ("Give me a pep talk!", "motivator"),
+        ("Schedule a study session for tomorrow", "scheduler"),
+        ("can you set up pomodoros", "scheduler"),
+        ("What are my weak points?", "analyzer"),
+        ("What is motivation in psychology?", None),
+        ("What is a derivative?", None),
+        ("Motivate me and then schedule a study session", None),
+    ],
+)
+def test_fast_route(message, intent) -> None:
+    assert workflow_nodes.fast_route(message) == intent
+
+
+def test_classify_intents_asks_llm_despite_keywords(monkeypatch) -> None:
+    class EchoClassifier:
+        def batch(self, inputs, config=None):
+            return [AIMessage(content="tutor") for _ in inputs]
+
+    monkeypatch.setattr(workflow_nodes, "_get_intent_classifier", lambda api_key=None: EchoClassifier())
+    history = [HumanMessage(content="Let's study history"), AIMessage(content="Sure, ask away!")]
+    messages = ["Explain the weak points of the Treaty of Versailles", "What is a study plan in research?"]
+
+    assert workflow_nodes.classify_intents_with_llm(messages, history) == ["tutor", "tutor"]
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "Explain the weak points of the Treaty of Versailles",
+        "What is a study plan in research?",
+        "I need motivation theory explained",
+    ],
+)
+def test_classify_intent_asks_llm_despite_keywords(monkeypatch, message) -> None:
+    classifier = BulkClassifier("tutor")
+    monkeypatch.setattr(workflow_nodes, "_get_intent_classifier", lambda api_key=None: classifier)
+    history = [HumanMessage(content="Let's study history"), AIMessage(content="Sure, ask away!")]
+
+    assert workflow_nodes.classify_intent_with_llm(message, history) == "tutor"
+    assert len(classifier.requests) == 1